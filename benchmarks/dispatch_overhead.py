@@ -0,0 +1,272 @@
+"""
+Measure the per-call overhead of parallel_for/parallel_reduce/
+parallel_scan on empty and tiny ranges, for each policy and for
+standalone workunits, functors and workloads. Each configuration
+(default, PK_FUSION, PK_RESTRICT) runs in a fresh interpreter since
+they are read when the runtime is created.
+
+For standalone workunits, the uncached dispatch path is also broken
+down into type inference, module lookup, argument marshalling and the
+native call. Results are written as JSON and can be compared against a
+stored baseline:
+
+    python dispatch_overhead.py -o baseline.json
+    python dispatch_overhead.py -b baseline.json --tolerance 1.2
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+import pykokkos as pk
+
+
+CONFIGURATIONS: Dict[str, Dict[str, str]] = {
+    "default": {},
+    "fusion": {"PK_FUSION": "all"},
+    "restrict": {"PK_RESTRICT": "1"},
+}
+
+TINY: int = 8
+
+
+@pk.workunit
+def range_for(i: int, view: pk.View1D[pk.double]):
+    view[i] += 1.0
+
+
+@pk.workunit
+def range_reduce(i: int, acc: pk.Acc[pk.double], view: pk.View1D[pk.double]):
+    acc += view[i]
+
+
+@pk.workunit
+def range_scan(i: int, acc: pk.Acc[pk.double], last_pass: bool, view: pk.View1D[pk.double]):
+    acc += view[i]
+    if last_pass:
+        view[i] = acc
+
+
+@pk.workunit
+def mdrange_for(i: int, j: int, view: pk.View2D[pk.double]):
+    view[i][j] += 1.0
+
+
+@pk.workunit
+def team_for(team_member: pk.TeamMember, view: pk.View1D[pk.double]):
+    j: int = team_member.league_rank()
+    view[j] += 1.0
+
+
+@pk.functor
+class OverheadFunctor:
+    def __init__(self, view: pk.View1D[pk.double]):
+        self.view: pk.View1D[pk.double] = view
+
+    @pk.workunit
+    def range_for(self, i: int):
+        self.view[i] += 1.0
+
+
+@pk.workload
+class OverheadWorkload:
+    def __init__(self, threads: int, view: pk.View1D[pk.double]):
+        self.threads: int = threads
+        self.view: pk.View1D[pk.double] = view
+
+    @pk.main
+    def run(self):
+        pk.parallel_for(self.threads, self.range_for)
+
+    @pk.workunit
+    def range_for(self, i: int):
+        self.view[i] += 1.0
+
+
+def time_call(call: Callable[[], Any], repeats: int) -> float:
+    """
+    Time a call after warming it up
+
+    :param call: the function to time
+    :param repeats: the number of timed calls
+    :returns: the median time per call in microseconds
+    """
+
+    # The first calls compile and fill the caches
+    for _ in range(3):
+        call()
+
+    times: List[float] = []
+    for _ in range(repeats):
+        start: float = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - start)
+
+    return statistics.median(times) * 1e6
+
+
+def get_cases(threads: int) -> Dict[str, Callable[[], Any]]:
+    """
+    Get the dispatches to time for a number of threads
+
+    :param threads: the size of the range
+    :returns: a dict mapping from case name to dispatch
+    """
+
+    fusion: bool = "PK_FUSION" in os.environ
+    view: pk.View1D[pk.double] = pk.View([max(threads, 1)], pk.double)
+    view2d: pk.View2D[pk.double] = pk.View([max(threads, 1), max(threads, 1)], pk.double)
+    functor = OverheadFunctor(view)
+    workload = OverheadWorkload(threads, view)
+
+    def dispatch(call: Callable[[], Any]) -> Callable[[], Any]:
+        # traced operations only run when flushed
+        if fusion:
+            return lambda: (call(), pk.flush())
+        return call
+
+    return {
+        "range_for": dispatch(lambda: pk.parallel_for(threads, range_for, view=view)),
+        "range_reduce": dispatch(lambda: pk.parallel_reduce(threads, range_reduce, view=view)),
+        "range_scan": dispatch(lambda: pk.parallel_scan(threads, range_scan, view=view)),
+        "mdrange_for": dispatch(lambda: pk.parallel_for(pk.MDRangePolicy([0, 0], [threads, threads]), mdrange_for, view=view2d)),
+        "team_for": dispatch(lambda: pk.parallel_for(pk.TeamPolicy(threads, 1), team_for, view=view)),
+        "functor_for": dispatch(lambda: pk.parallel_for(threads, functor.range_for)),
+        "workload_for": lambda: pk.execute(pk.ExecutionSpace.Default, workload),
+    }
+
+
+def get_phases(threads: int, repeats: int) -> Dict[str, float]:
+    """
+    Time each step of an uncached parallel_for of a standalone workunit
+
+    :param threads: the size of the range
+    :param repeats: the number of timed calls
+    :returns: a dict mapping from phase to median time in microseconds
+    """
+
+    from pykokkos.core.module_setup import get_metadata
+    from pykokkos.core.optimizations import get_restrict_views
+    from pykokkos.core.type_inference import get_type_info
+
+    runtime = pk.runtime_singleton.runtime
+    view: pk.View1D[pk.double] = pk.View([max(threads, 1)], pk.double)
+    kwargs: Dict[str, Any] = {"view": view}
+    policy = pk.RangePolicy(pk.ExecutionSpace.Default, 0, threads)
+    pk.parallel_for(policy, range_for, **kwargs)
+
+    space = policy.space.space
+    parser = runtime.compiler.get_parser(get_metadata(range_for).path)
+    updated_types, updated_decorator, types_signature = get_type_info("for", parser, policy, range_for, kwargs)
+    restrict_views, restrict_signature = set(), None
+    if "PK_RESTRICT" in os.environ:
+        restrict_views, restrict_signature = get_restrict_views(kwargs)
+
+    members, module_setup = runtime.prepare_workunit(policy, range_for, "for", parser, False, **kwargs)
+    module = runtime.import_module(module_setup.name, module_setup.path)
+    args: Dict[str, Any] = runtime.get_arguments(range_for, members, space, policy, "for", **kwargs)
+    args["pk_kernel_name"] = ""
+    wrapper = runtime.get_wrapper(range_for, members, args, module)
+
+    def lookup():
+        runtime.precompile_workunit(range_for, space, updated_decorator, updated_types, types_signature,
+                                    restrict_views, restrict_signature, **kwargs)
+        setup = runtime.get_module_setup(range_for, space, types_signature, restrict_signature)
+        runtime.import_module(setup.name, setup.path)
+
+    return {
+        "type_inference": time_call(lambda: get_type_info("for", parser, policy, range_for, kwargs), repeats),
+        "module_lookup": time_call(lookup, repeats),
+        "marshalling": time_call(lambda: runtime.get_arguments(range_for, members, space, policy, "for", **kwargs), repeats),
+        "native_call": time_call(lambda: wrapper(**args), repeats),
+    }
+
+
+def run_configuration(repeats: int) -> Dict[str, Any]:
+    """
+    Time all cases in the current process
+
+    :param repeats: the number of timed calls per case
+    :returns: the results for this configuration
+    """
+
+    results: Dict[str, Any] = {}
+    for size, threads in (("empty", 0), ("tiny", TINY)):
+        results[size] = {name: time_call(call, repeats) for name, call in get_cases(threads).items()}
+        if "PK_FUSION" not in os.environ:
+            results[size]["phases"] = get_phases(threads, repeats)
+
+    return results
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float, path: str = "") -> List[str]:
+    """
+    Compare results against a baseline
+
+    :param results: the new results
+    :param baseline: the stored results
+    :param tolerance: the allowed ratio between new and stored times
+    :param path: the location of the results being compared
+    :returns: a list of descriptions of regressions
+    """
+
+    regressions: List[str] = []
+    for key, value in results.items():
+        name: str = f"{path}/{key}" if path else key
+        if key not in baseline:
+            continue
+
+        if isinstance(value, dict):
+            regressions.extend(compare(value, baseline[key], tolerance, name))
+            continue
+
+        ratio: float = value / baseline[key] if baseline[key] > 0 else 1.0
+        marker: str = " REGRESSION" if ratio > tolerance else ""
+        print(f"{name:45} {baseline[key]:10.1f}us -> {value:10.1f}us ({ratio:.2f}x){marker}")
+        if ratio > tolerance:
+            regressions.append(name)
+
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-r", "--repeats", type=int, default=1000)
+    parser.add_argument("-c", "--configurations", nargs="+", default=list(CONFIGURATIONS), choices=list(CONFIGURATIONS))
+    parser.add_argument("-o", "--output", type=str, default=None, help="write the results as JSON to this file")
+    parser.add_argument("-b", "--baseline", type=str, default=None, help="compare against results stored in this file")
+    parser.add_argument("--tolerance", type=float, default=1.2,
+                        help="fail if any time exceeds the baseline by more than this ratio")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_configuration(args.repeats)))
+        sys.exit(0)
+
+    results: Dict[str, Any] = {}
+    for configuration in args.configurations:
+        env: Dict[str, str] = {**os.environ, **CONFIGURATIONS[configuration]}
+        child = subprocess.run([sys.executable, __file__, "--child", "-r", str(args.repeats)],
+                               env=env, capture_output=True, text=True, check=True)
+        results[configuration] = json.loads(child.stdout.strip().splitlines()[-1])
+
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.baseline is not None:
+        with open(args.baseline, "r") as f:
+            baseline: Dict[str, Any] = json.load(f)
+
+        regressions: List[str] = compare(results, baseline, args.tolerance)
+        if len(regressions) > 0:
+            print(f"{len(regressions)} regressions over {args.tolerance}x the baseline")
+            sys.exit(1)
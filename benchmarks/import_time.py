@@ -0,0 +1,54 @@
+"""
+Measure the time taken by `import pykokkos` in a fresh interpreter,
+and check that the array library, the runtime and Kokkos itself are
+not loaded until first use
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+
+CHECK_LAZY = """
+import sys
+import pykokkos
+import pykokkos.kokkos_manager as km
+eager = [m for m in ("pykokkos.lib.ufuncs", "pykokkos.core") if m in sys.modules]
+if km.CONSTANTS["IS_INITIALIZED"]:
+    eager.append("Kokkos::initialize()")
+print(",".join(eager))
+"""
+
+
+def time_import(repeats: int) -> list:
+    times = []
+    for _ in range(repeats):
+        # -X importtime reports the cumulative time of each import on stderr
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import pykokkos"],
+                                capture_output=True, text=True, check=True)
+        for line in result.stderr.splitlines():
+            fields = [f.strip() for f in line.split("|")]
+            if len(fields) == 3 and fields[2] == "pykokkos":
+                times.append(int(fields[1]) / 1e6)
+    return times
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-r", "--repeats", type=int, default=10)
+    parser.add_argument("-t", "--target", type=float, default=None,
+                        help="fail if the median import time in seconds exceeds this")
+    args = parser.parse_args()
+
+    times = time_import(args.repeats)
+    median = statistics.median(times)
+    print(f"import pykokkos: median {median:.3f}s, min {min(times):.3f}s, max {max(times):.3f}s over {len(times)} runs")
+
+    eager = subprocess.run([sys.executable, "-c", CHECK_LAZY], capture_output=True, text=True, check=True).stdout.strip()
+    if eager:
+        print(f"loaded eagerly: {eager}")
+
+    if args.target is not None and median > args.target:
+        print(f"median import time {median:.3f}s exceeds the target of {args.target:.3f}s")
+        sys.exit(1)
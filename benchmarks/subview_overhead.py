@@ -0,0 +1,85 @@
+"""
+Measure the cost of slicing views on the host: constructing a Subview,
+the first kernel launch that creates its Kokkos view, and NumPy slicing
+of the same data for reference.
+
+    python subview_overhead.py -r 100000 -t 5.0
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+import pykokkos as pk
+
+
+@pk.workunit
+def subview_fill(i: int, view: pk.View1D[pk.double], value: float):
+    view[i] = value
+
+
+def time_call(call: Callable[[], Any], repeats: int) -> float:
+    """
+    Time a call, in microseconds per call
+
+    :param call: the function to time
+    :param repeats: the number of calls
+    :returns: the median over 5 rounds
+    """
+
+    rounds: List[float] = []
+    for _ in range(5):
+        start: float = time.perf_counter()
+        for _ in range(repeats):
+            call()
+        rounds.append((time.perf_counter() - start) / repeats * 1e6)
+
+    return statistics.median(rounds)
+
+
+def get_cases(rows: int, cols: int) -> Dict[str, Callable[[], Any]]:
+    view: pk.View2D[pk.double] = pk.View([rows, cols], pk.double)
+    array: np.ndarray = np.zeros((rows, cols))
+    row: pk.View1D[pk.double] = pk.View([cols], pk.double)
+
+    def first_launch():
+        # a new subview each time, so the Kokkos view is created each time
+        pk.parallel_for(cols // 2, subview_fill, view=row[:cols // 2], value=1.0)
+
+    # compile before timing
+    first_launch()
+
+    return {
+        "numpy row": lambda: array[1, :],
+        "subview row": lambda: view[1, :],
+        "subview strided": lambda: view[1, ::2],
+        "subview block": lambda: view[1:rows - 1, 1:cols - 1],
+        "subview launch": first_launch,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-r", "--repeats", type=int, default=100000)
+    parser.add_argument("--rows", type=int, default=64)
+    parser.add_argument("--cols", type=int, default=64)
+    parser.add_argument("-t", "--target", type=float, default=None,
+                        help="fail if constructing a subview takes more microseconds than this")
+    args = parser.parse_args()
+
+    failed: List[str] = []
+    for name, call in get_cases(args.rows, args.cols).items():
+        repeats: int = args.repeats if "launch" not in name else max(args.repeats // 100, 1)
+        duration: float = time_call(call, repeats)
+        print(f"{name}: {duration:.2f}us")
+
+        if args.target is not None and "launch" not in name and name.startswith("subview") and duration > args.target:
+            failed.append(name)
+
+    if len(failed) != 0:
+        print(f"over the target of {args.target:.2f}us: {', '.join(failed)}")
+        sys.exit(1)
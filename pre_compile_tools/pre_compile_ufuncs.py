@@ -76,13 +76,11 @@ def main():
 
 
 def test_main():
-    # force pytest to run main() and produce a pk_cpp
-    # directory structure that is useful for saving time
-    # with the array API suite invoked by pytest
-
-    # TODO: we shouldn't need to do this long-term; the pk_cpp
-    # compilation directory structure shouldn't exclude reuse
-    # by other modules
+    # force pytest to run main() and populate the kernel
+    # cache, which is useful for saving time with the
+    # array API suite invoked by pytest; compiled ufuncs
+    # are reused by any module that generates the same
+    # C++ source
     main()
 
 
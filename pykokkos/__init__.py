@@ -1,8 +1,8 @@
 import atexit
-from typing import Optional
+import importlib
+from typing import Any, Dict, List, Optional
 
 from pykokkos.runtime import runtime_singleton
-from pykokkos.core import Runtime
 from pykokkos.interface import *
 from pykokkos.kokkos_manager import (
     initialize, finalize,
@@ -12,78 +12,66 @@ from pykokkos.kokkos_manager import (
     set_device_id
 )
 
-from pykokkos.lib.ufuncs import (reciprocal,
-                                 log,
-                                 log2,
-                                 log10,
-                                 log1p,
-                                 sqrt,
-                                 sign,
-                                 add,
-                                 copyto,
-                                 subtract,
-                                 dot,
-                                 multiply,
-                                 matmul,
-                                 np_matmul,
-                                 divide,
-                                 negative,
-                                 positive,
-                                 power,
-                                 fmod,
-                                 square,
-                                 greater,
-                                 logaddexp,
-                                 true_divide,
-                                 logaddexp2,
-                                 floor_divide,
-                                 sin,
-                                 cos,
-                                 tan,
-                                 tanh,
-                                 logical_and,
-                                 logical_or,
-                                 logical_xor,
-                                 logical_not,
-                                 fmax,
-                                 fmin,
-                                 exp,
-                                 exp2,
-                                 argmax,
-                                 unique,
-                                 var,
-                                 in1d,
-                                 mean,
-                                 hstack,
-                                 transpose,
-                                 index,
-                                 isinf,
-                                 isnan,
-                                 equal,
-                                 isfinite,
-                                 round,
-                                 trunc,
-                                 ceil,
-                                 floor,
-                                 broadcast_view)
-from pykokkos.lib.info import iinfo, finfo
-from pykokkos.lib.create import (zeros,
-                                 zeros_like,
-                                 ones,
-                                 ones_like,
-                                 full,
-                                 full_like)
-from pykokkos.lib.manipulate import reshape, ravel, expand_dims
-from pykokkos.lib.util import all, any, sum, find_max, searchsorted, col, linspace, logspace
 from pykokkos.lib.constants import e, pi, inf, nan
+from pykokkos.interface.memory_pool import memory_pool
 from pykokkos.interface.views import astype
 
+# The array library and the runtime are only imported when first
+# accessed (PEP 562) so that importing pykokkos stays fast
+_lazy_modules: Dict[str, List[str]] = {
+    "pykokkos.lib.ufuncs": [
+        "reciprocal", "log", "log2", "log10", "log1p", "sqrt", "sign", "add",
+        "copyto", "subtract", "dot", "multiply", "matmul", "np_matmul",
+        "divide", "negative", "positive", "power", "fmod", "square", "greater",
+        "logaddexp", "true_divide", "logaddexp2", "floor_divide", "sin", "cos",
+        "tan", "tanh", "logical_and", "logical_or", "logical_xor",
+        "logical_not", "fmax", "fmin", "exp", "exp2", "argmax", "unique",
+        "var", "in1d", "mean", "hstack", "transpose", "index", "isinf",
+        "isnan", "equal", "isfinite", "round", "trunc", "ceil", "floor",
+        "broadcast_view",
+    ],
+    "pykokkos.lib.info": ["iinfo", "finfo"],
+    "pykokkos.lib.create": [
+        "empty", "empty_like", "zeros", "zeros_like", "ones", "ones_like",
+        "full", "full_like",
+    ],
+    "pykokkos.lib.manipulate": ["reshape", "ravel", "expand_dims"],
+    "pykokkos.lib.util": [
+        "all", "any", "sum", "find_max", "searchsorted", "col", "linspace",
+        "logspace",
+    ],
+    "pykokkos.core": ["Runtime"],
+}
+
+_lazy_attributes: Dict[str, str] = {
+    name: module for module, names in _lazy_modules.items() for name in names
+}
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a lazily loaded attribute on first access
+
+    :param name: the name of the attribute
+    :returns: the attribute
+    """
+
+    module: Optional[str] = _lazy_attributes.get(name)
+    if module is None:
+        raise AttributeError(f"module 'pykokkos' has no attribute '{name}'")
+
+    value: Any = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+
+    return value
+
+def __dir__() -> List[str]:
+    return sorted(set(globals().keys()) | set(_lazy_attributes.keys()))
+
+
 __array_api_version__ = "2021.12"
 
 __all__ = ["__array_api_version__"]
 
-runtime_singleton.runtime = Runtime()
-
 def cleanup():
     """
     Delete the runtime instance to avoid Kokkos errors caused by
@@ -91,12 +79,16 @@ def cleanup():
     """
 
     global runtime_singleton
+    runtime = runtime_singleton._runtime
+    if runtime is not None and runtime.async_executor is not None:
+        runtime.async_executor.shutdown(wait=True)
+
+    # deallocate the arrays held by the memory pool before finalize()
+    memory_pool.set_limit(0)
+
     del runtime_singleton.runtime
     del runtime_singleton
 
-    from pykokkos.interface.parallel_dispatch import workunit_cache
-    workunit_cache.clear()
-
 # Will be called in reverse order of registration (cleanup then finalize)
 atexit.register(finalize)
 atexit.register(cleanup)
@@ -1,3 +1,4 @@
+from .build_driver import CompilationError
 from .compiler import CompilationDefaults, Compiler
 from .keywords import Keywords
 from .runtime import Runtime
@@ -0,0 +1,280 @@
+from functools import lru_cache
+import os
+from pathlib import Path
+import re
+import shutil
+import subprocess
+import sysconfig
+import threading
+from typing import Dict, List, Optional
+
+
+class CompilationError(Exception):
+    """
+    Raised when the C++ compiler fails to build a module
+    """
+
+    def __init__(self, output_dir: Path, command: List[str], returncode: int, diagnostics: str):
+        """
+        CompilationError constructor
+
+        :param output_dir: the directory the module was being built in
+        :param command: the compiler command that failed
+        :param returncode: the exit code of the compiler
+        :param diagnostics: the compiler output
+        """
+
+        self.output_dir: Path = output_dir
+        self.command: List[str] = command
+        self.returncode: int = returncode
+        self.diagnostics: str = diagnostics
+
+        super().__init__(f"C++ compilation in {output_dir} failed with exit code {returncode}\n{diagnostics}")
+
+
+@lru_cache(maxsize=None)
+def get_python_includes() -> List[str]:
+    """
+    Get the include flags for Python and pybind11, equivalent to
+    `python3 -m pybind11 --includes`
+
+    :returns: the list of -I flags
+    """
+
+    import pybind11
+
+    paths: List[str] = [sysconfig.get_paths()["include"], sysconfig.get_paths()["platinclude"], pybind11.get_include()]
+    unique: List[str] = list(dict.fromkeys(paths))
+
+    return [f"-I{p}" for p in unique]
+
+
+@lru_cache(maxsize=None)
+def get_cxx_standard(include_path: str) -> str:
+    """
+    Get the C++ standard Kokkos was built with from KokkosCore_config.h
+
+    :param include_path: the path to the Kokkos include/ directory
+    :returns: the standard as a string, e.g. "17"
+    """
+
+    config: Path = Path(include_path) / "KokkosCore_config.h"
+    pattern = re.compile(r"#define\s+KOKKOS_ENABLE_CXX(\d+)\b")
+
+    try:
+        with open(config, "r") as f:
+            match = pattern.search(f.read())
+            if match is not None:
+                return match.group(1)
+    except OSError:
+        pass
+
+    # The standard may only be defined after preprocessing
+    result = subprocess.run(["g++", "-dM", "-E", "-DKOKKOS_MACROS_HPP", str(config)], capture_output=True, check=False)
+    match = pattern.search(result.stdout.decode("utf-8"))
+    if match is None:
+        raise RuntimeError(f"Could not find the C++ standard in {config}")
+
+    return match.group(1)
+
+
+class BuildDriver:
+    """
+    Invokes the C++ compiler to build a generated module
+    """
+
+    def __init__(self, args: Dict[str, str], pch_file: str):
+        """
+        BuildDriver constructor
+
+        :param args: the build arguments returned by CppSetup.get_build_args()
+        :param pch_file: the name of the header to precompile
+        """
+
+        self.args: Dict[str, str] = args
+        self.pch_file: str = pch_file
+
+    def get_compile_flags(self) -> List[str]:
+        """
+        Get the flags used to compile sources and the precompiled header
+
+        :returns: the list of flags
+        """
+
+        compiler: str = self.args["compiler"]
+        space: str = self.args["space"]
+        std: str = get_cxx_standard(self.args["include_path"])
+
+        flags: List[str] = get_python_includes() + [f"-I{self.args['pch_dir']}", "-I..", "-O3"]
+
+        if compiler == "g++":
+            flags += ["-march=native", "-mtune=native"]
+        elif compiler == "nvcc":
+            flags += ["-Xcompiler", "-march=native", "-Xcompiler", "-mtune=native"]
+
+        # Profiles are written next to the object file when the
+        # instrumented module is unloaded, and read from there by "use".
+        # Modules built elsewhere and then moved write them to the
+        # directory they are moved to instead.
+        pgo: Optional[str] = self.args.get("pgo")
+        if pgo == "generate":
+            if "profile_output_dir" in self.args:
+                flags += [f"-fprofile-generate={self.args['profile_output_dir']}", "-fprofile-update=atomic"]
+            else:
+                flags += ["-fprofile-generate", "-fprofile-update=atomic"]
+        elif pgo == "use":
+            flags += ["-fprofile-use", "-fprofile-correction", "-Wno-missing-profile"]
+
+        flags += ["-isystem", self.args["include_path"]]
+
+        if compiler == "g++":
+            flags += ["-fPIC", "-fopenmp"]
+        elif compiler == "nvcc":
+            flags += [f"-arch={self.args['compute_capability']}", "--expt-extended-lambda", "-fPIC", "-Xcompiler", "-fopenmp"]
+        elif compiler == "hipcc":
+            flags += ["-fPIC", "-fno-gpu-rdc", "-fopenmp"]
+
+        flags += [
+            f"-std=c++{std}",
+            f"-DSPACE={space}",
+            f"-Dpk_arg_memspace={self.args['view_space']}",
+            f"-Dpk_arg_layout={self.args['view_layout']}",
+            f"-Dpk_exec_space=Kokkos::{space}",
+            f"-Dpk_real={self.args['precision']}",
+        ]
+
+        return flags
+
+    def get_link_flags(self, obj: str) -> List[str]:
+        """
+        Get the flags used to link the module. The Kokkos lib/ directory
+        is added to the rpath so the module finds the Kokkos libraries
+        it was built against.
+
+        :param obj: the object file to link
+        :returns: the list of flags
+        """
+
+        compiler: str = self.args["compiler"]
+        lib_path: str = self.args["lib_path"]
+        suffix: str = self.args["lib_suffix"]
+
+        flags: List[str] = ["-I..", "-O3", "-shared"]
+        if compiler == "nvcc":
+            flags += [f"-arch={self.args['compute_capability']}", "--expt-extended-lambda", "-fopenmp"]
+        elif compiler == "hipcc":
+            flags += ["-fopenmp", "-fno-gpu-rdc"]
+        else:
+            flags += ["-fopenmp"]
+
+        if self.args.get("pgo") == "generate":
+            flags.append("-fprofile-generate")
+
+        flags += [
+            obj, "-o", self.args["module"],
+            f"{lib_path}/libkokkoscontainers{suffix}.so",
+            f"{lib_path}/libkokkoscore{suffix}.so",
+            f"-Wl,-rpath,{lib_path}",
+        ]
+
+        return flags
+
+    def get_compiler_command(self) -> str:
+        """
+        Get the executable to invoke for the configured compiler
+
+        :returns: the compiler executable
+        """
+
+        if self.args["compiler"] == "nvcc":
+            return self.args["compiler_path"]
+
+        return self.args["compiler"]
+
+    def run(self, command: List[str], output_dir: Path) -> None:
+        """
+        Run a compiler command
+
+        :param command: the command to run
+        :param output_dir: the directory to run the command in
+        """
+
+        result = subprocess.run(command, cwd=output_dir, capture_output=True, check=False)
+        if result.returncode != 0:
+            diagnostics: str = result.stderr.decode("utf-8") + result.stdout.decode("utf-8")
+            raise CompilationError(output_dir, command, result.returncode, diagnostics)
+
+    def build_pch(self, output_dir: Path) -> None:
+        """
+        Precompile the header for this configuration if it does not
+        exist yet. It is built with exactly the same flags as the
+        sources using it, otherwise g++ ignores it and parses the header.
+
+        :param output_dir: the directory of the module being built
+        """
+
+        pch_dir: Path = Path(self.args["pch_dir"])
+        gch: Path = pch_dir / f"{self.pch_file}.gch"
+        if gch.is_file():
+            return
+
+        tmp: Path = pch_dir / f"{self.pch_file}.gch.{os.getpid()}.{threading.get_ident()}"
+        command: List[str] = ["g++"] + self.get_compile_flags() + ["-x", "c++-header", "-o", str(tmp), str(pch_dir / self.pch_file)]
+        try:
+            self.run(command, output_dir)
+            os.replace(tmp, gch)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+
+    def copy_profiles(self, profile_dir: Path, output_dir: Path) -> None:
+        """
+        Copy the profiles recorded by the instrumented module next to
+        the object file being built, which is where g++ looks for them.
+        Both are built from the same source file name. Profiles written
+        to a -fprofile-generate directory are named after the mangled
+        path of the object file, with '#' in place of '/'.
+
+        :param profile_dir: the directory of the instrumented module
+        :param output_dir: the directory of the module being built
+        """
+
+        for profile in profile_dir.glob("*.gcda"):
+            shutil.copyfile(profile, output_dir / profile.name.split("#")[-1])
+
+    def build(self, output_dir: Path) -> None:
+        """
+        Compile and link the source in the output directory into the
+        module
+
+        :param output_dir: the directory containing the generated source
+        """
+
+        sources: List[Path] = sorted(output_dir.glob("*.cpp"))
+        if len(sources) != 1:
+            raise RuntimeError(f"Expected one source file in {output_dir}, found {len(sources)}")
+
+        source: str = sources[0].name
+        obj: str = f"{source}.o"
+
+        if self.args["compiler"] == "g++":
+            with open(sources[0], "r") as f:
+                if self.pch_file in f.read():
+                    try:
+                        self.build_pch(output_dir)
+                    except CompilationError:
+                        # Not fatal, the header is parsed as usual
+                        pass
+
+        if self.args.get("pgo") == "use" and "profile_dir" in self.args:
+            self.copy_profiles(Path(self.args["profile_dir"]), output_dir)
+
+        compiler: str = self.get_compiler_command()
+        compile_command: List[str] = [compiler] + self.get_compile_flags()
+        if self.args["compiler"] == "g++":
+            compile_command.append("-Winvalid-pch")
+        compile_command += ["-o", obj, "-c", source]
+        self.run(compile_command, output_dir)
+
+        link_command: List[str] = [compiler] + self.get_link_flags(obj)
+        self.run(link_command, output_dir)
@@ -1,23 +1,30 @@
 import ast
+from concurrent.futures import Future, ThreadPoolExecutor
 import copy
+import dataclasses
 from dataclasses import dataclass
+import hashlib
 import json
 import logging
 import os
 from pathlib import Path
 import sys
+import sysconfig
+import threading
 import time
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from pykokkos.core.fusion import fuse_workunits
-from pykokkos.core.optimizations import loop_fuse, memory_ops_fuse
+from pykokkos.core.optimizations import loop_fuse, memory_ops_fuse, specialize_workunit
 from pykokkos.core.parsers import Parser, PyKokkosEntity, PyKokkosStyles
-from pykokkos.core.translators import PyKokkosMembers, StaticTranslator
+from pykokkos.core.translators import PyKokkosMembers, StaticTranslator, TranslatedEntity
 from pykokkos.core.type_inference import UpdatedTypes, UpdatedDecorator
-from pykokkos.interface import ExecutionSpace
+from pykokkos.core.visitors import visitors_util
+from pykokkos.interface import Decorator, ExecutionSpace
 import pykokkos.kokkos_manager as km
 
 from .cpp_setup import CppSetup
+from .kernel_cache import KernelCache
 from .module_setup import EntityMetadata, ModuleSetup
 
 @dataclass
@@ -38,10 +45,24 @@ class Compiler:
         # maps from entity metadata to members
         self.members: Dict[str, PyKokkosMembers] = {}
 
-        # caches the result of CppSetup.is_compiled(path)
+        # caches the result of ModuleSetup.is_compiled()
         self.is_compiled_cache: Dict[str, bool] = {}
         self.parser_cache: Dict[str, Parser] = {}
 
+        # maps from output directory to the build running in the
+        # background for that directory
+        self.pending_builds: Dict[Path, Future] = {}
+        self.build_pool: Optional[ThreadPoolExecutor] = None
+
+        self.kernel_cache = KernelCache()
+
+        # Guards the caches above when dispatching from several threads
+        self.lock = threading.RLock()
+        # maps from an output directory to the lock held while the
+        # module in it is translated or compiled, so that exactly one
+        # thread builds it while the others wait
+        self.build_locks: Dict[Path, threading.RLock] = {}
+
         self.functor_file: str = "functor.hpp"
         self.functor_cast_file: str = "functor_cast.hpp"
         self.bindings_file: str = "bindings.cpp"
@@ -119,6 +140,9 @@ class Compiler:
         updated_types: Optional[UpdatedTypes],
         types_signature: Optional[str],
         restrict_views: Set[str],
+        async_build: bool = False,
+        specialization: Optional[Dict[str, Any]] = None,
+        inference: Optional[Dict[str, Dict[str, Any]]] = None,
         **kwargs
     ) -> PyKokkosMembers:
         """
@@ -130,63 +154,162 @@ class Compiler:
         :param updated_decorator: Object for decorator specifiers
         :param updated_types: Object with with inferred types
         :param restrict_views: a set of view names that do not alias any other views
+        :param async_build: whether to run the C++ compiler in the background
+        :param specialization: the values of the parameters to compile into the kernel
+        :param inference: the inferred types to record with the members,
+            keyed by the dispatch they were inferred for
         :returns: the PyKokkos members obtained during translation
         """
 
-        metadata: List[EntityMetadata] = module_setup.metadata
+        with self.get_build_lock(module_setup.output_dir):
+            metadata: List[EntityMetadata] = module_setup.metadata
 
-        entity: PyKokkosEntity
-        classtypes: List[PyKokkosEntity] = []
-        parser = self.get_parser(metadata[0].path)
+            if module_setup.output_dir not in self.is_compiled_cache:
+                cached_members: Optional[PyKokkosMembers] = self.load_object(module_setup, types_signature)
+                if cached_members is not None:
+                    if inference is not None:
+                        self.update_link(module_setup, cached_members, False, inference)
+                    return cached_members
 
-        if len(metadata) == 1:
-            entity = parser.get_entity(metadata[0].name)
-            classtypes = parser.get_classtypes()
-        else:
-            # Avoid fusing the ASTs before checking if it was already compiled
-            entity, classtypes = self.fuse_objects(metadata, fuse_ASTs=False, **kwargs)
+            entity: PyKokkosEntity
+            classtypes: List[PyKokkosEntity] = []
+            parser = self.get_parser(metadata[0].path)
 
-        hash: str = self.members_hash(entity.path, entity.name, types_signature)
+            if len(metadata) == 1:
+                entity = parser.get_entity(metadata[0].name)
+                classtypes = parser.get_classtypes()
+            else:
+                # Avoid fusing the ASTs before checking if it was already compiled
+                entity, classtypes = self.fuse_objects(metadata, fuse_ASTs=False, **kwargs)
 
-        types_inferred: bool = updated_types is not None
-        decorator_inferred: bool = updated_decorator is not None
+            hash: str = self.members_hash(entity.path, entity.name, types_signature)
 
-        if types_inferred and entity.style not in {PyKokkosStyles.workunit, PyKokkosStyles.fused}:
-            raise Exception(f"Types are required for style: {entity.style}")
+            types_inferred: bool = updated_types is not None
+            decorator_inferred: bool = updated_decorator is not None
 
-        if self.is_compiled(module_setup.output_dir):
-            if hash not in self.members: # True if pre-compiled
-                if len(metadata) > 1:
-                    entity, classtypes = self.fuse_objects(metadata, fuse_ASTs=True, **kwargs)
+            if types_inferred and entity.style not in {PyKokkosStyles.workunit, PyKokkosStyles.fused}:
+                raise Exception(f"Types are required for style: {entity.style}")
 
-                if types_inferred:
-                    entity.AST = parser.fix_types(entity, updated_types)
-                if decorator_inferred:
-                    entity.AST = parser.fix_decorator(entity, updated_decorator)
-                self.members[hash] = self.extract_members(entity, classtypes)
+            if self.is_compiled(module_setup):
+                if not module_setup.linked and module_setup.output_dir not in self.pending_builds:
+                    module_setup.is_compiled(self.get_fingerprint(module_setup))
 
-            return self.members[hash]
+                extracted: bool = hash not in self.members
+                if extracted: # True if pre-compiled
+                    if len(metadata) > 1:
+                        entity, classtypes = self.fuse_objects(metadata, fuse_ASTs=True, **kwargs)
 
-        if len(metadata) > 1:
-            entity, classtypes = self.fuse_objects(metadata, fuse_ASTs=True, **kwargs)
+                    if types_inferred:
+                        entity.AST = parser.fix_types(entity, updated_types)
+                    if decorator_inferred:
+                        entity.AST = parser.fix_decorator(entity, updated_decorator)
+                    if specialization is not None:
+                        entity = self.specialize(entity, specialization)
+                    self.members[hash] = self.extract_members(entity, classtypes)
+                    self.members[hash].specialized_params = dict(specialization or {})
 
-        self.is_compiled_cache[module_setup.output_dir] = True
+                if len(metadata) == 1 and module_setup.linked and module_setup.output_dir not in self.pending_builds:
+                    self.update_link(module_setup, self.members[hash], extracted, inference)
 
-        members: PyKokkosMembers
+                return self.members[hash]
 
-        if types_inferred:
-            entity.AST = parser.fix_types(entity, updated_types)
-        if decorator_inferred:
-            entity.AST = parser.fix_decorator(entity, updated_decorator)
+            if len(metadata) > 1:
+                entity, classtypes = self.fuse_objects(metadata, fuse_ASTs=True, **kwargs)
 
-        if hash in self.members: # True if compiled with another execution space
-            members = self.members[hash]
-        else:
-            members = self.extract_members(entity, classtypes)
-            self.members[hash] = members
+            self.is_compiled_cache[module_setup.output_dir] = True
 
-        self.compile_entity(module_setup.main, module_setup, entity, classtypes, space, force_uvm, members, restrict_views)
-        return members
+            members: PyKokkosMembers
+
+            if types_inferred:
+                entity.AST = parser.fix_types(entity, updated_types)
+            if decorator_inferred:
+                entity.AST = parser.fix_decorator(entity, updated_decorator)
+            if specialization is not None:
+                entity = self.specialize(entity, specialization)
+
+            if hash in self.members: # True if compiled with another execution space
+                members = self.members[hash]
+            else:
+                members = self.extract_members(entity, classtypes)
+                members.specialized_params = dict(specialization or {})
+                self.members[hash] = members
+
+            self.compile_entity(module_setup.main, module_setup, entity, classtypes, space, force_uvm, members, restrict_views, async_build, inference)
+            return members
+
+    def load_object(self, module_setup: ModuleSetup, types_signature: Optional[str]) -> Optional[PyKokkosMembers]:
+        """
+        Get the members of an entity that is already compiled without
+        parsing its source, either because this process compiled it or
+        because a previous process recorded its members and none of its
+        files changed since
+
+        :param module_setup: the module_setup object containing module info
+        :param types_signature: string signature of inferred parameter types
+        :returns: the members, or None if the entity has to go through compile_object()
+        """
+
+        metadata: List[EntityMetadata] = module_setup.metadata
+        if len(metadata) != 1:
+            return None
+
+        hash: str = self.members_hash(metadata[0].path, metadata[0].name, types_signature)
+        with self.get_build_lock(module_setup.output_dir):
+            if module_setup.output_dir in self.is_compiled_cache:
+                if self.is_compiled_cache[module_setup.output_dir] and hash in self.members and module_setup.linked:
+                    return self.members[hash]
+
+                return None
+
+            # A previous process compiled this entity and recorded its
+            # members, so skip parsing and translating the source
+            cached_members: Optional[PyKokkosMembers] = module_setup.load_members()
+            if cached_members is None:
+                return None
+
+            self.logger.info(f"loaded members of {metadata[0].name} from {module_setup.output_dir}")
+            self.is_compiled_cache[module_setup.output_dir] = True
+
+            return self.members.setdefault(hash, cached_members)
+
+    def update_link(
+        self,
+        module_setup: ModuleSetup,
+        members: PyKokkosMembers,
+        extracted: bool,
+        inference: Optional[Dict[str, Dict[str, Any]]]
+    ) -> None:
+        """
+        Record the members and inferred types of an entity that was
+        already compiled against the current source, if the link does
+        not have them yet
+
+        :param module_setup: the module_setup object containing module info
+        :param members: the members of the entity
+        :param extracted: whether the members were just extracted from the source
+        :param inference: the inferred types, keyed by the dispatch they were inferred for
+        """
+
+        link: Optional[Dict[str, Any]] = module_setup.read_link()
+        if link is None:
+            return
+
+        sources: Dict[str, str] = module_setup.get_source_hashes()
+        recorded: Dict[str, Dict[str, Any]] = {}
+        if link.get("sources") == sources:
+            recorded = link.get("inference", {})
+        elif not extracted:
+            # The members were loaded for an older version of the source
+            return
+
+        new_inference: bool = inference is not None and any(key not in recorded for key in inference)
+        if not extracted and not new_inference:
+            return
+
+        # The source may have changed without affecting this entity, so
+        # the members are recorded against the current source
+        module_setup.write_link(link["key"], link["name"], link["fingerprint"], sources,
+                                module_setup.dump_members(members), link.get("pgo"), {**recorded, **(inference or {})})
 
     def compile_entity(
         self,
@@ -197,7 +320,9 @@ class Compiler:
         space: ExecutionSpace,
         force_uvm: bool,
         members: PyKokkosMembers,
-        restrict_views: Set[str]
+        restrict_views: Set[str],
+        async_build: bool = False,
+        inference: Optional[Dict[str, Dict[str, Any]]] = None
     ) -> None:
         """
         Compile the entity
@@ -210,6 +335,8 @@ class Compiler:
         :param force_uvm: whether CudaUVMSpace is enabled
         :param members: the PyKokkos related members of the entity
         :param restrict_views: a set of view names that do not alias any other views
+        :param async_build: whether to run the C++ compiler in the background
+        :param inference: the inferred types to record with the members
         """
 
         if space is ExecutionSpace.Default:
@@ -218,11 +345,12 @@ class Compiler:
         if space is ExecutionSpace.Debug:
             return
 
-        if module_setup.is_compiled():
+        fingerprint: str = self.get_fingerprint(module_setup)
+        if module_setup.is_compiled(fingerprint):
             return
 
-        cpp_setup = CppSetup(module_setup.module_file, module_setup.gpu_module_files)
-        translator = StaticTranslator(module_setup.name, self.functor_file,self.functor_cast_file, members)
+        cpp_setup = CppSetup(module_setup.module_file, module_setup.gpu_module_files, module_setup.pgo)
+        translator = StaticTranslator(self.kernel_cache.module_placeholder, self.functor_file,self.functor_cast_file, members)
         t_start: float = time.perf_counter()
         functor: List[str]
         bindings: List[str]
@@ -238,11 +366,60 @@ class Compiler:
         t_end: float = time.perf_counter() - t_start
         self.logger.info(f"translation {t_end}")
 
-        output_dir: Path = module_setup.get_output_dir(main, module_setup.metadata, space, module_setup.types_signature, module_setup.restrict_signature)
-        c_start: float = time.perf_counter()
-        cpp_setup.compile(output_dir, functor, self.functor_file, cast, self.functor_cast_file, bindings, self.bindings_file, space, force_uvm, self.get_compiler())
-        c_end: float = time.perf_counter() - c_start
-        self.logger.info(f"compilation {c_end}")
+        # The compiled module lives in the kernel cache under a key
+        # derived from the generated source, so that any application
+        # generating the same source reuses it
+        compiler: str = self.get_compiler()
+        build_config: Dict[str, str] = cpp_setup.get_build_config(space, force_uvm, compiler)
+
+        pgo: Optional[str] = build_config.get("pgo")
+        if module_setup.pgo is not None and pgo is None:
+            self.logger.warning(f"PK_PGO is only supported with g++, ignoring it for {entity.name}")
+        if pgo == "use":
+            # The instrumented module was built from the same source,
+            # so its profiles are found through its cache key
+            profile_key: str = self.kernel_cache.get_key([functor, cast, bindings], {**build_config, "pgo": "generate"})
+            cpp_setup.profile_dir = self.kernel_cache.get_output_dir(profile_key, space)
+            profile_hash: Optional[str] = self.kernel_cache.get_profile_hash(cpp_setup.profile_dir)
+            if profile_hash is None:
+                self.logger.warning(f"no profile found for {entity.name}, run it with PK_PGO=generate first")
+                pgo = "unprofiled"
+            else:
+                build_config["profile"] = profile_hash
+
+        key: str = self.kernel_cache.get_key([functor, cast, bindings], build_config)
+        module_name: str = self.kernel_cache.get_module_name(key)
+        bindings = [b.replace(self.kernel_cache.module_placeholder, module_name) for b in bindings]
+
+        output_dir: Path = self.kernel_cache.get_output_dir(key, space)
+        module_setup.set_module(module_name, output_dir)
+
+        # Captured before building so that they match the source that
+        # was translated
+        sources: Optional[Dict[str, str]] = None
+        members_data: Optional[bytes] = None
+        if len(module_setup.metadata) == 1:
+            sources = module_setup.get_source_hashes()
+            members_data = module_setup.dump_members(members)
+
+        def build() -> None:
+            # Other entities, in this process or others, can translate
+            # to the same source, and so to the same cache entry
+            with self.get_build_lock(output_dir), self.kernel_cache.lock(key, space):
+                if self.kernel_cache.contains(key, space, module_setup.module_file):
+                    self.logger.info(f"found {module_name} in the kernel cache")
+                else:
+                    c_start: float = time.perf_counter()
+                    cpp_setup.compile(output_dir, functor, self.functor_file, cast, self.functor_cast_file, bindings, self.bindings_file, space, force_uvm, compiler)
+                    c_end: float = time.perf_counter() - c_start
+                    self.logger.info(f"compilation {c_end}")
+
+            module_setup.write_link(key, module_name, fingerprint, sources, members_data, pgo, inference)
+
+        if async_build:
+            self.pending_builds[module_setup.output_dir] = self.get_build_pool().submit(build)
+        else:
+            build()
 
     def compile_raw_source(
         self,
@@ -270,6 +447,172 @@ class Compiler:
         c_end: float = time.perf_counter() - c_start
         self.logger.info(f"compilation {c_end}")
 
+    def compile_batch(
+        self,
+        path: str,
+        names: Optional[List[str]],
+        space: ExecutionSpace,
+        force_uvm: bool
+    ) -> Optional[Tuple[str, Path, Dict[str, PyKokkosMembers]]]:
+        """
+        Translate a group of workunits from the same file into a single
+        translation unit with one wrapper per workunit and compile it
+        once. Only workunits with all parameters annotated can be
+        translated ahead of a dispatch; others are skipped.
+
+        :param path: the path to the file containing the workunits
+        :param names: the names of the workunits to compile, or None
+            for all workunits in the file
+        :param space: the execution space to compile for
+        :param force_uvm: whether CudaUVMSpace is enabled
+        :returns: the module name, the directory containing the compiled
+            module, and the members of each compiled workunit, or None if
+            none of the workunits could be compiled
+        """
+
+        if space is ExecutionSpace.Default:
+            space = km.get_default_space()
+
+        parser: Parser = self.get_parser(path)
+        if names is None:
+            names = list(parser.workunits.keys())
+
+        classtypes: List[PyKokkosEntity] = parser.get_classtypes()
+        translations: List[TranslatedEntity] = []
+        batch_members: Dict[str, PyKokkosMembers] = {}
+
+        t_start: float = time.perf_counter()
+        for name in names:
+            entity: PyKokkosEntity = parser.get_entity(name)
+            if entity.style is not PyKokkosStyles.workunit or any(a.annotation is None for a in entity.AST.args.args):
+                self.logger.info(f"skipping {name} in batch compilation, its parameters are not all annotated")
+                continue
+
+            # The translator reports source it cannot translate by
+            # raising these or by exiting. The workunit is translated
+            # again, and the error reported, when it is dispatched.
+            try:
+                members: PyKokkosMembers = self.extract_members(entity, classtypes)
+                translator = StaticTranslator(self.kernel_cache.module_placeholder, self.functor_file, self.functor_cast_file, members)
+                translations.append(translator.translate_parts(entity, classtypes, set()))
+            except (NotImplementedError, ValueError, SystemExit) as ex:
+                self.logger.warning(f"skipping {name} in batch compilation, it could not be translated: {ex!r}")
+                continue
+
+            batch_members[name] = members
+
+        self.logger.info(f"batch translation {time.perf_counter() - t_start}")
+        if len(batch_members) == 0:
+            return None
+
+        # One translation unit with the functors and wrappers of all
+        # workunits, sharing the classtypes of the file
+        assembler = StaticTranslator(self.kernel_cache.module_placeholder, self.functor_file, self.functor_cast_file, PyKokkosMembers())
+        functor: List[str]
+        bindings: List[str]
+        cast: List[str]
+        functor, bindings, cast = assembler.assemble("pk_batch", translations)
+
+        suffix: Optional[str] = sysconfig.get_config_var("EXT_SUFFIX")
+        cpp_setup = CppSetup(f"kernel{suffix}", [])
+        compiler: str = self.get_compiler()
+
+        key: str = self.kernel_cache.get_key([functor, cast, bindings], cpp_setup.get_build_config(space, force_uvm, compiler))
+        module_name: str = self.kernel_cache.get_module_name(key)
+        bindings = [b.replace(self.kernel_cache.module_placeholder, module_name) for b in bindings]
+
+        output_dir: Path = self.kernel_cache.get_output_dir(key, space)
+        with self.get_build_lock(output_dir), self.kernel_cache.lock(key, space):
+            if not self.kernel_cache.contains(key, space, cpp_setup.module_file):
+                c_start: float = time.perf_counter()
+                cpp_setup.compile(output_dir, functor, self.functor_file, cast, self.functor_cast_file, bindings, self.bindings_file, space, force_uvm, compiler)
+                self.logger.info(f"batch compilation {time.perf_counter() - c_start}")
+
+        return module_name, output_dir, batch_members
+
+    def get_build_pool(self) -> ThreadPoolExecutor:
+        """
+        Get the pool running background compilations, creating it on
+        first use. The pool is sized to the number of available cores
+        unless PK_BUILD_JOBS is set. Threads are sufficient since each
+        build spends its time waiting on the compiler subprocess.
+
+        :returns: the ThreadPoolExecutor object
+        """
+
+        if self.build_pool is None:
+            jobs: Optional[str] = os.environ.get("PK_BUILD_JOBS")
+            max_workers: int
+            if jobs is not None:
+                max_workers = int(jobs)
+            elif hasattr(os, "sched_getaffinity"):
+                max_workers = len(os.sched_getaffinity(0))
+            else:
+                max_workers = os.cpu_count() or 1
+
+            self.build_pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pk_build")
+
+        return self.build_pool
+
+    def get_build_lock(self, output_dir: Path) -> threading.RLock:
+        """
+        Get the lock held while the module in an output directory is
+        translated or compiled
+
+        :param output_dir: the output directory of the module
+        :returns: the lock
+        """
+
+        with self.lock:
+            return self.build_locks.setdefault(output_dir, threading.RLock())
+
+    def is_build_pending(self, output_dir: Path) -> bool:
+        """
+        Check if the module in an output directory is still being
+        compiled in the background
+
+        :param output_dir: the output directory of the module
+        :returns: True if the build has not finished
+        """
+
+        build: Optional[Future] = self.pending_builds.get(output_dir)
+
+        return build is not None and not build.done()
+
+    def wait_for_build(self, output_dir: Path) -> None:
+        """
+        Block until the background build of a module finishes, if there
+        is one. Errors raised by the build are re-raised here, and the
+        module is forgotten so that the next dispatch builds it again.
+
+        :param output_dir: the output directory of the module
+        """
+
+        build: Optional[Future] = self.pending_builds.get(output_dir)
+        if build is None:
+            return
+
+        try:
+            build.result()
+        except BaseException:
+            with self.lock:
+                if self.pending_builds.get(output_dir) is build:
+                    self.pending_builds.pop(output_dir)
+                    self.is_compiled_cache.pop(output_dir, None)
+            raise
+
+        with self.lock:
+            if self.pending_builds.get(output_dir) is build:
+                self.pending_builds.pop(output_dir)
+
+    def wait_for_all_builds(self) -> None:
+        """
+        Block until all background builds finish
+        """
+
+        for output_dir in list(self.pending_builds.keys()):
+            self.wait_for_build(output_dir)
+
     def get_compiler(self) -> str:
         """
         Get the compiler to use based on the machine name
@@ -346,6 +689,22 @@ class Compiler:
 
         return f"{path}_{name}" if types_signature is None else f"{path}_{name}_{types_signature}"
 
+    def specialize(self, entity: PyKokkosEntity, specialization: Dict[str, Any]) -> PyKokkosEntity:
+        """
+        Get a copy of a workunit with some of its parameters replaced by
+        constants. The parsed entity is left unchanged, as it is shared
+        by the generic module and the other specializations.
+
+        :param entity: the workunit being compiled
+        :param specialization: a dict mapping from parameter name to value
+        :returns: the specialized entity
+        """
+
+        if entity.style is not PyKokkosStyles.workunit:
+            raise ValueError(f"ERROR: only standalone workunits can be specialized, {entity.name} is a {entity.style.name}")
+
+        return dataclasses.replace(entity, AST=specialize_workunit(entity.AST, specialization))
+
     def extract_members(self, entity: PyKokkosEntity, classtypes: List[PyKokkosEntity]) -> PyKokkosMembers:
         """
         Extract the PyKokkos members from an entity
@@ -365,24 +724,91 @@ class Compiler:
 
         return members
 
-    def is_compiled(self, output_dir: str) -> bool:
+    def is_compiled(self, module_setup: ModuleSetup) -> bool:
         """
         Check if the entity is compiled. This caches the result of
-        CppSetup.is_compiled() as that requires accessing the
+        ModuleSetup.is_compiled() as that requires accessing the
         filesystem, which is costly.
 
-        :param output_dir: the location of the compiled entity
-        :returns: True if output_dir exists
+        :param module_setup: the module setup of the entity
+        :returns: True if the entity has a compiled module
         """
 
+        output_dir: Path = module_setup.output_dir
         if output_dir in self.is_compiled_cache:
             return self.is_compiled_cache[output_dir]
 
-        is_compiled: bool = CppSetup.is_compiled(output_dir)
+        is_compiled: bool = module_setup.is_compiled(self.get_fingerprint(module_setup))
+        if not is_compiled and module_setup.read_link() is not None:
+            self.logger.info(f"{output_dir} is out of date, recompiling")
         self.is_compiled_cache[output_dir] = is_compiled
 
         return is_compiled
 
+    def get_fingerprint(self, module_setup: ModuleSetup) -> str:
+        """
+        Get a fingerprint of the Python source a module is translated
+        from. This covers the source of each entity, the classtypes and
+        pk.functions defined in its file, and the inferred types, so
+        that editing any of them invalidates the compiled module.
+
+        :param module_setup: the module setup of the entity
+        :returns: the fingerprint as a hex string
+        """
+
+        h = hashlib.sha256()
+        for m in module_setup.metadata:
+            parser: Parser = self.get_parser(m.path)
+            entity: PyKokkosEntity = parser.get_entity(m.name)
+            h.update("".join(entity.source[0]).encode())
+
+            for classtype in parser.get_classtypes():
+                h.update("".join(classtype.source[0]).encode())
+
+            for function in self.get_pk_functions(parser):
+                h.update(function.encode())
+
+        h.update(str(module_setup.types_signature).encode())
+        h.update(str(module_setup.restrict_signature).encode())
+
+        return h.hexdigest()
+
+    @staticmethod
+    def get_pk_functions(parser: Parser) -> List[str]:
+        """
+        Get the source of the module level pk.functions in a file
+
+        :param parser: the parser of the file
+        :returns: the source of each pk.function
+        """
+
+        functions: List[str] = []
+        for node in parser.tree.body:
+            if not isinstance(node, ast.FunctionDef) or not node.decorator_list:
+                continue
+
+            decorator: ast.expr = node.decorator_list[0]
+            if isinstance(decorator, ast.Call):
+                continue
+
+            if visitors_util.get_node_name(decorator) == Decorator.KokkosFunction.value:
+                functions.append("".join(parser.lines[decorator.lineno - 1:node.end_lineno]))
+
+        return functions
+
+    def invalidate_source(self, path: str) -> None:
+        """
+        Forget the parsed source and members of a file that was
+        modified, along with which modules are up to date
+
+        :param path: the path to the file
+        """
+
+        with self.lock:
+            self.parser_cache.pop(path, None)
+            self.members = {k: m for k, m in self.members.items() if not k.startswith(f"{path}_")}
+            self.is_compiled_cache.clear()
+
     def get_parser(self, path: str) -> Parser:
         """
         Get the parser for a particular file
@@ -394,7 +820,10 @@ class Compiler:
         if path in self.parser_cache:
             return self.parser_cache[path]
 
-        parser = Parser(path)
-        self.parser_cache[path] = parser
+        # Type inference modifies the parsed ASTs, so all threads have
+        # to share the same parser
+        with self.lock:
+            if path not in self.parser_cache:
+                self.parser_cache[path] = Parser(path)
 
-        return parser
+            return self.parser_cache[path]
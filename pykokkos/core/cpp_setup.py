@@ -1,10 +1,14 @@
+from functools import lru_cache
+import hashlib
 import os
 from pathlib import Path
+import re
 import shutil
 import subprocess
 import sys
+import threading
 from types import ModuleType
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from pykokkos.interface import (
     ExecutionSpace, get_default_layout, get_default_memory_space,
@@ -12,28 +16,75 @@ from pykokkos.interface import (
 )
 import pykokkos.kokkos_manager as km
 
+from . import build_driver
+from .build_driver import BuildDriver
+from .kernel_cache import KernelCache
+
+def get_pgo_mode(names: List[str]) -> Optional[str]:
+    """
+    Get the profile-guided optimization mode from PK_PGO. "generate"
+    builds instrumented modules that record a profile when the process
+    exits, and "use" rebuilds them with that profile. PK_PGO_KERNELS
+    optionally restricts PGO to a comma-separated list of kernel names.
+
+    :param names: the names of the entities compiled into the module
+    :returns: the mode, or None if PGO does not apply to the module
+    """
+
+    mode: Optional[str] = os.getenv("PK_PGO")
+    if mode is None or mode == "":
+        return None
+
+    if mode not in ("generate", "use"):
+        raise ValueError(f"ERROR: PK_PGO must be 'generate' or 'use', got '{mode}'")
+
+    kernels: Optional[str] = os.getenv("PK_PGO_KERNELS")
+    if kernels is not None:
+        selected: List[str] = [k.strip() for k in kernels.split(",")]
+        if not any(n in selected for n in names):
+            return None
+
+    return mode
+
 
 class CppSetup:
     """
     Creates the directory to hold the translation and invokes the compiler
     """
 
-    def __init__(self, module_file: str, gpu_module_files: List[str]):
+    def __init__(self, module_file: str, gpu_module_files: List[str], pgo: Optional[str] = None):
         """
         CppSetup constructor
 
         :param module: the name of the file containing the compiled Python module
         :param gpu_module_files: the list of names of files containing for each gpu module
+        :param pgo: the profile-guided optimization mode, "generate" or "use"
         """
 
         self.module_file: str = module_file
         self.gpu_module_files: List[str] = gpu_module_files
 
-        self.script: str = "compile.sh"
-        self.script_path: Path = Path(__file__).resolve().parent / self.script
+        # PGO is only supported with g++. The profile directory is the
+        # kernel cache entry of the instrumented module, set by the
+        # compiler for "use" builds
+        self.pgo: Optional[str] = pgo
+        self.profile_dir: Optional[Path] = None
 
         self.lib_path_env: str = "PK_KOKKOS_LIB_PATH"
 
+        # The header included first by every generated module. The
+        # build driver precompiles it once per configuration
+        self.pch_file: str = "pk_pch.hpp"
+        self.pch_headers: List[str] = [
+            "pybind11/pybind11.h",
+            "Kokkos_Core.hpp",
+            "Kokkos_Random.hpp",
+            "Kokkos_Sort.hpp",
+            "fstream",
+            "iostream",
+            "cmath",
+        ]
+
         self.format: bool = False
 
     def compile_raw_source(
@@ -58,8 +109,7 @@ class CppSetup:
 
         self.initialize_directory(output_dir)
         self.write_raw_source(output_dir, source, filename)
-        self.copy_script(output_dir)
-        self.invoke_script(output_dir, space, enable_uvm, compiler)
+        self.invoke_compiler(output_dir, space, enable_uvm, compiler)
 
     def compile(
         self,
@@ -88,12 +138,25 @@ class CppSetup:
         :param enable_uvm: whether to enable CudaUVMSpace
         """
 
-        self.initialize_directory(output_dir)
-        self.write_source(output_dir, functor,functor_filename, functor_cast, functor_cast_filename, bindings, bindings_filename)
-        self.copy_script(output_dir)
-        self.invoke_script(output_dir, space, enable_uvm, compiler)
-        if space in {ExecutionSpace.Cuda, ExecutionSpace.HIP} and km.is_multi_gpu_enabled():
-            self.copy_multi_gpu_kernel(output_dir)
+        # Build next to the output directory, so that the functor
+        # headers are found in the same parent, and move it in place
+        # once complete so that a partial build is never loaded. A
+        # failed build is removed so that it does not pile up in the
+        # shared cache.
+        build_dir: Path = output_dir.parent / f".{output_dir.name}.{os.getpid()}.{threading.get_ident()}"
+        published: bool = False
+        try:
+            self.initialize_directory(build_dir)
+            self.write_source(build_dir, functor,functor_filename, functor_cast, functor_cast_filename, bindings, bindings_filename)
+            self.invoke_compiler(build_dir, space, enable_uvm, compiler, output_dir)
+            if space in {ExecutionSpace.Cuda, ExecutionSpace.HIP} and km.is_multi_gpu_enabled():
+                self.copy_multi_gpu_kernel(build_dir)
+
+            self.publish_directory(build_dir, output_dir)
+            published = True
+        finally:
+            if not published:
+                shutil.rmtree(build_dir, ignore_errors=True)
 
 
     def initialize_directory(self, name: Path) -> None:
@@ -113,6 +176,24 @@ class CppSetup:
         except FileExistsError:
             pass
 
+    def publish_directory(self, build_dir: Path, output_dir: Path) -> None:
+        """
+        Move a completed build to its output directory, replacing what
+        is left of an earlier build. The caller holds the lock on the
+        output directory.
+
+        :param build_dir: the directory the module was built in
+        :param output_dir: the directory the module is loaded from
+        """
+
+        # Profiles recorded by an instrumented module are kept
+        if output_dir.is_dir():
+            for profile in output_dir.glob("*.gcda"):
+                os.replace(profile, build_dir / profile.name)
+            shutil.rmtree(output_dir)
+
+        os.rename(build_dir, output_dir)
+
     def write_source(self, output_dir: Path, functor: List[str], functor_filename: str ,functor_cast: List[str], functor_cast_filename: str, bindings: List[str],bindings_filename: str) -> None:
         """
         Writes the generated C++ source code to a file
@@ -142,8 +223,12 @@ class CppSetup:
 
         file_path: Path = output_dir / filename
 
-        with open(file_path, "w") as out:
+        # The functor headers are shared by the builds for all
+        # execution spaces, which may be running in other processes
+        tmp: Path = output_dir / f"{filename}.{os.getpid()}.{threading.get_ident()}"
+        with open(tmp, "w") as out:
             out.write("\n".join(source))
+        os.replace(tmp, file_path)
 
         if self.format:
             try:
@@ -151,20 +236,6 @@ class CppSetup:
             except Exception as ex:
                 print(f"Exception while formatting cpp: {ex}")
 
-    def copy_script(self, output_dir: Path) -> None:
-        """
-        Copy the compilation script to the output directory
-
-        :param output_dir: the base directory
-        """
-
-        file_path: Path = output_dir / "compile.sh"
-        try:
-            shutil.copy(self.script_path, file_path)
-        except Exception as ex:
-            print(f"Exception while copying views and makefile: {ex}")
-            sys.exit(1)
-
     def get_kokkos_paths(self, space: ExecutionSpace, compiler: str) -> Tuple[Path, Path, Path]:
         """
         Get the paths of the Kokkos instal lib and include
@@ -238,14 +309,14 @@ class CppSetup:
 
         return f"_{km.get_device_id()}"
 
-    def invoke_script(self, output_dir: Path, space: ExecutionSpace, enable_uvm: bool, compiler: str) -> None:
+    def get_build_args(self, space: ExecutionSpace, enable_uvm: bool, compiler: str) -> Dict[str, str]:
         """
-        Invoke the compilation script
+        Get the arguments passed to the build driver
 
-        :param output_dir: the base directory
         :param space: the execution space of the workload
         :param enable_uvm: whether to enable CudaUVMSpace
         :param compiler: what compiler to use
+        :returns: a dict mapping from argument name to value
         """
 
         view_space: str = "Kokkos::HostSpace"
@@ -274,35 +345,127 @@ class CppSetup:
         compute_capability: str = self.get_cuda_compute_capability(compiler)
         lib_suffix: str = self.get_kokkos_lib_suffix(space)
 
-        command: List[str] = [f"./{self.script}",
-                              compiler,             # What compiler to use
-                              self.module_file,     # Compilation target
-                              space_value,          # Execution space
-                              view_space,           # Argument views memory space
-                              view_layout,          # Argument views memory layout
-                              precision,            # Default real precision
-                              str(lib_path),        # Path to Kokkos install lib/ directory
-                              str(include_path),    # Path to Kokkos install include/ directory
-                              compute_capability,   # Device compute capability
-                              lib_suffix,           # The libkokkos* suffix identifying the gpu
-                              str(compiler_path)]   # The path to the compiler to use
-        compile_result = subprocess.run(command, cwd=output_dir, capture_output=True, check=False)
-
-        if compile_result.returncode != 0:
-            print(compile_result.stderr.decode("utf-8"))
-            print(f"C++ compilation in {output_dir} failed")
-            sys.exit(1)
-
-        patchelf: List[str] = ["patchelf",
-                               "--set-rpath",
-                               str(lib_path),
-                               self.module_file]
-
-        patchelf_result = subprocess.run(patchelf, cwd=output_dir, capture_output=True, check=False)
-        if patchelf_result.returncode != 0:
-            print(patchelf_result.stderr.decode("utf-8"))
-            print(f"patchelf failed")
-            sys.exit(1)
+        args: Dict[str, str] = {
+            "compiler": compiler,                       # What compiler to use
+            "module": self.module_file,                 # Compilation target
+            "space": space_value,                       # Execution space
+            "view_space": view_space,                   # Argument views memory space
+            "view_layout": view_layout,                 # Argument views memory layout
+            "precision": precision,                     # Default real precision
+            "lib_path": str(lib_path),                  # Path to Kokkos install lib/ directory
+            "include_path": str(include_path),          # Path to Kokkos install include/ directory
+            "compute_capability": compute_capability,   # Device compute capability
+            "lib_suffix": lib_suffix,                   # The libkokkos* suffix identifying the gpu
+            "compiler_path": str(compiler_path),        # The path to the compiler to use
+        }
+
+        if self.pgo is not None and compiler == "g++":
+            args["pgo"] = self.pgo                      # Profile-guided optimization mode
+
+        return args
+
+    def get_build_config(self, space: ExecutionSpace, enable_uvm: bool, compiler: str) -> Dict[str, str]:
+        """
+        Get everything besides the generated source that affects the
+        compiled module. Used as part of the kernel cache key.
+
+        :param space: the execution space of the workload
+        :param enable_uvm: whether to enable CudaUVMSpace
+        :param compiler: what compiler to use
+        :returns: a dict mapping from configuration name to value
+        """
+
+        config: Dict[str, str] = self.get_build_args(space, enable_uvm, compiler)
+
+        # The build driver holds the compiler flags
+        config["driver"] = get_driver_hash()
+        config["kokkos_version"] = self.get_kokkos_version(Path(config["include_path"]))
+        config["pch_headers"] = self.get_pch_hash(Path(config["include_path"]))
+
+        return config
+
+    def get_kokkos_version(self, include_path: Path) -> str:
+        """
+        Get the version of the Kokkos install being compiled against
+
+        :param include_path: the path to the Kokkos include/ directory
+        :returns: the version from KokkosCore_config.h, or the
+            configured interface version if it cannot be read
+        """
+
+        version: Optional[str] = read_kokkos_version(str(include_path))
+        if version is not None:
+            return version
+
+        return str(km.get_kokkos_version())
+
+    def get_pch_hash(self, include_path: Path) -> str:
+        """
+        Hash the list of precompiled headers and the content of those
+        found in the Kokkos, Python and pybind11 include directories, so
+        that changing either rebuilds the precompiled header and the
+        modules built with it
+
+        :param include_path: the path to the Kokkos include/ directory
+        :returns: the hash as a hex string
+        """
+
+        return get_header_hash(str(include_path), tuple(self.pch_headers))
+
+    def get_pch_dir(self, space: ExecutionSpace, enable_uvm: bool, compiler: str) -> Path:
+        """
+        Get the directory holding the precompiled header for this
+        configuration, writing the header if it does not exist yet
+
+        :param space: the execution space of the workload
+        :param enable_uvm: whether to enable CudaUVMSpace
+        :param compiler: what compiler to use
+        :returns: the path to the precompiled header directory
+        """
+
+        config: Dict[str, str] = self.get_build_config(space, enable_uvm, compiler)
+        del config["module"]
+
+        pch_dir: Path = KernelCache().get_pch_dir(config)
+        header: Path = pch_dir / self.pch_file
+        if not header.is_file():
+            os.makedirs(pch_dir, exist_ok=True)
+            tmp: Path = pch_dir / f"{self.pch_file}.{os.getpid()}.{threading.get_ident()}"
+            with open(tmp, "w") as out:
+                out.write("#pragma once\n")
+                out.write("".join(f"#include <{h}>\n" for h in self.pch_headers))
+            os.replace(tmp, header)
+
+        return pch_dir
+
+    def invoke_compiler(
+        self,
+        output_dir: Path,
+        space: ExecutionSpace,
+        enable_uvm: bool,
+        compiler: str,
+        publish_dir: Optional[Path] = None
+    ) -> None:
+        """
+        Build the module from the source in the output directory. Raises
+        a CompilationError if the compiler fails.
+
+        :param output_dir: the base directory
+        :param space: the execution space of the workload
+        :param enable_uvm: whether to enable CudaUVMSpace
+        :param compiler: what compiler to use
+        :param publish_dir: the directory the module is moved to once
+            built, where an instrumented module writes its profiles
+        """
+
+        args: Dict[str, str] = self.get_build_args(space, enable_uvm, compiler)
+        args["pch_dir"] = str(self.get_pch_dir(space, enable_uvm, compiler))
+        if self.profile_dir is not None:
+            args["profile_dir"] = str(self.profile_dir)
+        if publish_dir is not None:
+            args["profile_output_dir"] = str(publish_dir)
+
+        BuildDriver(args, self.pch_file).build(output_dir)
 
     def copy_multi_gpu_kernel(self, output_dir: Path) -> None:
         """
@@ -358,18 +521,79 @@ class CppSetup:
 
         if compiler != "nvcc":
             return ""
-        else:
-            import cupy
 
-        return f"sm_{cupy.cuda.Device().compute_capability}"
+        return get_cuda_compute_capability(km.get_device_id())
 
-    @staticmethod
-    def is_compiled(output_dir: Path) -> bool:
-        """
-        Check if an entity is compiled
 
-        :param output_dir: the directory containing the compiled entity
-        :returns: true if compiled
-        """
+@lru_cache(maxsize=None)
+def get_cuda_compute_capability(device_id: int) -> str:
+    """
+    Query the compute capability of an Nvidia GPU once per device
+
+    :param device_id: the id of the device
+    :returns: the compute capability as a string
+    """
+
+    import cupy
+
+    return f"sm_{cupy.cuda.Device(device_id).compute_capability}"
+
+
+@lru_cache(maxsize=None)
+def get_driver_hash() -> str:
+    """
+    Hash the build driver, which holds the compiler flags, once per
+    process
+
+    :returns: the hash as a hex string
+    """
+
+    with open(build_driver.__file__, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def read_kokkos_version(include_path: str) -> Optional[str]:
+    """
+    Read the version of a Kokkos install from KokkosCore_config.h once
+    per install
+
+    :param include_path: the path to the Kokkos include/ directory
+    :returns: the version, or None if it cannot be read
+    """
+
+    try:
+        with open(Path(include_path) / "KokkosCore_config.h", "r") as f:
+            match = re.search(r"#define\s+KOKKOS_VERSION\s+(\d+)", f.read())
+            if match is not None:
+                return match.group(1)
+    except OSError:
+        pass
+
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_header_hash(include_path: str, headers: Tuple[str, ...]) -> str:
+    """
+    Hash a list of headers and the content of those found in the
+    Kokkos, Python and pybind11 include directories, once per list
+
+    :param include_path: the path to the Kokkos include/ directory
+    :param headers: the headers as written in #include directives
+    :returns: the hash as a hex string
+    """
+
+    include_dirs: List[Path] = [Path(include_path)] + [Path(flag[2:]) for flag in build_driver.get_python_includes()]
+
+    h = hashlib.sha256()
+    for header in headers:
+        h.update(header.encode())
+        h.update(b"\0")
+        for include_dir in include_dirs:
+            path: Path = include_dir / header
+            if path.is_file():
+                h.update(path.read_bytes())
+                break
 
-        return output_dir.is_dir()
+    return h.hexdigest()
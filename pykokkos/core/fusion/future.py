@@ -1,13 +1,19 @@
+import concurrent.futures
+from typing import Optional
+
 from pykokkos.runtime import runtime_singleton
 
 
 class Future:
     """
-    Delayed reductions and scans return a Future
+    Delayed reductions and scans return a Future, as do all dispatches
+    with PK_ASYNC set
     """
 
     def __init__(self) -> None:
         self.value = None
+        # the queued dispatch when running with PK_ASYNC
+        self.pending: Optional[concurrent.futures.Future] = None
 
     def assign_value(self, value) -> None:
         self.value = value
@@ -66,6 +72,16 @@ class Future:
     def __repr__(self) -> str:
         return f"Future(value={self.value})"
 
+    def wait(self):
+        """
+        Wait for the dispatch that returned this Future to run
+
+        :returns: the result of the dispatch (None for parallel_for)
+        """
+
+        runtime_singleton.runtime.flush_data(self)
+        return self.value
+
     def flush_trace(self) -> None:
         runtime_singleton.runtime.flush_data(self)
         assert self.value is not None
@@ -0,0 +1,183 @@
+from contextlib import contextmanager
+import hashlib
+import json
+import os
+from pathlib import Path
+import shutil
+from typing import Dict, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from pykokkos.interface import ExecutionSpace
+
+
+class KernelCache:
+    """
+    A content-addressed store of compiled kernels. Entries are keyed
+    by the generated C++ source and the configuration used to build
+    it, so any application that generates the same C++ reuses the
+    same compiled module regardless of where it is run from.
+    """
+
+    def __init__(self):
+        self.cache_dir_env: str = "PK_CACHE_DIR"
+
+        # Translation embeds the module name in the bindings, but the
+        # module name is derived from the key, so the bindings are
+        # hashed with this placeholder in its place
+        self.module_placeholder: str = "pk_module_placeholder"
+
+    def get_root(self) -> Path:
+        """
+        Get the root directory of the cache. This is $PK_CACHE_DIR if
+        set, and the pykokkos directory in the user's cache directory
+        otherwise.
+
+        :returns: the path to the cache root
+        """
+
+        if self.cache_dir_env in os.environ:
+            return Path(os.environ[self.cache_dir_env])
+
+        cache_home: str = os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+        return Path(cache_home) / "pykokkos"
+
+    def get_key(self, sources: List[List[str]], build_config: Dict[str, str]) -> str:
+        """
+        Hash the generated C++ source and build configuration into a
+        cache key
+
+        :param sources: the generated source files, with the module name
+            replaced by the placeholder
+        :param build_config: everything else that affects the compiled
+            module (compiler, flags, Kokkos version, execution space)
+        :returns: the key as a hex string
+        """
+
+        h = hashlib.sha256()
+        for source in sources:
+            h.update("\n".join(source).encode())
+            h.update(b"\0")
+        h.update(json.dumps(build_config, sort_keys=True).encode())
+
+        return h.hexdigest()
+
+    def get_module_name(self, key: str) -> str:
+        """
+        Get the name of the compiled Python module for a cache entry
+
+        :param key: the cache key
+        :returns: the module name
+        """
+
+        return f"kernel_{key}"
+
+    def get_output_dir(self, key: str, space: ExecutionSpace) -> Path:
+        """
+        Get the directory holding the compiled module for a cache entry.
+        The shared functor headers are written to its parent.
+
+        :param key: the cache key
+        :param space: the execution space the entry was compiled for
+        :returns: the path to the output directory
+        """
+
+        return self.get_root() / key / space.value
+
+    def contains(self, key: str, space: ExecutionSpace, module_file: str) -> bool:
+        """
+        Check if a cache entry has a compiled module
+
+        :param key: the cache key
+        :param space: the execution space the entry was compiled for
+        :param module_file: the file name of the compiled module
+        :returns: True if the module exists
+        """
+
+        return (self.get_output_dir(key, space) / module_file).is_file()
+
+    @contextmanager
+    def lock(self, key: str, space: ExecutionSpace) -> Iterator[None]:
+        """
+        Hold an exclusive lock on a cache entry while it is built, so
+        that when several processes need the same module, one builds it
+        while the others wait and then load it. The lock is released by
+        the OS if the process holding it dies. Without fcntl, no lock is
+        taken.
+
+        :param key: the cache key
+        :param space: the execution space the entry is compiled for
+        """
+
+        output_dir: Path = self.get_output_dir(key, space)
+        os.makedirs(output_dir.parent, exist_ok=True)
+        if fcntl is None:
+            yield
+            return
+
+        with open(output_dir.parent / f".{space.value}.lock", "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                self.remove_stale_builds(output_dir)
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def remove_stale_builds(self, output_dir: Path) -> None:
+        """
+        Remove the build directories of an entry, named
+        .<name>.<pid>.<thread id>, that were left behind by processes
+        that died while building it
+
+        :param output_dir: the output directory of the entry
+        """
+
+        for build_dir in output_dir.parent.glob(f".{output_dir.name}.*.*"):
+            pid: str = build_dir.name[len(output_dir.name) + 2:].split(".")[0]
+            if not pid.isdigit() or int(pid) == os.getpid() or not build_dir.is_dir():
+                continue
+
+            try:
+                os.kill(int(pid), 0)
+            except ProcessLookupError:
+                shutil.rmtree(build_dir, ignore_errors=True)
+            except OSError:
+                # the process exists but belongs to another user
+                pass
+
+    def get_pch_dir(self, build_config: Dict[str, str]) -> Path:
+        """
+        Get the directory holding the precompiled header for a build
+        configuration. The header only depends on the configuration,
+        so it is shared by all entries built with it.
+
+        :param build_config: the build configuration, excluding the
+            compilation target
+        :returns: the path to the precompiled header directory
+        """
+
+        h = hashlib.sha256(json.dumps(build_config, sort_keys=True).encode())
+        return self.get_root() / "pch" / h.hexdigest()
+
+    def get_profile_hash(self, profile_dir: Path) -> Optional[str]:
+        """
+        Hash the profiles recorded by an instrumented module, so that
+        modules optimized with them are rebuilt when they change
+
+        :param profile_dir: the output directory of the instrumented module
+        :returns: the hash as a hex string, or None if there are no profiles
+        """
+
+        profiles: List[Path] = sorted(profile_dir.glob("*.gcda"))
+        if len(profiles) == 0:
+            return None
+
+        h = hashlib.sha256()
+        for profile in profiles:
+            h.update(profile.name.encode())
+            h.update(profile.read_bytes())
+
+        return h.hexdigest()
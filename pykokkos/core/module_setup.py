@@ -1,16 +1,23 @@
 from dataclasses import dataclass
 import hashlib
 import inspect
+import json
 import os
 from pathlib import Path
+import pickle
 import sys
 import sysconfig
-from typing import Callable, List, Optional, Set, Union
+import threading
+from typing import Any, Callable, Dict, List, Optional, Set, TYPE_CHECKING, Union
 
 from pykokkos.interface import ExecutionSpace
 import pykokkos.kokkos_manager as km
 
-from .cpp_setup import CppSetup
+from .cpp_setup import get_pgo_mode
+from .kernel_cache import KernelCache
+
+if TYPE_CHECKING:
+    from pykokkos.core.translators import PyKokkosMembers
 
 BASE_DIR: str = "pk_cpp"
 
@@ -114,6 +121,20 @@ class ModuleSetup:
         # The path to the main file if using the console
         self.console_main: str = "pk_console"
 
+        # The file in the output directory recording which kernel cache
+        # entry holds the compiled module
+        self.link_file: str = "module.json"
+        self.linked: bool = False
+
+        # The file in the output directory holding the members extracted
+        # from the Python source, so that a new process can skip parsing
+        # and translating it
+        self.members_file: str = "members.pickle"
+
+        self.pgo: Optional[str] = None
+        if self.metadata[0].name is not None:
+            self.pgo = get_pgo_mode([m.name for m in self.metadata])
+
         self.main: Path = self.get_main_path()
         self.output_dir: Optional[Path] = self.get_output_dir(self.main, self.metadata, space, types_signature, self.restrict_signature)
         self.gpu_module_files: List[str] = []
@@ -121,11 +142,202 @@ class ModuleSetup:
             self.gpu_module_files = [f"kernel{device_id}{suffix}" for device_id in range(km.get_num_gpus())]
 
         if self.output_dir is not None:
-            self.path: str = os.path.join(self.output_dir, self.module_file)
-            if km.is_multi_gpu_enabled():
-                self.gpu_module_paths: str = [os.path.join(self.output_dir, module_file) for module_file in self.gpu_module_files]
+            path: str = os.path.join(self.output_dir, self.module_file)
+            self.set_module(hashlib.sha256(path.encode()).hexdigest(), self.output_dir)
+
+    def set_module(self, name: str, module_dir: Path) -> None:
+        """
+        Set the name and location of the compiled module
+
+        :param name: the name of the compiled module
+        :param module_dir: the directory containing the compiled module
+        """
+
+        self.name: str = name
+        self.path: str = os.path.join(module_dir, self.module_file)
+        if km.is_multi_gpu_enabled():
+            self.gpu_module_paths: List[str] = [os.path.join(module_dir, module_file) for module_file in self.gpu_module_files]
+
+    def write_link(
+        self,
+        key: str,
+        name: str,
+        fingerprint: str,
+        sources: Optional[Dict[str, str]] = None,
+        members: Optional[bytes] = None,
+        pgo: Optional[str] = None,
+        inference: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> None:
+        """
+        Record the kernel cache entry holding the compiled module in the
+        output directory
+
+        :param key: the kernel cache key
+        :param name: the name of the compiled module
+        :param fingerprint: the fingerprint of the Python source the
+            module was translated from
+        :param sources: the hashes of the source files returned by
+            get_source_hashes(), needed to reuse the members
+        :param members: the pickled members returned by dump_members()
+        :param pgo: the PGO mode the module was built with, or
+            "unprofiled" if "use" found no profile
+        :param inference: the types inferred for the entity, keyed by
+            the dispatches they were inferred for, recorded with the
+            members so that find_inference() can skip type inference
+        """
+
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        # The requested PGO mode invalidates the link when PK_PGO
+        # changes, the effective one is reported by get_pgo_status()
+        link: Dict[str, Any] = {"key": key, "name": name, "fingerprint": fingerprint, "pgo_mode": self.pgo, "pgo": pgo}
+        if sources is not None and members is not None:
+            # Written first so that the link never refers to members
+            # from an older version of the source
+            tmp: Path = self.output_dir / f"{self.members_file}.{os.getpid()}.{threading.get_ident()}"
+            with open(tmp, "wb") as f:
+                f.write(members)
+            os.replace(tmp, self.output_dir / self.members_file)
+            link["sources"] = sources
+            if inference:
+                link["inference"] = inference
+
+        # Other processes may be reading the link
+        link_tmp: Path = self.output_dir / f"{self.link_file}.{os.getpid()}.{threading.get_ident()}"
+        with open(link_tmp, "w") as f:
+            json.dump(link, f)
+        os.replace(link_tmp, self.output_dir / self.link_file)
+
+        self.linked = True
+
+    def read_link(self) -> Optional[Dict[str, Any]]:
+        """
+        Read the kernel cache entry recorded in the output directory
+
+        :returns: a dict containing the key and module name, or None if
+            the module has not been compiled
+        """
+
+        try:
+            with open(self.output_dir / self.link_file, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def get_source_hashes(self) -> Dict[str, str]:
+        """
+        Hash the contents of the files containing the entities. This is
+        much cheaper than the fingerprint, which requires parsing them,
+        but is invalidated by any edit to the files.
+
+        :returns: a dict from file path to hash
+        """
+
+        hashes: Dict[str, str] = {}
+        for m in self.metadata:
+            with open(m.path, "rb") as f:
+                hashes[m.path] = hashlib.sha256(f.read()).hexdigest()
+
+        return hashes
+
+    @staticmethod
+    def dump_members(members: "PyKokkosMembers") -> Optional[bytes]:
+        """
+        Serialize the members extracted from an entity
+
+        :param members: the members of the entity
+        :returns: the pickled members, or None if they cannot be pickled
+        """
+
+        try:
+            return pickle.dumps(members, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, RecursionError, TypeError, AttributeError):
+            return None
+
+    def load_members(self) -> Optional["PyKokkosMembers"]:
+        """
+        Load the members recorded next to the compiled module if none of
+        the source files changed since they were written. If they are
+        loaded, point this module setup to the compiled module in the
+        kernel cache.
+
+        :returns: the members, or None if they are missing or out of date
+        """
 
-            self.name: str = hashlib.sha256(self.path.encode()).hexdigest()
+        if self.output_dir is None:
+            return None
+
+        link: Optional[Dict[str, Any]] = self.read_link()
+        if link is None or "sources" not in link or not self.is_pgo_current(link):
+            return None
+
+        try:
+            if link["sources"] != self.get_source_hashes():
+                return None
+        except OSError:
+            return None
+
+        space: ExecutionSpace = km.get_default_space() if self.space is ExecutionSpace.Default else self.space
+        module_dir: Path = KernelCache().get_output_dir(link["key"], space)
+        if not (module_dir / self.module_file).is_file():
+            return None
+
+        members: "PyKokkosMembers"
+        try:
+            with open(self.output_dir / self.members_file, "rb") as f:
+                members = pickle.load(f)
+        except Exception:
+            # Missing, truncated, or written by an incompatible version
+            # of PyKokkos
+            return None
+
+        self.set_module(link["name"], module_dir)
+        self.linked = True
+
+        return members
+
+    def find_inference(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the types inferred for a dispatch of this entity by an
+        earlier process. Each compiled variant of the entity lives in
+        its own output directory, named after the types signature, so
+        the links of all of them are searched. Only types recorded
+        against the current source are returned. This module setup
+        must have been created without a types signature.
+
+        :param key: the key identifying the argument types of the dispatch
+        :returns: the recorded inference, with the types signature under
+            "types_signature", or None if there is none
+        """
+
+        if self.output_dir is None or len(self.metadata) != 1:
+            return None
+
+        links: List[Path] = [self.output_dir / self.link_file]
+        links.extend(self.output_dir.parent.glob(f"types_*/{self.output_dir.name}/{self.link_file}"))
+
+        sources: Optional[Dict[str, str]] = None
+        for path in links:
+            try:
+                with open(path, "r") as f:
+                    link: Dict[str, Any] = json.load(f)
+            except (OSError, ValueError):
+                continue
+
+            inference: Optional[Dict[str, Any]] = link.get("inference", {}).get(key)
+            if inference is None:
+                continue
+
+            if sources is None:
+                try:
+                    sources = self.get_source_hashes()
+                except OSError:
+                    return None
+
+            if link.get("sources") == sources:
+                return inference
+
+        return None
 
     def get_output_dir(
         self,
@@ -219,9 +431,65 @@ class ModuleSetup:
 
         return Path(self.console_main)
 
-    def is_compiled(self) -> bool:
+    def is_compiled(self, fingerprint: str) -> bool:
         """
-        Check if this module is compiled for its execution space
+        Check if this module is compiled for its execution space and is
+        up to date with the Python source. If it is, point this module
+        setup to the compiled module in the kernel cache.
+
+        :param fingerprint: the fingerprint of the current Python source
+        :returns: True if an up to date module exists
         """
 
-        return CppSetup.is_compiled(self.get_output_dir(self.main, self.metadata, self.space, self.types_signature, self.restrict_signature))
\ No newline at end of file
+        if self.output_dir is None:
+            return False
+
+        link: Optional[Dict[str, str]] = self.read_link()
+        if link is None or link.get("fingerprint") != fingerprint or not self.is_pgo_current(link):
+            return False
+
+        space: ExecutionSpace = km.get_default_space() if self.space is ExecutionSpace.Default else self.space
+        module_dir: Path = KernelCache().get_output_dir(link["key"], space)
+        if not (module_dir / self.module_file).is_file():
+            return False
+
+        self.set_module(link["name"], module_dir)
+        self.linked = True
+
+        return True
+
+    def is_pgo_current(self, link: Dict[str, Any]) -> bool:
+        """
+        Check if the module recorded in a link was built for the current
+        PGO mode. Modules that were meant to use a profile but did not
+        find one are rebuilt in case it has been recorded since.
+
+        :param link: the link returned by read_link()
+        :returns: True if the module can be reused
+        """
+
+        return link.get("pgo_mode") == self.pgo and link.get("pgo") != "unprofiled"
+
+    def get_pgo_status(self) -> Optional[str]:
+        """
+        Get the profile-guided optimization status of the compiled module
+
+        :returns: "instrumented" if it records a profile when the process
+            exits, "profiled" once it has recorded one, "optimized" if it
+            was rebuilt with a profile, "unprofiled" if it was rebuilt
+            without finding one, or None if PGO was not used
+        """
+
+        if self.output_dir is None:
+            return None
+
+        link: Optional[Dict[str, Any]] = self.read_link()
+        if link is None or link.get("pgo") is None:
+            return None
+
+        if link["pgo"] == "generate":
+            space: ExecutionSpace = km.get_default_space() if self.space is ExecutionSpace.Default else self.space
+            module_dir: Path = KernelCache().get_output_dir(link["key"], space)
+            return "profiled" if any(module_dir.glob("*.gcda")) else "instrumented"
+
+        return "optimized" if link["pgo"] == "use" else "unprofiled"
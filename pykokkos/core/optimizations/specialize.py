@@ -0,0 +1,93 @@
+import ast
+import copy
+import hashlib
+import math
+from numbers import Integral
+from typing import Any, Dict, List, Tuple, Union
+
+
+class SpecializationTransformer(ast.NodeTransformer):
+    """
+    Replace the uses of specialized parameters with their values
+    """
+
+    def __init__(self, values: Dict[str, Union[bool, int, float]]):
+        """
+        SpecializationTransformer constructor
+
+        :param values: a dict mapping from parameter name to value
+        """
+
+        self.values: Dict[str, Union[bool, int, float]] = values
+
+    def visit_Name(self, node: ast.Name) -> ast.expr:
+        if node.id not in self.values:
+            return node
+
+        if not isinstance(node.ctx, ast.Load):
+            raise ValueError(f"ERROR: cannot specialize '{node.id}' as it is assigned to in the workunit")
+
+        return ast.copy_location(ast.Constant(value=self.values[node.id]), node)
+
+
+def get_specialized_values(names: List[str], kwargs: Dict[str, Any]) -> Tuple[Dict[str, Union[bool, int, float]], str]:
+    """
+    Get the values of the parameters a workunit is specialized on from
+    the arguments passed to the dispatch
+
+    :param names: the names of the parameters to specialize
+    :param kwargs: the keyword arguments passed to the workunit
+    :returns: a dict mapping from parameter name to value and a unique
+        identifier of the values
+    """
+
+    values: Dict[str, Union[bool, int, float]] = {}
+    for name in names:
+        if name not in kwargs:
+            raise ValueError(f"ERROR: cannot specialize '{name}' as it was not passed to the workunit")
+
+        value: Any = kwargs[name]
+        if isinstance(value, bool):
+            values[name] = value
+        elif isinstance(value, Integral):
+            values[name] = int(value)
+        elif isinstance(value, float) and math.isfinite(value):
+            # float32 values are not specialized since the literal
+            # would change the precision of the computation
+            values[name] = float(value)
+        else:
+            raise TypeError(f"ERROR: cannot specialize '{name}' with value {value!r}, only bool, int, and finite double values can be specialized")
+
+    signature: str = hashlib.md5(repr(sorted(values.items())).encode()).hexdigest()
+
+    return values, signature
+
+
+def specialize_workunit(AST: ast.FunctionDef, values: Dict[str, Union[bool, int, float]]) -> ast.FunctionDef:
+    """
+    Make a copy of a workunit with the specialized parameters removed
+    and their uses replaced by literals, so that the C++ compiler sees
+    them as compile-time constants
+
+    :param AST: the AST of the workunit
+    :param values: a dict mapping from parameter name to value
+    :returns: the AST of the specialized workunit
+    """
+
+    # Share everything above the workunit instead of copying the
+    # whole module through the parent references
+    memo: Dict[int, Any] = {}
+    if hasattr(AST, "parent"):
+        memo[id(AST.parent)] = AST.parent
+
+    specialized: ast.FunctionDef = copy.deepcopy(AST, memo)
+    specialized.args.args = [a for a in specialized.args.args if a.arg not in values]
+
+    for decorator in specialized.decorator_list:
+        if isinstance(decorator, ast.Call):
+            decorator.keywords = [k for k in decorator.keywords if k.arg != "specialize"]
+
+    transformer = SpecializationTransformer(values)
+    specialized.body = [transformer.visit(node) for node in specialized.body]
+
+    return specialized
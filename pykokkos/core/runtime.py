@@ -1,7 +1,12 @@
+import concurrent.futures
+from dataclasses import dataclass
+from enum import Enum
+import hashlib
 import importlib.util
 import os
 from pathlib import Path
 import sys
+import threading
 from typing import Any, Callable, Dict, Optional, Set, Tuple, Type, Union, List
 import sysconfig
 
@@ -9,7 +14,7 @@ import numpy as np
 
 from pykokkos.core.fusion import fuse_workunit_kwargs_and_params, Future, Tracer, TracerOperation
 from pykokkos.core.keywords import Keywords
-from pykokkos.core.optimizations import get_restrict_views
+from pykokkos.core.optimizations import get_restrict_views, get_specialized_values
 from pykokkos.core.parsers import Parser
 from pykokkos.core.translators import PyKokkosMembers
 from pykokkos.core.visitors import visitors_util
@@ -17,9 +22,9 @@ from pykokkos.core.type_inference import (
     UpdatedTypes, UpdatedDecorator, get_type_info, 
 )
 from pykokkos.interface import (
-    DataType, ExecutionPolicy, ExecutionSpace, MemorySpace,
-    RandomPool, RangePolicy, TeamPolicy, View, ViewType,
-    is_host_execution_space
+    DataType, ExecutionPolicy, ExecutionSpace, Graph, Layout, MDRangePolicy, MemorySpace,
+    RandomPool, RangePolicy, Subview, TeamPolicy, Trait, View, ViewType,
+    get_default_layout, get_default_memory_space, is_host_execution_space
 )
 import pykokkos.kokkos_manager as km
 
@@ -28,6 +33,20 @@ from .module_setup import EntityMetadata, get_metadata, ModuleSetup
 from .run_debug import run_workload_debug, run_workunit_debug
 
 
+@dataclass
+class DispatchPlan:
+    """
+    Everything needed to repeat a workunit dispatch without going
+    through type inference, compilation checks, and module lookup
+    """
+
+    wrapper: Callable[..., Optional[Union[float, int]]]
+    fields: List[str] # the names of the scalar arguments passed to the wrapper
+    views: List[str] # the names of the view arguments passed to the wrapper
+    randpools: List[str] # the names of the random pool arguments
+    path: str # the path to the file containing the workunit
+
+
 class Runtime:
     """
     Executes (and optionally compiles) PyKokkos workloads
@@ -40,8 +59,48 @@ class Runtime:
         # cache module_setup objects using a workload/workunit and space tuple
         self.module_setups: Dict[Tuple, ModuleSetup] = {}
 
+        # maps from (path, workunit name, space) to the members, module
+        # name, and module directory of batch compiled workunits
+        self.batch_modules: Dict[Tuple[str, str, ExecutionSpace], Tuple[PyKokkosMembers, str, Path]] = {}
+        self.batch_module_setups: Dict[Tuple, ModuleSetup] = {}
+
         self.fusion_strategy: Optional[str] = os.getenv("PK_FUSION")
 
+        # When set, workunits are compiled in the background and run in
+        # Python until their module is ready
+        self.tiered_policy: Optional[Union[str, int]] = self.get_tiered_policy()
+        self.tier_counts: Dict[str, int] = {"native": 0, "fallback": 0}
+
+        # maps from specialized workunit to the signatures of the values
+        # it was specialized on, capped by PK_MAX_SPECIALIZATIONS
+        self.specializations: Dict[Callable[..., None], Set[str]] = {}
+
+        # maps from the workunit, operation, policy, and argument types
+        # of a dispatch to the plan to repeat it
+        self.dispatch_cache: Dict[Tuple, DispatchPlan] = {}
+
+        # the graph recording kernel launches inside pk.capture()
+        self.graph: Optional[Graph] = None
+
+        # When PK_ASYNC is set, workunits run in order on a background
+        # thread and dispatches return a Future right away. Tracing
+        # already delays execution, so PK_FUSION takes precedence.
+        self.async_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        if "PK_ASYNC" in os.environ and self.fusion_strategy is None:
+            self.async_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="pk_async")
+        self.pending: List[concurrent.futures.Future] = []
+        # maps from the id of the view owning some memory to that view
+        # and the last pending dispatch using it. The view is kept so
+        # that its id cannot be reused while the entry exists
+        self.pending_views: Dict[int, Tuple[ViewType, concurrent.futures.Future]] = {}
+
+        # Guards the state above when dispatching from several threads
+        self.lock = threading.RLock()
+        # maps from a workunit to the lock held while its types are
+        # inferred and it is compiled, so that a new workunit is built
+        # by one thread while the others wait
+        self.workunit_locks: Dict[Any, threading.RLock] = {}
+
     def run_workload(self, space: ExecutionSpace, workload: object) -> None:
         """
         Run the workload
@@ -50,6 +109,12 @@ class Runtime:
         :param workload: the workload object
         """
 
+        if self.graph is not None:
+            raise RuntimeError("ERROR: workloads cannot be run inside pk.capture()")
+
+        # workloads run synchronously, after everything queued before
+        self.fence()
+
         if self.is_debug(space):
             run_workload_debug(workload)
             return
@@ -69,6 +134,9 @@ class Runtime:
         types_signature: Optional[str],
         restrict_views: Set[str],
         restrict_signature: Optional[str],
+        async_build: bool = False,
+        specialization: Optional[Dict[str, Any]] = None,
+        inference: Optional[Dict[str, Dict[str, Any]]] = None,
         **kwargs,
     ) -> PyKokkosMembers:
         """
@@ -79,6 +147,9 @@ class Runtime:
         :param updated_decorator: Object for decorator specifier
         :param updated_types: Object with type inference information
         :param restrict_views: a set of view names that do not alias any other views
+        :param async_build: whether to run the C++ compiler in the background
+        :param specialization: the values of the parameters compiled into the kernel
+        :param inference: the inferred types to record with the members
         :returns: the members the functor is containing
         """
 
@@ -87,10 +158,135 @@ class Runtime:
                                                                 space, km.is_uvm_enabled(),
                                                                 updated_decorator,
                                                                 updated_types, types_signature,
-                                                                restrict_views, **kwargs)
+                                                                restrict_views, async_build,
+                                                                specialization, inference, **kwargs)
 
         return members
 
+    def precompile(
+        self,
+        workunits: List[Tuple[ExecutionPolicy, Callable[..., None], str, Dict[str, Any]]],
+        wait: bool = True
+    ) -> None:
+        """
+        Translate a list of workunits on the calling thread and compile
+        them concurrently in the background
+
+        :param workunits: a list of (policy, workunit, operation, kwargs) tuples
+        :param wait: whether to block until all compilations finish
+        """
+
+        for policy, workunit, operation, kwargs in workunits:
+            if self.is_debug(policy.space):
+                continue
+
+            self.prepare_workunit(policy, workunit, operation, None, True, **kwargs)
+
+        if wait:
+            self.compiler.wait_for_all_builds()
+
+    def batch_compile(
+        self,
+        path: str,
+        names: Optional[List[str]],
+        space: ExecutionSpace
+    ) -> List[str]:
+        """
+        Compile a group of workunits from one file into a single module.
+        Later dispatches of these workunits call into that module
+        instead of compiling each workunit separately.
+
+        :param path: the path to the file containing the workunits
+        :param names: the names of the workunits to compile, or None for
+            all workunits in the file
+        :param space: the execution space to compile for
+        :returns: the names of the workunits that were compiled
+        """
+
+        if self.is_debug(space):
+            return []
+
+        if space is ExecutionSpace.Default:
+            space = km.get_default_space()
+
+        batch: Optional[Tuple[str, Path, Dict[str, PyKokkosMembers]]]
+        batch = self.compiler.compile_batch(path, names, space, km.is_uvm_enabled())
+        if batch is None:
+            return []
+
+        module_name, module_dir, batch_members = batch
+        for name, members in batch_members.items():
+            self.batch_modules[(path, name, space)] = (members, module_name, module_dir)
+
+        self.batch_module_setups.clear()
+        self.dispatch_cache.clear()
+
+        return list(batch_members.keys())
+
+    def get_pgo_status(self) -> Dict[str, str]:
+        """
+        Get the profile-guided optimization status of each kernel
+        dispatched by this process and compiled with PK_PGO set
+
+        :returns: a dict from kernel name to status
+        """
+
+        status: Dict[str, str] = {}
+        for module_setup in self.module_setups.values():
+            module_status: Optional[str] = module_setup.get_pgo_status()
+            if module_status is not None:
+                status["_".join(m.name for m in module_setup.metadata)] = module_status
+
+        return status
+
+    def get_batch_workunit(
+        self,
+        workunit: Union[Callable[..., None], List[Callable[..., None]]],
+        space: ExecutionSpace,
+        updated_decorator: Optional[UpdatedDecorator]
+    ) -> Optional[Tuple[PyKokkosMembers, ModuleSetup]]:
+        """
+        Get the batch compiled module of a workunit if it can be used
+        for this dispatch. The batch module is translated without
+        inferred view decorators, so it is only used when the views
+        passed have the default layout, memory space, and trait.
+
+        :param workunit: the workunit function object
+        :param space: the execution space of the dispatch
+        :param updated_decorator: the inferred view decorators
+        :returns: the members of the workunit and its module setup, or
+            None if the workunit has to be compiled on its own
+        """
+
+        if len(self.batch_modules) == 0 or isinstance(workunit, list) or km.is_multi_gpu_enabled():
+            return None
+
+        if space is ExecutionSpace.Default:
+            space = km.get_default_space()
+
+        metadata: EntityMetadata = get_metadata(workunit)
+        batch: Optional[Tuple[PyKokkosMembers, str, Path]] = self.batch_modules.get((metadata.path, metadata.name, space))
+        if batch is None:
+            return None
+
+        if updated_decorator is not None:
+            memory_space: MemorySpace = get_default_memory_space(space)
+            layout: Layout = get_default_layout(memory_space)
+            for specifiers in updated_decorator.inferred_decorator.values():
+                if (specifiers["layout"] != layout.name
+                        or specifiers["space"] != memory_space.name
+                        or specifiers["trait"] != Trait.TraitDefault.name):
+                    return None
+
+        members, module_name, module_dir = batch
+        module_setup_id: Tuple = (workunit, space)
+        if module_setup_id not in self.batch_module_setups:
+            module_setup = ModuleSetup(workunit, space)
+            module_setup.set_module(module_name, module_dir)
+            self.batch_module_setups[module_setup_id] = module_setup
+
+        return members, self.batch_module_setups[module_setup_id]
+
     def compile_into_module(
         self,
         main: Path,
@@ -130,27 +326,419 @@ class Runtime:
         if self.is_debug(policy.space):
             if operation is None:
                 raise RuntimeError("ERROR: operation cannot be None for Debug")
+            if self.graph is not None:
+                raise RuntimeError("ERROR: workunits cannot be captured in the Debug execution space")
+            self.fence()
             return run_workunit_debug(policy, workunit, operation, initial_value, **kwargs)
 
-        metadata: EntityMetadata
-        parser: Union[Parser, List[Parser]]
+        if self.async_executor is not None and self.graph is None and not self.is_async_worker():
+            return self.run_async(name, policy, workunit, operation, initial_value, kwargs)
 
-        if isinstance(workunit, list):
-            metadata = get_metadata(workunit[0])
-            parser = []
-            for this_workunit in workunit:
-                this_metadata = get_metadata(this_workunit)
-                parser.append(self.compiler.get_parser(this_metadata.path))
-        else:
-            metadata = get_metadata(workunit)
-            parser = self.compiler.get_parser(metadata.path)
+        dispatch_key: Optional[Tuple] = self.get_dispatch_key(policy, workunit, operation, kwargs)
+        if dispatch_key is not None:
+            plan: Optional[DispatchPlan] = self.dispatch_cache.get(dispatch_key)
+            if plan is not None:
+                return self.run_dispatch_plan(plan, name, policy, kwargs)
+
+        metadata: EntityMetadata = get_metadata(workunit[0] if isinstance(workunit, list) else workunit)
 
         if self.fusion_strategy is not None:
             future = Future()
-            self.tracer.log_operation(future, name, policy, workunit, operation, parser, metadata.name, **kwargs)
+            with self.lock:
+                self.tracer.log_operation(future, name, policy, workunit, operation, self.get_parsers(workunit), metadata.name, **kwargs)
             return future
 
-        return self.execute_workunit(name, policy, workunit, operation, parser, **kwargs)
+        if self.tiered_policy is not None:
+            return self.execute_tiered(name, policy, workunit, operation, self.get_parsers(workunit), initial_value, **kwargs)
+
+        if dispatch_key is None:
+            return self.execute_workunit(name, policy, workunit, operation, self.get_parsers(workunit), **kwargs)
+
+        # The plan is checked against the source once, when it is made:
+        # an edit made while compiling means the module may not match
+        # the file. Later edits are picked up through invalidate_source().
+        mtime: int = os.stat(metadata.path).st_mtime_ns
+
+        members: PyKokkosMembers
+        module_setup: ModuleSetup
+        members, module_setup = self.prepare_workunit(policy, workunit, operation, None, False, **kwargs)
+        result = self.execute(workunit, module_setup, members, policy.space.space, policy=policy, name=name, operation=operation, **kwargs)
+
+        if os.stat(metadata.path).st_mtime_ns == mtime:
+            self.dispatch_cache[dispatch_key] = self.get_dispatch_plan(workunit, members, module_setup, policy, operation, metadata.path, kwargs)
+        else:
+            self.invalidate_source(metadata.path)
+
+        return result
+
+    def get_parsers(self, workunit: Union[Callable[..., None], List[Callable[..., None]]]) -> Union[Parser, List[Parser]]:
+        """
+        Get the parser of the file containing a workunit, or of each
+        workunit to be fused
+
+        :param workunit: the workunit function object
+        :returns: the Parser object or list of Parser objects
+        """
+
+        if isinstance(workunit, list):
+            return [self.compiler.get_parser(get_metadata(w).path) for w in workunit]
+
+        return self.compiler.get_parser(get_metadata(workunit).path)
+
+    @staticmethod
+    def get_inference_key(dispatch_key: Tuple) -> str:
+        """
+        Get a key identifying the argument types of a dispatch that
+        stays the same across processes. The types inferred for a
+        workunit only depend on what is in the dispatch key.
+
+        :param dispatch_key: the key returned by get_dispatch_key()
+        :returns: the key as a hex string
+        """
+
+        def describe(value: Any) -> str:
+            if isinstance(value, type):
+                return f"{value.__module__}.{value.__qualname__}"
+            if isinstance(value, Enum):
+                return f"{type(value).__name__}.{value.name}"
+            if isinstance(value, tuple):
+                return "(" + ",".join(describe(v) for v in value) + ")"
+
+            return repr(value)
+
+        _, operation, policy_key, arguments = dispatch_key
+
+        return hashlib.sha256(describe((operation, policy_key, arguments)).encode()).hexdigest()
+
+    def run_async(
+        self,
+        name: Optional[str],
+        policy: ExecutionPolicy,
+        workunit: Union[Callable[..., None], List[Callable[..., None]]],
+        operation: str,
+        initial_value: Union[float, int],
+        kwargs: Dict[str, Any]
+    ) -> Future:
+        """
+        Queue a dispatch on the background thread
+
+        :param name: the name of the kernel
+        :param policy: the execution policy of the operation
+        :param workunit: the workunit function object
+        :param operation: the name of the operation "for", "reduce", or "scan"
+        :param initial_value: the initial value of the accumulator
+        :param kwargs: the keyword arguments passed to the workunit
+        :returns: a Future holding the result once the dispatch has run
+        """
+
+        future = Future()
+
+        def dispatch() -> None:
+            # Set here rather than when waited on, so that later
+            # dispatches taking the Future as an argument see the value
+            future.value = self.run_workunit(name, policy, workunit, operation, initial_value, **kwargs)
+
+        future.pending = self.async_executor.submit(dispatch)
+
+        entities: List[Any] = list(kwargs.values())
+        if hasattr(workunit, "__self__"):
+            entities.extend(workunit.__self__.__dict__.values())
+
+        with self.lock:
+            # Keep failed dispatches so that fence() raises their errors
+            self.pending = [p for p in self.pending if not p.done() or p.exception() is not None]
+            self.pending.append(future.pending)
+            self.pending_views = {k: v for k, v in self.pending_views.items() if not v[1].done() or v[1].exception() is not None}
+
+            for entity in entities:
+                if isinstance(entity, ViewType):
+                    owner: ViewType = self.get_view_owner(entity)
+                    self.pending_views[id(owner)] = (owner, future.pending)
+
+        return future
+
+    @staticmethod
+    def get_view_owner(view: ViewType) -> ViewType:
+        """
+        Get the view owning the memory of a view, so that dispatches
+        writing through a subview are tracked under its parent
+
+        :param view: the view or subview
+        :returns: the base view of a subview, otherwise the view itself
+        """
+
+        if isinstance(view, Subview):
+            return view.base_view
+
+        return view
+
+    def shares_pending_memory(self, view: ViewType) -> bool:
+        """
+        Check if a view may share memory with a view used by a pending
+        dispatch, e.g. a View wrapping the data of another View
+
+        :param view: the view being accessed
+        :returns: True if the memory may overlap with a pending view
+        """
+
+        data = getattr(view, "_data", None)
+        if not isinstance(data, np.ndarray):
+            # the memory cannot be compared, so assume it overlaps
+            return len(self.pending_views) > 0
+
+        for pending_view, _ in self.pending_views.values():
+            pending_data = getattr(pending_view, "_data", None)
+            if not isinstance(pending_data, np.ndarray) or np.may_share_memory(data, pending_data):
+                return True
+
+        return False
+
+    def is_async_worker(self) -> bool:
+        """
+        Check if the caller is running on the PK_ASYNC background thread
+
+        :returns: True if called from a queued dispatch
+        """
+
+        return threading.current_thread().name.startswith("pk_async")
+
+    def fence(self) -> None:
+        """
+        Wait for all dispatches queued with PK_ASYNC to finish, raising
+        the first error any of them raised
+        """
+
+        if self.is_async_worker():
+            return
+
+        with self.lock:
+            pending: List[concurrent.futures.Future] = self.pending
+            self.pending = []
+            self.pending_views.clear()
+
+        for p in pending:
+            p.result()
+
+    def get_dispatch_key(
+        self,
+        policy: ExecutionPolicy,
+        workunit: Union[Callable[..., None], List[Callable[..., None]]],
+        operation: str,
+        kwargs: Dict[str, Any]
+    ) -> Optional[Tuple]:
+        """
+        Get the key identifying a dispatch in the dispatch cache. Two
+        dispatches with the same key run the same wrapper with the
+        arguments marshalled the same way, as the types inferred for the
+        workunit only depend on what is in the key.
+
+        :param policy: the execution policy of the operation
+        :param workunit: the workunit function object
+        :param operation: the name of the operation "for", "reduce", or "scan"
+        :param kwargs: the keyword arguments passed to the workunit
+        :returns: the key, or None if the dispatch cannot be cached
+        """
+
+        # Fused, traced, tiered, and restrict dispatches depend on more
+        # than the argument types, and functors are passed their fields
+        if (isinstance(workunit, list) or hasattr(workunit, "__self__") or self.fusion_strategy is not None
+                or self.tiered_policy is not None or "PK_RESTRICT" in os.environ or km.is_multi_gpu_enabled()):
+            return None
+
+        space: ExecutionSpace = policy.space.space
+        if space is ExecutionSpace.Default:
+            space = km.get_default_space()
+
+        policy_key: Tuple = (type(policy), space)
+        if isinstance(policy, MDRangePolicy):
+            policy_key += (len(policy.begin),)
+
+        # Values are only part of the key when they get their own
+        # module, so that values past PK_MAX_SPECIALIZATIONS share the
+        # plan of the generic module instead of growing the cache
+        specialized: List[str] = getattr(workunit, "pk_specialize", [])
+        if len(specialized) > 0 and not self.is_specialized(workunit, specialized, kwargs):
+            specialized = []
+
+        arguments: List[Tuple] = []
+        for k, v in kwargs.items():
+            if isinstance(v, ViewType):
+                arguments.append((k, type(v), v.dtype, v.layout, v.space, v.trait, len(v.shape)))
+            elif isinstance(v, Future):
+                return None
+            elif k in specialized:
+                arguments.append((k, type(v), v))
+            elif type(v) is int:
+                # large integers are inferred as int64
+                arguments.append((k, int, v.bit_length() > 31))
+            else:
+                arguments.append((k, type(v)))
+
+        return (workunit, operation, policy_key, tuple(arguments))
+
+    def get_dispatch_plan(
+        self,
+        workunit: Callable[..., None],
+        members: PyKokkosMembers,
+        module_setup: ModuleSetup,
+        policy: ExecutionPolicy,
+        operation: str,
+        path: str,
+        kwargs: Dict[str, Any]
+    ) -> DispatchPlan:
+        """
+        Make the plan to repeat a dispatch that just ran
+
+        :param workunit: the workunit function object
+        :param members: the members of the workunit
+        :param module_setup: the module setup of the workunit
+        :param policy: the execution policy of the operation
+        :param operation: the name of the operation "for", "reduce", or "scan"
+        :param path: the path to the file containing the workunit
+        :param kwargs: the keyword arguments passed to the workunit
+        :returns: the DispatchPlan object
+        """
+
+        module = self.import_module(module_setup.name, module_setup.path)
+        args: Dict[str, Any] = self.get_arguments(workunit, members, policy.space.space, policy, operation, **kwargs)
+
+        entity_members: Dict[str, Any] = {k: v for k, v in kwargs.items() if k not in members.specialized_params}
+        fields: List[str] = list(self.get_fields(entity_members).keys())
+        views: List[str] = list(self.get_views(entity_members).keys())
+        randpools: List[str] = [k for k, v in entity_members.items() if isinstance(v, RandomPool)]
+
+        return DispatchPlan(self.get_wrapper(workunit, members, args, module), fields, views, randpools, path)
+
+    def run_dispatch_plan(
+        self,
+        plan: DispatchPlan,
+        name: Optional[str],
+        policy: ExecutionPolicy,
+        kwargs: Dict[str, Any]
+    ) -> Optional[Union[float, int]]:
+        """
+        Run a dispatch from the dispatch cache
+
+        :param plan: the plan of the dispatch
+        :param name: the name of the kernel
+        :param policy: the execution policy of the operation
+        :param kwargs: the keyword arguments passed to the workunit
+        :returns: the result of the operation (None for parallel_for)
+        """
+
+        args: Dict[str, Any] = self.get_policy_arguments(policy)
+        for k in plan.fields:
+            args[k] = kwargs[k]
+        for k in plan.views:
+            args[k] = kwargs[k].array
+        args.update(self.get_randpool_args({k: kwargs[k] for k in plan.randpools}))
+        args["pk_kernel_name"] = "" if name is None else name
+
+        if self.graph is not None:
+            self.graph.record(plan.wrapper, args, {k: kwargs[k] for k in plan.views})
+
+        return plan.wrapper(**args)
+
+    def invalidate_source(self, path: str) -> None:
+        """
+        Drop everything derived from a source file that was modified, so
+        that its workunits are fingerprinted and compiled again
+
+        :param path: the path to the file
+        """
+
+        with self.lock:
+            self.dispatch_cache = {k: p for k, p in self.dispatch_cache.items() if p.path != path}
+        self.compiler.invalidate_source(path)
+
+    def get_tiered_policy(self) -> Optional[Union[str, int]]:
+        """
+        Read the tiered execution policy from PK_TIERED. "wait" always
+        waits for the native module, "fallback" runs in Python until the
+        module is ready, and an integer N runs in Python until the
+        module is ready only when the policy has fewer than N iterations.
+
+        :returns: the policy, or None if tiered execution is disabled
+        """
+
+        tiered: Optional[str] = os.getenv("PK_TIERED")
+        if tiered is None:
+            return None
+
+        if tiered in ("wait", "fallback"):
+            return tiered
+
+        if tiered.isdigit():
+            return int(tiered)
+
+        raise ValueError(f"ERROR: PK_TIERED must be 'wait', 'fallback', or an integer, got '{tiered}'")
+
+    def execute_tiered(
+        self,
+        name: Optional[str],
+        policy: ExecutionPolicy,
+        workunit: Union[Callable[..., None], List[Callable[..., None]]],
+        operation: str,
+        parser: Union[Parser, List[Parser]],
+        initial_value: Union[float, int],
+        **kwargs
+    ) -> Optional[Union[float, int]]:
+        """
+        Start compiling the workunit in the background and run it in
+        Python if its module is not ready yet and the tiered policy
+        allows it. Otherwise, run the native module.
+
+        :param name: the name of the kernel
+        :param policy: the execution policy of the operation
+        :param workunit: the workunit function object
+        :param operation: the name of the operation "for", "reduce", or "scan"
+        :param parser: the parser containing the AST of the workunit
+        :param initial_value: the initial value of the accumulator
+        :param kwargs: the keyword arguments passed to the workunit
+        :returns: the result of the operation (None for parallel_for)
+        """
+
+        members: PyKokkosMembers
+        module_setup: ModuleSetup
+        members, module_setup = self.prepare_workunit(policy, workunit, operation, parser, True, **kwargs)
+
+        if self.compiler.is_build_pending(module_setup.output_dir) and self.use_fallback(policy, workunit):
+            with self.lock:
+                self.tier_counts["fallback"] += 1
+            return run_workunit_debug(policy, workunit, operation, initial_value, **kwargs)
+
+        with self.lock:
+            self.tier_counts["native"] += 1
+        return self.execute(workunit, module_setup, members, policy.space.space, policy=policy, name=name, operation=operation, **kwargs)
+
+    def use_fallback(self, policy: ExecutionPolicy, workunit: Union[Callable[..., None], List[Callable[..., None]]]) -> bool:
+        """
+        Check if a dispatch can run in Python while its module is being
+        compiled. This requires a host execution space, as the views are
+        accessed from Python, and a range policy.
+
+        :param policy: the execution policy of the operation
+        :param workunit: the workunit function object
+        :returns: True if the dispatch should run in Python
+        """
+
+        # captured kernels have to run natively to be recorded
+        if self.tiered_policy == "wait" or isinstance(workunit, list) or self.graph is not None:
+            return False
+
+        if not isinstance(policy, (RangePolicy, MDRangePolicy)) or not is_host_execution_space(policy.space.space):
+            return False
+
+        if self.tiered_policy == "fallback":
+            return True
+
+        iterations: int
+        if isinstance(policy, MDRangePolicy):
+            iterations = int(np.prod([e - b for b, e in zip(policy.begin, policy.end)]))
+        else:
+            iterations = policy.end - policy.begin
+
+        return iterations < self.tiered_policy
 
 
     def execute_workunit(
@@ -174,32 +762,217 @@ class Runtime:
         :returns: the result of the operation (None for parallel_for)
         """
 
-        updated_types: Optional[UpdatedTypes]
-        updated_decorator: Optional[UpdatedDecorator]
-        types_signature: Optional[str]
+        members: PyKokkosMembers
+        module_setup: ModuleSetup
+        members, module_setup = self.prepare_workunit(policy, workunit, operation, parser, False, **kwargs)
 
-        updated_types, updated_decorator, types_signature = get_type_info(operation, parser, policy, workunit, kwargs)
-        restrict_views: Set[str] = set()
-        restrict_signature: Optional[str] = None
+        return self.execute(workunit, module_setup, members, policy.space.space, policy=policy, name=name, operation=operation, **kwargs)
 
-        if "PK_RESTRICT" in os.environ:
-            restrict_kwargs: Dict[str, Any]
+    def prepare_workunit(
+        self,
+        policy: ExecutionPolicy,
+        workunit: Union[Callable[..., None], List[Callable[..., None]]],
+        operation: str,
+        parser: Optional[Union[Parser, List[Parser]]],
+        async_build: bool,
+        **kwargs
+    ) -> Tuple[PyKokkosMembers, ModuleSetup]:
+        """
+        Infer the types of a workunit and translate and compile it if
+        needed
 
-            if self.fusion_strategy is not None and isinstance(workunit, list):
-                parsers = [self.compiler.get_parser(get_metadata(e).path) for e in workunit]
-                entity_trees = [this_parser.get_entity(get_metadata(this_entity).name).AST for this_entity, this_parser in zip(workunit, parsers)]
-                restrict_kwargs, _ = fuse_workunit_kwargs_and_params(entity_trees, kwargs, f"parallel_{operation}")
-            else:
-                restrict_kwargs = kwargs
+        :param policy: the execution policy of the operation
+        :param workunit: the workunit function object
+        :param operation: the name of the operation "for", "reduce", or "scan"
+        :param parser: the parser containing the AST of the workunit, or
+            None to parse the file only if it is needed
+        :param async_build: whether to run the C++ compiler in the background
+        :param kwargs: the keyword arguments passed to the workunit
+        :returns: the members of the workunit and its module setup
+        """
 
-            view_dict: Dict[str, ViewType] = {arg: view for arg, view in restrict_kwargs.items() if isinstance(view, ViewType)}
-            restrict_views, restrict_signature = get_restrict_views(view_dict)
+        with self.get_workunit_lock(workunit):
+            dispatch_key: Optional[Tuple] = self.get_dispatch_key(policy, workunit, operation, kwargs)
+            inference_key: Optional[str] = None
+            if dispatch_key is not None:
+                inference_key = self.get_inference_key(dispatch_key)
+                loaded: Optional[Tuple[PyKokkosMembers, ModuleSetup]] = self.load_workunit(policy, workunit, inference_key, kwargs)
+                if loaded is not None:
+                    return loaded
+
+            if parser is None:
+                parser = self.get_parsers(workunit)
+
+            updated_types: Optional[UpdatedTypes]
+            updated_decorator: Optional[UpdatedDecorator]
+            types_signature: Optional[str]
+
+            updated_types, updated_decorator, types_signature = get_type_info(operation, parser, policy, workunit, kwargs)
+
+            # Recorded with the members of the compiled workunit so that
+            # load_workunit() can skip parsing and type inference
+            inference: Optional[Dict[str, Dict[str, Any]]] = None
+            if inference_key is not None:
+                inference = {inference_key: {
+                    "types_signature": types_signature,
+                    "inferred_types": None if updated_types is None else updated_types.inferred_types,
+                    "inferred_decorator": None if updated_decorator is None else updated_decorator.inferred_decorator,
+                }}
+
+            specialization: Optional[Dict[str, Any]]
+            specialization_signature: Optional[str]
+            specialization, specialization_signature = self.get_specialization(workunit, kwargs)
+            if specialization_signature is not None:
+                # Each variant is a separate module, identified the same
+                # way as workunits with different argument types
+                types_signature = specialization_signature if types_signature is None else f"{types_signature}_{specialization_signature}"
+
+            if updated_types is None and specialization is None and "PK_RESTRICT" not in os.environ:
+                batch: Optional[Tuple[PyKokkosMembers, ModuleSetup]] = self.get_batch_workunit(workunit, policy.space.space, updated_decorator)
+                if batch is not None:
+                    return batch
+
+            restrict_views: Set[str] = set()
+            restrict_signature: Optional[str] = None
+
+            if "PK_RESTRICT" in os.environ:
+                restrict_kwargs: Dict[str, Any]
+
+                if self.fusion_strategy is not None and isinstance(workunit, list):
+                    parsers = [self.compiler.get_parser(get_metadata(e).path) for e in workunit]
+                    entity_trees = [this_parser.get_entity(get_metadata(this_entity).name).AST for this_entity, this_parser in zip(workunit, parsers)]
+                    restrict_kwargs, _ = fuse_workunit_kwargs_and_params(entity_trees, kwargs, f"parallel_{operation}")
+                else:
+                    restrict_kwargs = kwargs
+
+                view_dict: Dict[str, ViewType] = {arg: view for arg, view in restrict_kwargs.items() if isinstance(view, ViewType)}
+                restrict_views, restrict_signature = get_restrict_views(view_dict)
+
+            execution_space: ExecutionSpace = policy.space.space
+            members: PyKokkosMembers = self.precompile_workunit(workunit, execution_space, updated_decorator, updated_types, types_signature, restrict_views, restrict_signature, async_build, specialization, inference, **kwargs)
+
+            module_setup: ModuleSetup = self.get_module_setup(workunit, execution_space, types_signature, restrict_signature)
+
+            return members, module_setup
+
+    def load_workunit(
+        self,
+        policy: ExecutionPolicy,
+        workunit: Callable[..., None],
+        inference_key: str,
+        kwargs: Dict[str, Any]
+    ) -> Optional[Tuple[PyKokkosMembers, ModuleSetup]]:
+        """
+        Get a workunit compiled by this process or an earlier one for
+        the same argument types, without parsing its source or inferring
+        its types. The types inferred by the process that compiled it
+        are recorded in the link of its module.
+
+        :param policy: the execution policy of the operation
+        :param workunit: the workunit function object
+        :param inference_key: the key returned by get_inference_key()
+        :param kwargs: the keyword arguments passed to the workunit
+        :returns: the members of the workunit and its module setup, or
+            None if the workunit has to be prepared from its source
+        """
+
+        # Batch modules are matched against the inferred decorators
+        if len(self.batch_modules) > 0:
+            return None
 
         execution_space: ExecutionSpace = policy.space.space
-        members: PyKokkosMembers = self.precompile_workunit(workunit, execution_space, updated_decorator, updated_types, types_signature, restrict_views, restrict_signature, **kwargs)
+        inference: Optional[Dict[str, Any]] = self.get_module_setup(workunit, execution_space).find_inference(inference_key)
+        if inference is None:
+            return None
+
+        types_signature: Optional[str] = inference["types_signature"]
+        specialization_signature: Optional[str]
+        _, specialization_signature = self.get_specialization(workunit, kwargs)
+        if specialization_signature is not None:
+            types_signature = specialization_signature if types_signature is None else f"{types_signature}_{specialization_signature}"
+
+        module_setup: ModuleSetup = self.get_module_setup(workunit, execution_space, types_signature)
+        members: Optional[PyKokkosMembers] = self.compiler.load_object(module_setup, types_signature)
+        if members is None:
+            return None
+
+        return members, module_setup
+
+    def get_workunit_lock(self, workunit: Union[Callable[..., None], List[Callable[..., None]]]) -> threading.RLock:
+        """
+        Get the lock held while a workunit is prepared
 
-        module_setup: ModuleSetup = self.get_module_setup(workunit, execution_space, types_signature, restrict_signature)
-        return self.execute(workunit, module_setup, members, execution_space, policy=policy, name=name, operation=operation, **kwargs)
+        :param workunit: the workunit function object
+        :returns: the lock
+        """
+
+        key: Any
+        if isinstance(workunit, list):
+            key = tuple(getattr(w, "__func__", w) for w in workunit)
+        else:
+            # Functors are keyed by their method so that the lock does
+            # not keep the functor object alive
+            key = getattr(workunit, "__func__", workunit)
+
+        with self.lock:
+            return self.workunit_locks.setdefault(key, threading.RLock())
+
+    def is_specialized(self, workunit: Callable[..., None], names: List[str], kwargs: Dict[str, Any]) -> bool:
+        """
+        Check if a dispatch of a workunit declared with
+        @pk.workunit(specialize=[...]) runs a specialized module, i.e.
+        its values were specialized on before or there is room for a
+        new specialization
+
+        :param workunit: the workunit function object
+        :param names: the names of the specialized arguments
+        :param kwargs: the keyword arguments passed to the workunit
+        :returns: True if the values get their own module
+        """
+
+        signature: str
+        _, signature = get_specialized_values(names, kwargs)
+
+        variants: Set[str] = self.specializations.get(workunit, set())
+        max_specializations: int = int(os.getenv("PK_MAX_SPECIALIZATIONS", "8"))
+
+        return signature in variants or len(variants) < max_specializations
+
+    def get_specialization(
+        self,
+        workunit: Union[Callable[..., None], List[Callable[..., None]]],
+        kwargs: Dict[str, Any]
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Get the values to specialize a workunit declared with
+        @pk.workunit(specialize=[...]) on. Each workunit is compiled for
+        at most PK_MAX_SPECIALIZATIONS (default 8) different values,
+        after which new values use the generic module.
+
+        :param workunit: the workunit function object
+        :param kwargs: the keyword arguments passed to the workunit
+        :returns: the values and their signature, or (None, None) if the
+            workunit is not specialized
+        """
+
+        names: Optional[List[str]] = getattr(workunit, "pk_specialize", None)
+        if not names or isinstance(workunit, list) or hasattr(workunit, "__self__"):
+            return None, None
+
+        values: Dict[str, Any]
+        signature: str
+        values, signature = get_specialized_values(names, kwargs)
+
+        variants: Set[str] = self.specializations.setdefault(workunit, set())
+        if signature not in variants:
+            max_specializations: int = int(os.getenv("PK_MAX_SPECIALIZATIONS", "8"))
+            if len(variants) >= max_specializations:
+                self.compiler.logger.info(f"{workunit.__name__} has {len(variants)} specializations, using the generic module")
+                return None, None
+
+            variants.add(signature)
+
+        return values, signature
 
     def flush_data(self, data: Union[Future, ViewType]) -> None:
         """
@@ -209,10 +982,39 @@ class Runtime:
         :param data: the future or view corresponding to the data that needs to be updated
         """
 
+        if self.async_executor is not None:
+            if self.is_async_worker():
+                return
+
+            pending: Optional[concurrent.futures.Future] = None
+            if isinstance(data, Future):
+                pending = data.pending
+            else:
+                entry: Optional[Tuple[ViewType, concurrent.futures.Future]]
+                overlaps: bool
+                with self.lock:
+                    entry = self.pending_views.pop(id(self.get_view_owner(data)), None)
+                    overlaps = entry is None and self.shares_pending_memory(data)
+
+                if overlaps:
+                    # the memory is not tracked under this view, so wait
+                    # for everything that might write to it
+                    self.fence()
+                    return
+                if entry is not None:
+                    pending = entry[1]
+
+            if pending is not None:
+                pending.result()
+            return
+
         assert self.fusion_strategy is not None
 
-        operations: List[TracerOperation] = self.tracer.get_operations(data)
-        operations = self.tracer.fuse(operations, self.fusion_strategy)
+        # The operations are removed from the trace under the lock, but
+        # run outside of it as compiling them takes the workunit locks
+        with self.lock:
+            operations: List[TracerOperation] = self.tracer.get_operations(data)
+            operations = self.tracer.fuse(operations, self.fusion_strategy)
 
         for op in operations:
             result = self.execute_workunit(op.name, op.policy, op.workunit, op.operation, op.parser, **op.args)
@@ -228,15 +1030,15 @@ class Runtime:
             assert len(self.tracer.operations) == 0
             return
 
-        operations: List[TracerOperation] = self.tracer.fuse(list(self.tracer.operations), self.fusion_strategy)
+        with self.lock:
+            operations: List[TracerOperation] = self.tracer.fuse(list(self.tracer.operations), self.fusion_strategy)
+            self.tracer.operations.clear()
 
         for op in operations:
             result = self.execute_workunit(op.name, op.policy, op.workunit, op.operation, op.parser, **op.args)
             if op.future is not None:
                 op.future.value = result
 
-        self.tracer.operations.clear()
-
     def is_debug(self, space: ExecutionSpace) -> bool:
         """
         Check if the execution space is Debug and account for Default space
@@ -273,6 +1075,10 @@ class Runtime:
         :returns: the result of the operation (None for "for" and workloads)
         """
 
+        # Wait for the module if it is still being compiled in the
+        # background instead of starting a second compilation
+        self.compiler.wait_for_build(module_setup.output_dir)
+
         module_path: str
         if is_host_execution_space(space) or not km.is_multi_gpu_enabled():
             module_path = module_setup.path
@@ -288,7 +1094,14 @@ class Runtime:
         else:
             args["pk_kernel_name"] = name
 
-        result = self.call_wrapper(entity, members, args, module)
+        func = self.get_wrapper(entity, members, args, module)
+        if self.graph is not None:
+            owners: List[Any] = list(kwargs.values())
+            if hasattr(entity, "__self__"):
+                owners.extend(entity.__self__.__dict__.values())
+            self.graph.record(func, args, self.get_view_owners(args, owners))
+
+        result = func(**args)
 
         is_workunit_or_functor: bool = isinstance(entity, (Callable, list))
         if not is_workunit_or_functor:
@@ -364,7 +1177,7 @@ class Runtime:
                     entity_trees = [this_parser.get_entity(get_metadata(this_entity).name).AST for this_entity, this_parser in zip(entity, parsers)]
 
                     kwargs, _ = fuse_workunit_kwargs_and_params(entity_trees, kwargs, f"parallel_{operation}")
-                entity_members = kwargs
+                entity_members = {k: v for k, v in kwargs.items() if k not in members.specialized_params}
 
         args.update(self.get_fields(entity_members))
         args.update(self.get_views(entity_members))
@@ -372,20 +1185,21 @@ class Runtime:
 
         return args
 
-    def call_wrapper(
+    def get_wrapper(
         self,
         entity: Union[object, Callable[..., None]],
         members: PyKokkosMembers,
         args: Dict[str, Any],
         module,
-    ) -> Optional[Union[float, int]]:
+    ) -> Callable[..., Optional[Union[float, int]]]:
         """
-        Call the wrapper in the imported module
+        Get the wrapper for an entity from the imported module
 
         :param entity: the workload or workunit object
         :param members: a collection of PyKokkos related members
         :param args: the arguments to be passed to the wrapper
         :param module: the imported module
+        :returns: the wrapper function
         """
 
         is_workunit: bool = isinstance(entity, Callable)
@@ -402,9 +1216,7 @@ class Runtime:
             precision: str = self.get_precision(members, args)
             wrapper += f"_{precision}"
 
-        func = getattr(module, wrapper)
-
-        return func(**args)
+        return getattr(module, wrapper)
 
     def get_precision(self, members: PyKokkosMembers, args: Dict[str, Any]) -> str:
         """
@@ -502,6 +1314,19 @@ class Runtime:
 
         return fields
 
+    def get_view_owners(self, args: Dict[str, Any], candidates: List[Any]) -> Dict[str, ViewType]:
+        """
+        Find the views whose Kokkos arrays are passed to a wrapper
+
+        :param args: the arguments passed to the wrapper
+        :param candidates: the objects the arguments were made from
+        :returns: a dict mapping from argument name to the view owning it
+        """
+
+        owners: Dict[int, ViewType] = {id(v.array): v for v in candidates if isinstance(v, ViewType)}
+
+        return {k: owners[id(a)] for k, a in args.items() if id(a) in owners}
+
     def get_views(self, members: Dict[str, type]) -> Dict[str, Any]:
         """
         Gets all the views from the workload object
@@ -574,10 +1399,11 @@ class Runtime:
         if module_setup_id in self.module_setups:
             return self.module_setups[module_setup_id]
 
-        module_setup = ModuleSetup(entity, space, types_signature, restrict_signature)
-        self.module_setups[module_setup_id] = module_setup
+        with self.lock:
+            if module_setup_id not in self.module_setups:
+                self.module_setups[module_setup_id] = ModuleSetup(entity, space, types_signature, restrict_signature)
 
-        return module_setup
+            return self.module_setups[module_setup_id]
 
     def get_module_setup_id(
         self,
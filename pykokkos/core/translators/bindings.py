@@ -343,18 +343,24 @@ def generate_wrapper(
     params: Dict[str, str] = get_kernel_params(members, is_hierarchical(workunit), is_workload, real)
     return_type: str = get_return_type(operation, workunit)
 
+    # Convert all arguments while holding the GIL, then release it so
+    # that other Python threads can run while the kernel does
+    conversions: str = ""
     args: List[str] = []
     for name, param_type in params.items():
+        local: str = f"pk_kwarg_{name}"
         if param_type == "const std::string&":
-            args.append(f"kwargs[\"{name}\"].cast<std::string>()")
-        else:
-            args.append(f"kwargs[\"{name}\"].cast<{param_type}>()")
+            param_type = "std::string"
+        conversions += f"{param_type} {local} = kwargs[\"{name}\"].cast<{param_type}>();"
+        args.append(local)
 
     kernel_call: str = f"{kernel}("
     kernel_call += ",".join(args)
     kernel_call += ");"
 
     definition: str = f"{return_type} {wrapper}(pybind11::kwargs kwargs) {{"
+    definition += conversions
+    definition += "pybind11::gil_scoped_release pk_release;"
     if return_type != "void":
         definition += f"return {kernel_call};"
     else:
@@ -485,6 +491,28 @@ def bind_workunits(
     :returns: a list of strings of all kernels, wrappers, and bindings
     """
 
+    wrapper_names: List[str]
+    bindings: List[str]
+    wrapper_names, bindings = generate_workunit_wrappers(functor, members, workunits)
+    bindings.append(bind_wrappers(module, wrapper_names))
+
+    return bindings
+
+def generate_workunit_wrappers(
+    functor: str,
+    members: PyKokkosMembers,
+    workunits: Dict[cppast.DeclRefExpr, Tuple[str, cppast.MethodDecl]]
+) -> Tuple[List[str], List[str]]:
+    """
+    Generates the kernels and wrappers for a group of workunits for
+    all precisions, without binding them to a module
+
+    :param functor: the functor class name
+    :param members: an object containing the fields and views
+    :param workunits: a dictionary mapping form workunit name to a tuple of operation type and source
+    :returns: a tuple of lists of strings of representing the wrapper names, and the kernels and wrappers
+    """
+
     bindings: List[str] = []
     wrapper_names: List[str] = []
     if members.has_real:
@@ -499,9 +527,7 @@ def bind_workunits(
         bindings.extend(b)
         wrapper_names.extend(w)
 
-    bindings.append(bind_wrappers(module, wrapper_names))
-
-    return bindings
+    return wrapper_names, bindings
 
 def translate_mains(source: Tuple[List[str], int], functor: str, members: PyKokkosMembers, pk_import: str) -> List[str]:
     """
@@ -609,6 +635,30 @@ def bind_main(
     :returns: a list of strings containing the kernel, wrapper, and binding
     """
 
+    wrapper_names: List[str]
+    bindings: List[str]
+    wrapper_names, bindings = generate_main_wrappers(functor, members, source, pk_import)
+    bindings.append(bind_wrappers(module, wrapper_names))
+
+    return bindings
+
+def generate_main_wrappers(
+    functor: str,
+    members: PyKokkosMembers,
+    source: Tuple[List[str], int],
+    pk_import: str
+) -> Tuple[List[str], List[str]]:
+    """
+    Generates the kernel and wrapper of a workload for all precisions,
+    without binding them to a module
+
+    :param functor: the functor class name
+    :param members: an object containing the fields and views
+    :param source: the python source code of the workload
+    :param pk_import: the pykokkos import alias
+    :returns: a tuple of lists of strings of representing the wrapper names, and the kernels and wrappers
+    """
+
     bindings: List[str] = []
     wrapper_names: List[str] = []
     if members.has_real:
@@ -623,6 +673,4 @@ def bind_main(
         bindings.append(b)
         wrapper_names.append(w)
 
-    bindings.append(bind_wrappers(module, wrapper_names))
-
-    return bindings
+    return wrapper_names, bindings
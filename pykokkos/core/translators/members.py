@@ -35,6 +35,10 @@ class PyKokkosMembers:
 
         self.has_real: bool = False
 
+        # the parameters compiled into the kernel as constants, which
+        # are not passed to the wrapper
+        self.specialized_params: Dict[str, Union[bool, int, float]] = {}
+
     def extract(self, entity: PyKokkosEntity, classtypes: List[PyKokkosEntity]) -> None:
         """
         Add all PyKokkos information relevant information (fields, views, ...)
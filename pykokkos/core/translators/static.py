@@ -1,5 +1,6 @@
 import ast
 import copy
+from dataclasses import dataclass
 import os
 import sys
 from typing import Dict, List, Optional, Set, Tuple
@@ -12,7 +13,7 @@ from pykokkos.core.visitors import (
     ClasstypeVisitor, KokkosFunctionVisitor, WorkunitVisitor
 )
 
-from .bindings import bind_main, bind_workunits
+from .bindings import bind_wrappers, generate_main_wrappers, generate_workunit_wrappers
 from .functor import generate_functor
 from .functor_cast import generate_cast
 from .members import PyKokkosMembers
@@ -26,6 +27,19 @@ def generate_include_guard_start(symbol_name: str):
 def generate_include_guard_end() -> str:
     return "\n#endif"
 
+@dataclass
+class TranslatedEntity:
+    """
+    The C++ translation of an entity before it is assembled into the
+    functor, cast, and bindings files
+    """
+
+    classtypes: List[str] # serialized classtype declarations and definitions
+    functor: str # serialized functor struct
+    cast: List[str] # the functor cast functions
+    bindings: List[str] # the kernels and wrappers
+    wrappers: List[str] # the names of the wrappers to bind
+
 class StaticTranslator:
     """
     Translates a PyKokkos workload to C++ using static analysis only
@@ -52,13 +66,32 @@ class StaticTranslator:
         entity: PyKokkosEntity,
         classtypes: List[PyKokkosEntity],
         restrict_views: Set[str]
-    ) -> Tuple[List[str], List[str]]:
+    ) -> Tuple[List[str], List[str], List[str]]:
         """
         Translate an entity into C++ code
 
         :param entity: the type of the entity being translated
         :param classtypes: the list of classtypes needed by the entity
-        :returns: a tuple of lists of strings of representing the functor code and bindings respectively
+        :returns: a tuple of lists of strings of representing the functor code, bindings, and cast respectively
+        """
+
+        translation: TranslatedEntity = self.translate_parts(entity, classtypes, restrict_views)
+
+        return self.assemble(f"pk_functor_{entity.name}", [translation])
+
+    def translate_parts(
+        self,
+        entity: PyKokkosEntity,
+        classtypes: List[PyKokkosEntity],
+        restrict_views: Set[str]
+    ) -> TranslatedEntity:
+        """
+        Translate an entity into the C++ pieces that make up its module
+
+        :param entity: the type of the entity being translated
+        :param classtypes: the list of classtypes needed by the entity
+        :param restrict_views: the views with the restrict keyword
+        :returns: the translated pieces
         """
 
         self.pk_import = entity.pk_import
@@ -87,21 +120,44 @@ class StaticTranslator:
             for operation, workunit in workunits.values():
                 add_restrict_views(struct, operation, workunit, restrict_views)
 
-        cast: List[str] = [self.generate_header(), generate_include_guard_start(functor_name.upper()+"_CAST_"+"_HPP")]
-        cast.append(self.generate_cast_includes())
-        cast.extend(generate_cast(functor_name,self.pk_members))
-        cast.append(generate_include_guard_end())
-
-        bindings: List[str] = self.generate_bindings(entity, functor_name, source, workunits)
+        wrappers: List[str]
+        bindings: List[str]
+        wrappers, bindings = self.generate_bindings(entity, functor_name, source, workunits)
 
         s = cppast.Serializer()
-        functor: List[str] = [self.generate_header(), generate_include_guard_start(functor_name.upper()+"_HPP")]
-        functor.extend([s.serialize(c) for c in classtypes])
-        functor.append(s.serialize(struct))
+
+        return TranslatedEntity(
+            [s.serialize(c) for c in classtypes], s.serialize(struct),
+            generate_cast(functor_name, self.pk_members), bindings, wrappers
+        )
+
+    def assemble(self, name: str, translations: List[TranslatedEntity]) -> Tuple[List[str], List[str], List[str]]:
+        """
+        Assemble translated entities into the functor, bindings, and
+        cast sources of one module. The classtypes of the first entity
+        are used for all of them, as entities from the same file share
+        their classtypes.
+
+        :param name: the name used for the include guards
+        :param translations: the translated entities
+        :returns: a tuple of lists of strings of representing the functor code, bindings, and cast
+        """
+
+        functor: List[str] = [self.generate_header(), generate_include_guard_start(name.upper()+"_HPP")]
+        functor.extend(translations[0].classtypes)
+        functor.extend(t.functor for t in translations)
         functor.append(generate_include_guard_end())
 
-        bindings.insert(0, self.generate_includes())
-        bindings.insert(0, self.generate_header())
+        cast: List[str] = [self.generate_header(), generate_include_guard_start(name.upper()+"_CAST_"+"_HPP")]
+        cast.append(self.generate_cast_includes())
+        for t in translations:
+            cast.extend(t.cast)
+        cast.append(generate_include_guard_end())
+
+        bindings: List[str] = [self.generate_header(), self.generate_includes()]
+        for t in translations:
+            bindings.extend(t.bindings)
+        bindings.append(bind_wrappers(self.module_file, [w for t in translations for w in t.wrappers]))
 
         return functor, bindings, cast
 
@@ -263,7 +319,10 @@ class StaticTranslator:
         :returns: the includes as a string
         """
 
+        # pk_pch.hpp has to come first for the compiler to use its
+        # precompiled version
         headers: List[str] = [
+            "pk_pch.hpp",
             "pybind11/pybind11.h",
             "Kokkos_Core.hpp",
             "Kokkos_Random.hpp",
@@ -305,23 +364,20 @@ class StaticTranslator:
         functor_name: str,
         source: Tuple[List[str], int],
         workunits: Dict[cppast.DeclRefExpr, Tuple[str, cppast.MethodDecl]]
-    ) -> List[str]:
+    ) -> Tuple[List[str], List[str]]:
         """
-        Generate the pybind bindings for a single real precision
+        Generate the kernels and wrappers to be bound with pybind
 
         :param entity: the type of the entity being translated
         :param functor_name: the name of the functor
         :param workunits: the translated workunits
-        :returns: the source as a list of strings
+        :returns: a tuple of lists of strings of representing the wrapper names, and the kernels and wrappers
         """
 
-        bindings: List[str]
         if entity.style is PyKokkosStyles.workload:
-            bindings = bind_main(functor_name, self.pk_members, source, self.pk_import, self.module_file)
-        else:
-            bindings = bind_workunits(functor_name, self.pk_members, workunits, self.module_file)
+            return generate_main_wrappers(functor_name, self.pk_members, source, self.pk_import)
 
-        return bindings
+        return generate_workunit_wrappers(functor_name, self.pk_members, workunits)
 
     def add_rand_pool_state(self, workunit: cppast.MethodDecl) -> None:
         """
@@ -154,6 +154,10 @@ class ConstructorVisitor(ast.NodeVisitor):
 
         if decorator is not None:
             for k in decorator.keywords:
+                # Not a view, handled by the runtime
+                if k.arg == "specialize":
+                    continue
+
                 view = cppast.DeclRefExpr(k.arg)
                 type_info[view] = self.visit(k)
 
@@ -23,19 +23,23 @@ from .decorators import (
     callback, classtype, Decorator, function, functor, main,
     workload, workunit
 )
+from .dynamic_view import DynamicView
 from .execution_policy import (
     ExecutionPolicy, RangePolicy, MDRangePolicy, TeamPolicy,
     TeamThreadRange, ThreadVectorRange, Iterate, Rank
 )
 from .execution_space import ExecutionSpace, ExecutionSpaceInstance, is_host_execution_space
+from .graph import capture, CapturedKernel, Graph
 from .layout import Layout, get_default_layout
 from .hierarchical import (
     AUTO, TeamMember, PerTeam, PerThread, single
 )
+from .memory_pool import memory_pool_stats
 from .memory_space import MemorySpace, get_default_memory_space
 from .parallel_dispatch import (
-    execute, flush,
+    batch_compile, execute, fence, flush,
     parallel_for, parallel_reduce, parallel_scan,
+    pgo_status, precompile, tier_counts,
 )
 from .random import (
     rand, RandomPool, Random_XorShift64_Pool, Random_XorShift1024_Pool
@@ -49,15 +53,11 @@ from .views import (
     ScratchView, ScratchView1D, ScratchView2D,
     ScratchView3D, ScratchView4D, ScratchView5D,
     ScratchView6D, ScratchView7D, ScratchView8D,
-    array, asarray, result_type,
+    array, asarray, from_dlpack, memmap, result_type,
 )
 
 from .ext_module import compile_into_module
 
-def fence():
-    pass
-
-
 def printf(fmt_str, *args):
     print(fmt_str % args, end="")
 
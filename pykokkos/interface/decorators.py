@@ -57,7 +57,13 @@ def functor(func=None, **kwargs):
 
 def workunit(func=None, **kwargs):
     if func is None:
-        return partial(functor)
+        return partial(workunit, **kwargs)
+
+    # The names of the scalar parameters whose values are compiled
+    # into the kernel, see Runtime.get_specialization()
+    if "specialize" in kwargs:
+        names = kwargs["specialize"]
+        func.pk_specialize = [names] if isinstance(names, str) else list(names)
 
     return func
 
@@ -0,0 +1,233 @@
+import math
+import os
+from typing import Any, Iterator, List, Tuple, Union
+
+import numpy as np
+
+from pykokkos.runtime import runtime_singleton
+
+from .data_types import DataTypeClass, int64, real
+from .layout import Layout
+from .memory_space import MemorySpace
+from .views import Subview, View
+
+
+class DynamicView:
+    """
+    A view whose first dimension grows as elements are appended, from
+    the host or from kernels. The elements are stored in a View whose
+    capacity grows geometrically, so that appending n elements copies
+    O(n) elements overall. The number of elements is kept in a one
+    element counter View that kernels increment atomically:
+
+        @pk.workunit
+        def select(i: int, values: pk.View1D[pk.double],
+                   out: pk.View1D[pk.double], count: pk.View1D[pk.int64]):
+            if values[i] > 0:
+                idx: int = pk.atomic_fetch_add(count, [0], 1)
+                if idx < out.extent(0):
+                    out[idx] = values[i]
+
+        start: int = len(selected)
+        pk.parallel_for(n, select, values=values, out=selected.storage, count=selected.counter)
+        if not selected.commit(start):
+            # the storage was too small and has grown, run again
+            pk.parallel_for(n, select, values=values, out=selected.storage, count=selected.counter)
+    """
+
+    def __init__(
+        self,
+        shape: Union[int, List[int], Tuple[int]],
+        dtype: Union[DataTypeClass, type] = real,
+        capacity: int = 0,
+        growth: float = 2.0,
+        space: MemorySpace = MemorySpace.MemorySpaceDefault,
+        layout: Layout = Layout.LayoutDefault
+    ):
+        """
+        DynamicView constructor.
+
+        :param shape: the initial shape, the first dimension is the one that grows
+        :param dtype: the data type of the view
+        :param capacity: the number of elements to allocate up front
+        :param growth: the factor by which the capacity grows when it is exceeded
+        :param space: the memory space of the storage
+        :param layout: the layout of the storage
+        """
+
+        if isinstance(shape, int):
+            shape = [shape]
+
+        if growth <= 1:
+            raise ValueError(f"ERROR: DynamicView growth factor must be greater than 1, got {growth}")
+
+        self.growth: float = growth
+        self.storage: View = View([max(shape[0], capacity), *shape[1:]], dtype, space, layout)
+        self.counter: View = View([1], int64)
+        self.counter[0] = shape[0]
+
+    @property
+    def capacity(self) -> int:
+        """
+        The number of elements that fit in the storage
+
+        :returns: the extent of the first dimension of the storage
+        """
+
+        return self.storage.extent(0)
+
+    @property
+    def shape(self) -> Tuple[int]:
+        """
+        The shape of the elements appended so far
+
+        :returns: the logical shape
+        """
+
+        return (len(self), *self.storage.shape[1:])
+
+    def __len__(self) -> int:
+        """
+        The number of elements appended so far, which can be less than
+        what kernels have counted if the storage overflowed
+
+        :returns: the logical extent of the first dimension
+        """
+
+        return min(int(self.counter[0]), self.capacity)
+
+    def _flush(self) -> None:
+        """
+        Wait for the kernels using the storage before accessing it
+        """
+
+        if "PK_FUSION" in os.environ or "PK_ASYNC" in os.environ:
+            runtime_singleton.runtime.flush_data(self.storage)
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Allocate storage for at least capacity elements, keeping the
+        elements appended so far
+
+        :param capacity: the number of elements
+        """
+
+        if capacity <= self.capacity:
+            return
+
+        self._flush()
+        size: int = len(self)
+        storage: View = View([capacity, *self.storage.shape[1:]], self.storage.dtype,
+                             self.storage.space, self.storage.layout)
+        storage._data[:size] = self.storage._data[:size]
+        self.storage = storage
+
+    def _grow(self, size: int) -> None:
+        """
+        Grow the capacity geometrically so that it holds at least size
+        elements
+
+        :param size: the number of elements
+        """
+
+        if size > self.capacity:
+            self.reserve(max(size, math.ceil(self.capacity * self.growth)))
+
+    def resize(self, size: int) -> None:
+        """
+        Set the number of elements. The capacity only grows when it is
+        exceeded, and new elements are zero.
+
+        :param size: the new number of elements
+        """
+
+        old_size: int = len(self)
+        self._grow(size)
+        if size > old_size:
+            self._flush()
+            self.storage._data[old_size:size] = 0
+
+        self.counter[0] = size
+
+    def append(self, value: Any) -> None:
+        """
+        Append an element (or a row, for views of rank 2 and more)
+
+        :param value: the element
+        """
+
+        size: int = len(self)
+        self._grow(size + 1)
+        self._flush()
+        self.storage._data[size] = value
+        self.counter[0] = size + 1
+
+    def extend(self, values: Any) -> None:
+        """
+        Append several elements
+
+        :param values: an array-like of elements
+        """
+
+        values = np.asarray(values)
+        size: int = len(self)
+        self._grow(size + len(values))
+        self._flush()
+        self.storage._data[size:size + len(values)] = values
+        self.counter[0] = size + len(values)
+
+    def commit(self, start: int) -> bool:
+        """
+        Check the elements appended by a kernel through counter since
+        the size was start. If some did not fit, the capacity grows to
+        hold all of them and the size goes back to start, so that the
+        kernel can be run again.
+
+        :param start: the size before the kernel ran
+        :returns: True if all elements fit, False if the kernel must be run again
+        """
+
+        count: int = int(self.counter[0])
+        if count <= self.capacity:
+            return True
+
+        self.counter[0] = start
+        self._grow(count)
+
+        return False
+
+    def view(self) -> Subview:
+        """
+        A subview of the elements appended so far, for kernels that
+        read them
+
+        :returns: the subview of the storage
+        """
+
+        key: Tuple[slice, ...] = (slice(0, len(self)),) + (slice(None),) * (self.storage.rank() - 1)
+
+        return self.storage[key if len(key) > 1 else key[0]]
+
+    @property
+    def data(self) -> np.ndarray:
+        """
+        The NumPy array of the elements appended so far
+
+        :returns: the array
+        """
+
+        self._flush()
+        return self.storage.data[:len(self)]
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.data[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._flush()
+        self.storage._data[:len(self)][key] = value
+
+    def __iter__(self) -> Iterator:
+        return iter(self.data)
+
+    def __array__(self, dtype=None) -> np.ndarray:
+        return self.data
@@ -0,0 +1,103 @@
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Union
+
+import numpy as np
+
+from pykokkos.runtime import runtime_singleton
+
+
+@dataclass
+class CapturedKernel:
+    """
+    A kernel launch recorded by pk.capture()
+    """
+
+    wrapper: Callable[..., Optional[Union[float, int]]]
+    args: Dict[str, Any] # the arguments passed to the wrapper, including the policy and views
+    fields: Set[str] # the names of the scalar arguments that can be updated on replay
+    views: Dict[str, Any] # the views owning the arrays in args, kept alive until the graph is deleted
+
+
+class Graph:
+    """
+    A sequence of kernel launches recorded by pk.capture() that can be
+    replayed without going through dispatch. The policies of each
+    launch are bound when it is recorded. The graph holds the views
+    passed to each launch and takes their arrays again on replay.
+    """
+
+    def __init__(self):
+        self.kernels: List[CapturedKernel] = []
+
+    def __len__(self) -> int:
+        return len(self.kernels)
+
+    def record(self, wrapper: Callable[..., Optional[Union[float, int]]], args: Dict[str, Any], views: Dict[str, Any]) -> None:
+        """
+        Record a kernel launch
+
+        :param wrapper: the wrapper function of the kernel
+        :param args: the arguments passed to the wrapper
+        :param views: the views whose arrays are passed in args, by
+            argument name. They are held by the graph so that their
+            memory is not freed or handed to another view while it can
+            still be replayed.
+        """
+
+        fields: Set[str] = {k for k, v in args.items() if isinstance(v, (bool, int, float, np.generic)) and not k.startswith("pk_")}
+        self.kernels.append(CapturedKernel(wrapper, args, fields, views))
+
+    def replay(self, **kwargs) -> List[Optional[Union[float, int]]]:
+        """
+        Launch the recorded kernels in order. Scalar arguments passed as
+        keywords replace the recorded value in every kernel that takes
+        an argument with that name.
+
+        :param kwargs: the new values of scalar arguments
+        :returns: the result of each kernel (None for parallel_for)
+        """
+
+        for name, value in kwargs.items():
+            kernels: List[CapturedKernel] = [k for k in self.kernels if name in k.fields]
+            if len(kernels) == 0:
+                raise ValueError(f"ERROR: no captured kernel takes a scalar argument '{name}'")
+
+            for kernel in kernels:
+                kernel.args[name] = value
+
+        results: List[Optional[Union[float, int]]] = []
+        for kernel in self.kernels:
+            args: Dict[str, Any] = dict(kernel.args)
+            for k, view in kernel.views.items():
+                args[k] = view.array
+            results.append(kernel.wrapper(**args))
+
+        return results
+
+
+@contextmanager
+def capture() -> Iterator[Graph]:
+    """
+    Record the kernels dispatched in a with block so that they can be
+    replayed with Graph.replay(). The kernels still run while they are
+    recorded. Traced operations are flushed at the end of the block so
+    that they are recorded as well.
+
+    :returns: the Graph object holding the recorded kernels
+    """
+
+    runtime = runtime_singleton.runtime
+    if runtime.graph is not None:
+        raise RuntimeError("ERROR: pk.capture() cannot be nested")
+
+    # captured kernels run synchronously, after everything queued before
+    runtime.fence()
+
+    graph = Graph()
+    runtime.graph = graph
+    try:
+        yield graph
+        runtime.flush_trace()
+    finally:
+        runtime.graph = None
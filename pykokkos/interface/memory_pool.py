@@ -0,0 +1,137 @@
+from collections import OrderedDict
+import os
+import threading
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+
+class MemoryPool:
+    """
+    A cache of the Kokkos arrays of freed Views. Each bin holds the
+    arrays of one memory space, layout, trait, dtype and shape, so a
+    new View of the same kind takes an array from its bin instead of
+    allocating one. The least recently freed arrays are deallocated
+    once the pool holds more than max_bytes. The pool is disabled when
+    max_bytes is 0, which is the default unless PK_MEMORY_POOL is set
+    to a number of bytes.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.max_bytes: int = int(os.environ.get("PK_MEMORY_POOL", 0))
+        self.bytes: int = 0
+
+        # id of the array -> (bin key, array, bytes), least recently freed first
+        self.entries: OrderedDict[int, Tuple[Hashable, Any, int]] = OrderedDict()
+        self.bins: Dict[Hashable, List[int]] = {}
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.releases: int = 0
+        self.evictions: int = 0
+
+    def set_limit(self, max_bytes: int) -> None:
+        """
+        Set the maximum number of bytes held by the pool, deallocating
+        the least recently freed arrays that do not fit anymore
+
+        :param max_bytes: the new limit, 0 disables the pool
+        """
+
+        with self.lock:
+            self.max_bytes = max_bytes
+            self.trim()
+
+    def acquire(self, key: Hashable) -> Optional[Any]:
+        """
+        Take an array out of the pool
+
+        :param key: the bin of the array
+        :returns: the most recently freed array in the bin or None
+        """
+
+        if self.max_bytes == 0:
+            return None
+
+        with self.lock:
+            ids: Optional[List[int]] = self.bins.get(key)
+            if not ids:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            _, array, nbytes = self.entries.pop(ids.pop())
+            self.bytes -= nbytes
+
+            return array
+
+    def release(self, key: Hashable, view) -> None:
+        """
+        Put the array of a View that is being deleted into the pool. The
+        View does not call this once its memory has been exported
+        through its data, the array interface or DLPack, as the
+        exported object may still use it.
+
+        :param key: the bin of the array
+        :param view: the View
+        """
+
+        if self.max_bytes == 0:
+            return
+
+        nbytes: int = view._data.nbytes
+        if nbytes > self.max_bytes:
+            return
+
+        with self.lock:
+            self.entries[id(view.array)] = (key, view.array, nbytes)
+            self.bins.setdefault(key, []).append(id(view.array))
+            self.bytes += nbytes
+            self.releases += 1
+            self.trim()
+
+    def trim(self) -> None:
+        """
+        Deallocate the least recently freed arrays until the pool fits
+        in max_bytes. Must be called with the lock held.
+        """
+
+        while self.bytes > self.max_bytes:
+            array_id, (key, _, nbytes) = self.entries.popitem(last=False)
+            self.bins[key].remove(array_id)
+            self.bytes -= nbytes
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the counters of the pool
+
+        :returns: a dict with the number of allocations served from the
+                  pool (hits) or not (misses), the number of arrays
+                  returned to the pool (releases) and deallocated to stay
+                  under the limit (evictions), and the arrays and bytes
+                  currently held
+        """
+
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "releases": self.releases,
+                "evictions": self.evictions,
+                "arrays": len(self.entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+memory_pool = MemoryPool()
+
+
+def memory_pool_stats() -> Dict[str, int]:
+    """
+    Get the counters of the View memory pool enabled with PK_MEMORY_POOL
+
+    :returns: a dict of counters
+    """
+
+    return memory_pool.stats()
@@ -1,5 +1,9 @@
 
 from dataclasses import dataclass
+from functools import lru_cache
+import inspect
+import os
+from types import ModuleType
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
@@ -11,8 +15,6 @@ from .execution_policy import ExecutionPolicy, RangePolicy
 from .execution_space import ExecutionSpace
 from .views import ViewType, array
 
-workunit_cache: Dict[int, Callable] = {}
-
 
 @dataclass
 class HandledArgs:
@@ -113,25 +115,34 @@ def check_workunit(workunit: Any) -> None:
         raise TypeError(f"ERROR: {workunit} is not a valid workunit")
 
 
-def convert_arrays(kwargs: Dict[str, Any]) -> None:
+@lru_cache(maxsize=None)
+def get_cupy() -> Optional[ModuleType]:
     """
-    Convert all numpy and cupy ndarray objects into pk Views
+    Import cupy once, as a failed import is retried on every call
 
-    :param kwargs: the list of keyword arguments passed to the workunit
+    :returns: the cupy module, or None if it is not installed
     """
 
-    cp_available: bool
-
     try:
         import cupy as cp
-        cp_available = True
+        return cp
     except ImportError:
-        cp_available = False
+        return None
+
+
+def convert_arrays(kwargs: Dict[str, Any]) -> None:
+    """
+    Convert all numpy and cupy ndarray objects into pk Views
+
+    :param kwargs: the list of keyword arguments passed to the workunit
+    """
+
+    cp: Optional[ModuleType] = get_cupy()
 
     for k, v in kwargs.items():
         if isinstance(v, np.ndarray):
             kwargs[k] = array(v)
-        elif cp_available and isinstance(v, cp.ndarray):
+        elif cp is not None and isinstance(v, cp.ndarray):
             kwargs[k] = array(v)
 
 
@@ -149,13 +160,14 @@ def parallel_for(*args, **kwargs) -> None:
 
     :param **kwargs: the keyword arguments passed to a standalone
         workunit
+    :returns: a Future to wait on if PK_ASYNC is set, otherwise None
     """
 
     kwargs = dict(kwargs)
     convert_arrays(kwargs)
     handled_args: HandledArgs = handle_args(True, args)
 
-    runtime_singleton.runtime.run_workunit(
+    return runtime_singleton.runtime.run_workunit(
         handled_args.name,
         handled_args.policy,
         handled_args.workunit,
@@ -173,29 +185,6 @@ def reduce_body(operation: str, *args, **kwargs) -> Union[float, int]:
 
     kwargs = dict(kwargs)
     convert_arrays(kwargs)
-    args_to_hash: List = []
-    args_not_to_hash: Dict = {}
-    for k, v in kwargs.items():
-        if not isinstance(v, int):
-            args_to_hash.append(v)
-        else:
-            args_not_to_hash[k] = v
-
-    for a in args:
-        if callable(a):
-            args_to_hash.append(a.__name__)
-            break
-
-    args_to_hash.append(operation)
-
-    to_hash = frozenset(args_to_hash)
-    cache_key: int = hash(to_hash)
-
-    if cache_key in workunit_cache:
-        func, args = workunit_cache[cache_key]
-        args.update(args_not_to_hash)
-        return func(**args)
-
     handled_args: HandledArgs = handle_args(True, args)
 
     return runtime_singleton.runtime.run_workunit(
@@ -246,6 +235,111 @@ def parallel_scan(*args, **kwargs) -> Union[float, int]:
     return reduce_body("scan", *args, **kwargs)
 
 
+def precompile(workunits: List[Tuple], wait: bool = True) -> None:
+    """
+    Compile a batch of workunits ahead of their first dispatch. All
+    workunits are translated on the calling thread and the C++
+    compilations run concurrently. A later dispatch of a workunit whose
+    compilation is still running waits on it instead of compiling again.
+
+    :param workunits: a list of (workunit, policy, kwargs) tuples, with
+        an optional fourth element naming the operation ("for",
+        "reduce", or "scan"; defaults to "for"). The kwargs are the
+        keyword arguments the workunit will be dispatched with.
+    :param wait: whether to block until all compilations finish
+    """
+
+    to_compile: List[Tuple[ExecutionPolicy, Callable, str, Dict[str, Any]]] = []
+    for entry in workunits:
+        if len(entry) == 3:
+            workunit, policy, kwargs = entry
+            operation = "for"
+        elif len(entry) == 4:
+            workunit, policy, kwargs, operation = entry
+        else:
+            raise ValueError(f"ERROR: expected (workunit, policy, kwargs[, operation]), got {entry}")
+
+        if operation not in ("for", "reduce", "scan"):
+            raise ValueError(f"ERROR: unknown operation {operation}")
+
+        check_policy(policy)
+        if not isinstance(workunit, list):
+            check_workunit(workunit)
+        if isinstance(policy, (int, np.integer)):
+            policy = RangePolicy(ExecutionSpace.Default, 0, int(policy))
+
+        kwargs = dict(kwargs)
+        convert_arrays(kwargs)
+        to_compile.append((policy, workunit, operation, kwargs))
+
+    runtime_singleton.runtime.precompile(to_compile, wait)
+
+
+def batch_compile(
+    source: Union[ModuleType, str, List[Callable[..., None]]],
+    space: ExecutionSpace = ExecutionSpace.Default
+) -> List[str]:
+    """
+    Compile many workunits into a single shared library instead of one
+    per workunit. Workunits must have all their parameters annotated.
+    Later dispatches of these workunits use the shared library as long
+    as the views passed have the default layout, memory space, and
+    trait; other dispatches compile the workunit on its own as usual.
+
+    :param source: a Python module or the path to a source file, to
+        compile all workunits in it, or a list of workunits
+    :param space: the execution space to compile for
+    :returns: the names of the workunits that were compiled
+    """
+
+    groups: Dict[str, Optional[List[str]]] = {}
+    if isinstance(source, ModuleType):
+        groups[inspect.getfile(source)] = None
+    elif isinstance(source, str):
+        groups[os.path.abspath(source)] = None
+    elif isinstance(source, list):
+        for workunit in source:
+            check_workunit(workunit)
+            groups.setdefault(inspect.getfile(workunit), []).append(workunit.__name__)
+    else:
+        raise TypeError(f"ERROR: cannot batch compile {source}")
+
+    compiled: List[str] = []
+    for path, names in groups.items():
+        compiled.extend(runtime_singleton.runtime.batch_compile(path, names, space))
+
+    return compiled
+
+
+def tier_counts() -> Dict[str, int]:
+    """
+    Get the number of dispatches that ran the native module and the
+    number that ran in Python while the module was being compiled. Only
+    counted when tiered execution is enabled with PK_TIERED.
+
+    :returns: a dict with the "native" and "fallback" counts
+    """
+
+    runtime = runtime_singleton.runtime
+    with runtime.lock:
+        return dict(runtime.tier_counts)
+
+
+def pgo_status() -> Dict[str, str]:
+    """
+    Get the profile-guided optimization status of the kernels
+    dispatched so far with PK_PGO set. An instrumented kernel built
+    with PK_PGO=generate is "instrumented" until the process that ran
+    it exits and writes its profile, and "profiled" after. A kernel
+    rebuilt with PK_PGO=use is "optimized", or "unprofiled" if no
+    profile was found for it.
+
+    :returns: a dict from kernel name to status
+    """
+
+    return runtime_singleton.runtime.get_pgo_status()
+
+
 def execute(space: ExecutionSpace, workload: object) -> None:
     if space is ExecutionSpace.Default:
         runtime_singleton.runtime.run_workload(km.get_default_space(), workload)
@@ -254,4 +348,13 @@ def execute(space: ExecutionSpace, workload: object) -> None:
 
 
 def flush():
-    runtime_singleton.runtime.flush_trace()
\ No newline at end of file
+    runtime_singleton.runtime.flush_trace()
+
+
+def fence():
+    """
+    Wait for all dispatches queued with PK_ASYNC to finish. Inside a
+    workunit, this is translated to Kokkos::fence().
+    """
+
+    runtime_singleton.runtime.fence()
@@ -1,12 +1,13 @@
 from __future__ import annotations
 import ctypes
 import math
+import mmap
 from enum import Enum
 import os
 import sys
 from types import ModuleType
 from typing import (
-    Dict, Generic, Iterator, List, Optional,
+    Any, Dict, Generic, Iterator, List, Optional,
     Tuple, TypeVar, Union
 )
 
@@ -28,6 +29,7 @@ from .data_types import (
 )
 from .data_types import float as pk_float
 from .layout import get_default_layout, Layout
+from .memory_pool import memory_pool
 from .memory_space import get_default_memory_space, MemorySpace
 from .hierarchical import TeamMember
 
@@ -64,7 +66,9 @@ class ViewType:
     Base class of all view types. Implements methods needed for container objects and some Kokkos specific methods.
     """
 
-    data: np.ndarray
+    __slots__ = ()
+
+    _data: np.ndarray
     shape: Tuple[int]
     dtype: DataType
     space: MemorySpace
@@ -108,7 +112,7 @@ class ViewType:
         if self.trait is Trait.Unmanaged:
             self.xp_array.fill(value)
         else:
-            self.data.fill(value)
+            self._data.fill(value)
 
     def __getitem__(self, key: Union[int, TeamMember, slice, Tuple]) -> Union[int, float, Subview]:
         """
@@ -118,7 +122,7 @@ class ViewType:
         :returns: a primitive type value if key is an int, a Subview otherwise
         """
 
-        if "PK_FUSION" in os.environ:
+        if "PK_FUSION" in os.environ or "PK_ASYNC" in os.environ:
             runtime_singleton.runtime.flush_data(self)
 
         if self.shape == () and key == 0:
@@ -127,7 +131,8 @@ class ViewType:
         if isinstance(key, int) or isinstance(key, TeamMember):
             if self.trait is Trait.Unmanaged:
                 return self.xp_array[key]
-            return self.data[key]
+            # the rows of a multidimensional view share its memory
+            return self.data[key] if self.ndim > 1 else self._data[key]
 
         length: int = 1 if isinstance(key, slice) else len(key)
         if length != self.rank():
@@ -145,18 +150,18 @@ class ViewType:
         :param value: the new value at the index.
         """
 
-        if "PK_FUSION" in os.environ:
+        if "PK_FUSION" in os.environ or "PK_ASYNC" in os.environ:
             runtime_singleton.runtime.flush_data(self)
 
         if self.trait is Trait.Unmanaged:
             self.xp_array[key] = value
         else:
-            self.data[key] = value
+            self._data[key] = value
 
     def __bool__(self):
         # TODO: more complete implementation
         if self.shape == (1,) or self.shape == ():
-            return bool(self.data)
+            return bool(self._data)
 
 
     def __len__(self) -> int:
@@ -170,7 +175,7 @@ class ViewType:
         # related handling; you can have shape () and
         # still be True for example...
         if len(self.shape) == 0:
-            if self.data != 0:
+            if self._data != 0:
                 return 1
             else:
                 return 0
@@ -183,13 +188,13 @@ class ViewType:
         :returns: an iterator over the data
         """
 
-        if "PK_FUSION" in os.environ:
+        if "PK_FUSION" in os.environ or "PK_ASYNC" in os.environ:
             runtime_singleton.runtime.flush_data(self)
 
-        if self.data.ndim > 0:
+        if self._data.ndim > 0:
             if self.trait is Trait.Unmanaged:
                 return (n for n in self.xp_array)
-            return (n for n in self.data)
+            return (n for n in (self.data if self.ndim > 1 else self._data))
         else:
             # 0-D case returns empty generator
             return zip()
@@ -201,13 +206,13 @@ class ViewType:
         :returns: the string representation of the data
         """
 
-        if "PK_FUSION" in os.environ:
+        if "PK_FUSION" in os.environ or "PK_ASYNC" in os.environ:
             runtime_singleton.runtime.flush_data(self)
 
         if self.trait is Trait.Unmanaged:
             return str(self.xp_array)
 
-        return str(self.data)
+        return str(self._data)
 
     def __deepcopy__(self, memo):
         """
@@ -218,7 +223,7 @@ class ViewType:
 
 
     def _scalarfunc(self, func):
-        if "PK_FUSION" in os.environ:
+        if "PK_FUSION" in os.environ or "PK_ASYNC" in os.environ:
             runtime_singleton.runtime.flush_data(self)
 
         # based on approach used in
@@ -239,6 +244,12 @@ class ViewType:
 
 
 class View(ViewType):
+    __slots__ = (
+        "shape", "size", "ndim", "dtype", "space", "layout", "trait",
+        "array", "_data", "orig_array", "xp_array", "exported",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         shape: Union[List[int], Tuple[int]],
@@ -247,7 +258,8 @@ class View(ViewType):
         layout: Layout = Layout.LayoutDefault,
         trait: Trait = Trait.TraitDefault,
         array: Optional[np.ndarray] = None,
-        cp_array = None
+        cp_array = None,
+        initialize: bool = True
     ):
         """
         View constructor.
@@ -259,13 +271,16 @@ class View(ViewType):
         :param trait: the memory trait of the view
         :param array: the numpy array if trait is Unmanaged
         :param cp_array: the cupy array if trait is Unmanaged
+        :param initialize: whether to zero the view, see pk.empty()
         """
 
-        self._init_view(shape, dtype, space, layout, trait, array, cp_array)
+        self._init_view(shape, dtype, space, layout, trait, array, cp_array, initialize)
 
     def resize(self, dimension: int, size: int) -> None:
         """
-        Resizes a dimension of the view
+        Resizes a dimension of the view. This reallocates the view
+        every time, see pk.DynamicView for a view that grows by
+        appending.
 
         :param dimension: the dimension to be resized
         :param size: the new size
@@ -278,7 +293,7 @@ class View(ViewType):
         if self.shape != () and self.shape[dimension] == size:
             return
 
-        old_data: np.ndarray = self.data
+        old_data: np.ndarray = self._data
 
         shape_list: List[int] = list(self.shape)
         if shape_list == []:
@@ -292,11 +307,11 @@ class View(ViewType):
         kokkos_lib: ModuleType = km.get_kokkos_module(is_cpu)
         self.array = kokkos_lib.array(
             "", self.shape, None, None, self.dtype.value, self.space.value, self.layout.value, self.trait.value)
-        self.data = np.array(self.array, copy=False)
+        self._data = np.array(self.array, copy=False)
 
-        smaller: np.ndarray = old_data if old_data.size < self.data.size else self.data
+        smaller: np.ndarray = old_data if old_data.size < self._data.size else self._data
         data_slice = tuple([slice(0, i) for i in smaller.shape])
-        self.data[data_slice] = old_data[data_slice]
+        self._data[data_slice] = old_data[data_slice]
 
     def set_precision(self, dtype: Union[DataTypeClass, type]) -> None:
         """
@@ -305,9 +320,9 @@ class View(ViewType):
         :param dtype: the data type of the view, either a pykokkos DataType or "int" or "float".
         """
 
-        old_data: np.ndarray = self.data
+        old_data: np.ndarray = self._data
         self._init_view(self.shape, dtype, self.space, self.layout, self.trait)
-        np.copyto(self.data, old_data, casting="unsafe")
+        np.copyto(self._data, old_data, casting="unsafe")
 
     def _init_view(
         self,
@@ -317,7 +332,8 @@ class View(ViewType):
         layout: Layout = Layout.LayoutDefault,
         trait: Trait = Trait.TraitDefault,
         array: Optional[np.ndarray] = None,
-        cp_array = None
+        cp_array = None,
+        initialize: bool = True
     ) -> None:
         """
         Initialize the view
@@ -329,6 +345,9 @@ class View(ViewType):
         :param trait: the memory trait of the view
         :param array: the numpy array if trait is Unmanaged
         :param cp_array: the cupy array if trait is Unmanaged
+        :param initialize: whether to zero the view. Kokkos always zeroes
+            new allocations, so this only skips zeroing arrays reused from
+            the memory pool
         """
 
         self.shape: Tuple[int] = tuple(shape)
@@ -354,6 +373,7 @@ class View(ViewType):
 
         is_cpu: bool = self.space is MemorySpace.HostSpace
         kokkos_lib: ModuleType = km.get_kokkos_module(is_cpu)
+        reused: bool = False
 
         if self.dtype in {DataType.float, pk_float}:
             self.dtype = float32
@@ -380,10 +400,51 @@ class View(ViewType):
                     self.xp_array = array
                 
         else:
-            if len(self.shape) == 0:
-                shape = [1]
-            self.array = kokkos_lib.array("", shape, None, None, self.dtype.value, space.value, layout.value, trait.value)
-        self.data = np.array(self.array, copy=False)
+            # reuse the array of a freed view if the memory pool is enabled
+            self.array = memory_pool.acquire(self._get_pool_key())
+            if self.array is None:
+                if len(self.shape) == 0:
+                    shape = [1]
+                self.array = kokkos_lib.array("", shape, None, None, self.dtype.value, space.value, layout.value, trait.value)
+            else:
+                reused = True
+        self._data = np.array(self.array, copy=False)
+        self.exported = False
+
+        if reused and initialize:
+            self._data.fill(0)
+
+    @property
+    def data(self) -> np.ndarray:
+        """
+        The NumPy array sharing the memory of the view. The array may
+        outlive the view, so once it has been handed out the memory is
+        not returned to the memory pool.
+
+        :returns: the NumPy array
+        """
+
+        self.exported = True
+        return self._data
+
+    @data.setter
+    def data(self, data: np.ndarray) -> None:
+        self._data = data
+
+    def _get_pool_key(self) -> Tuple:
+        """
+        Get the memory pool bin of the array of a managed view
+
+        :returns: the space, layout, trait, dtype and allocated shape of the view
+        """
+
+        shape: Tuple[int] = self.shape if len(self.shape) != 0 else (1,)
+
+        return (self.space, self.layout, self.trait, self.dtype, shape)
+
+    def __del__(self):
+        if not getattr(self, "exported", True) and self.trait is not Trait.Unmanaged:
+            memory_pool.release(self._get_pool_key(), self)
 
     def _get_type(self, dtype: Union[DataType, type]) -> Optional[DataType]:
         """
@@ -465,13 +526,107 @@ class View(ViewType):
 
 
     def __index__(self) -> int:
-        return int(self.data[0])
+        return int(self._data[0])
     
     
     def __array__(self, dtype=None):
         return self.data
 
 
+    def _on_device(self) -> bool:
+        """
+        Whether the data is in GPU memory, in which case it is held by
+        the cupy array xp_array
+
+        :returns: True if the view wraps device memory
+        """
+
+        return self.trait is Trait.Unmanaged and self.space is not MemorySpace.HostSpace
+
+
+    def __dlpack__(self, stream=None, *, max_version=None, dl_device=None, copy=None):
+        """
+        Export the view through DLPack without copying. The capsule
+        holds a reference to the data, which keeps the memory alive
+        after the view is deleted.
+
+        :param stream: the stream the consumer will use, for device views
+        :param max_version: the highest DLPack version the consumer supports
+        :param dl_device: the device the consumer wants the data on
+        :param copy: whether the consumer requires a copy, which is not supported
+        :returns: a DLPack capsule
+        """
+
+        if copy:
+            raise BufferError("ERROR: views are only exported through DLPack without copying")
+
+        if dl_device is not None and tuple(dl_device) != self.__dlpack_device__():
+            raise BufferError(f"ERROR: the view is on DLPack device {self.__dlpack_device__()}, not {tuple(dl_device)}")
+
+        if "PK_FUSION" in os.environ or "PK_ASYNC" in os.environ:
+            runtime_singleton.runtime.flush_data(self)
+
+        exporter = self.xp_array if self._on_device() else self.data
+        kwargs: Dict[str, Any] = {"stream": stream} if self._on_device() else {}
+        if max_version is not None:
+            try:
+                return exporter.__dlpack__(**kwargs, max_version=max_version)
+            except TypeError:
+                # older exporters only produce unversioned capsules,
+                # which consumers accept as well
+                pass
+
+        return exporter.__dlpack__(**kwargs)
+
+
+    def __dlpack_device__(self) -> Tuple[int, int]:
+        """
+        The DLPack device type and id of the data
+
+        :returns: a tuple of the device type and id
+        """
+
+        if self._on_device():
+            return self.xp_array.__dlpack_device__()
+
+        return self._data.__dlpack_device__()
+
+
+    @property
+    def __array_interface__(self) -> Dict:
+        """
+        The NumPy array interface of a view in host memory, which lets
+        NumPy wrap the view without copying
+
+        :returns: the array interface dict of the data
+        """
+
+        if self._on_device():
+            raise AttributeError("__array_interface__ is not available for views in device memory")
+
+        if "PK_FUSION" in os.environ or "PK_ASYNC" in os.environ:
+            runtime_singleton.runtime.flush_data(self)
+
+        return self.data.__array_interface__
+
+
+    @property
+    def __cuda_array_interface__(self) -> Dict:
+        """
+        The CUDA array interface of a view in device memory
+
+        :returns: the array interface dict of the cupy array
+        """
+
+        if not self._on_device():
+            raise AttributeError("__cuda_array_interface__ is only available for views in device memory")
+
+        if "PK_FUSION" in os.environ or "PK_ASYNC" in os.environ:
+            runtime_singleton.runtime.flush_data(self)
+
+        return self.xp_array.__cuda_array_interface__
+
+
     def __pos__(self):
         return pk.positive(self)
 
@@ -498,9 +653,17 @@ class Subview(ViewType):
     the constructor directly, instead they should slice the original View object.
     """
 
+    __slots__ = (
+        "parent_view", "base_view", "data_slice", "_data", "xp_array",
+        "dtype", "space", "layout", "trait", "shape", "ndim", "size",
+        "_array", "_parent_slice", "__weakref__",
+    )
+
     def __init__(self, parent_view: Union[Subview, View], data_slice: Union[slice, Tuple]):
         """
-        Subview constructor.
+        Subview constructor. Only the NumPy slice is created here, the
+        Kokkos view is created when the subview is first passed to a
+        kernel.
 
         :param parent_view: the View or Subview that is meant to be sliced
         :param data_slice: the slice of the parent_view
@@ -508,41 +671,80 @@ class Subview(ViewType):
 
         self.parent_view: Union[Subview, View] = parent_view
         self.base_view: View = self._get_base_view(parent_view)
+        self.data_slice: Union[slice, Tuple] = data_slice
 
-        self.data: np.ndarray = parent_view.data[data_slice]
+        self._data: np.ndarray = parent_view._data[data_slice]
         self.dtype = parent_view.dtype
         if parent_view.trait is Trait.Unmanaged:
             self.xp_array = parent_view.xp_array[data_slice]
 
-        is_cpu: bool = self.parent_view.space is MemorySpace.HostSpace
-        kokkos_lib: ModuleType = km.get_kokkos_module(is_cpu)
-
         self.space: MemorySpace = parent_view.space
         self.layout: Layout = parent_view.layout
         self.trait: Trait = parent_view.trait
+        self.shape: Tuple[int] = self._data.shape
 
-        if self.data is not None and self.data.ndim == 0:
-            # TODO: we don't really support 0-D under the hood--use
-            # NumPy for now...
-            self.array = self.data
-        else:
-            self.array = kokkos_lib.array(
-                self.data, dtype=parent_view.dtype.value, space=parent_view.space.value,
-                layout=parent_view.layout.value, trait=kokkos.Unmanaged)
-        self.shape: Tuple[int] = self.data.shape
-
-        if self.data.shape == (0,):
-            self.data = np.array([], dtype=self.data.dtype)
+        if self._data.shape == (0,):
+            self._data = np.array([], dtype=self._data.dtype)
             self.shape = ()
 
-        self.parent_slice: List[Union[int, slice]]
-        self.parent_slice = self._create_slice(data_slice)
-        self.ndim = self.data.ndim
-        self.size = self.data.size
+        self.ndim = self._data.ndim
+        self.size = self._data.size
+
+        self._array = None
+        self._parent_slice: Optional[List[Union[int, slice]]] = None
+
+    @property
+    def array(self):
+        """
+        The unmanaged Kokkos view of the data, created on first access
+        so that slicing on the host does not pay for it
+
+        :returns: the Kokkos view object
+        """
+
+        if self._array is None:
+            if self._data.ndim == 0:
+                # TODO: we don't really support 0-D under the hood--use
+                # NumPy for now...
+                self._array = self._data
+            else:
+                is_cpu: bool = self.space is MemorySpace.HostSpace
+                kokkos_lib: ModuleType = km.get_kokkos_module(is_cpu)
+                self._array = kokkos_lib.array(
+                    self._data, dtype=self.dtype.value, space=self.space.value,
+                    layout=self.layout.value, trait=kokkos.Unmanaged)
+
+        return self._array
+
+    @property
+    def data(self) -> np.ndarray:
+        """
+        The NumPy array sharing the memory of the subview, which keeps
+        the memory of the base view out of the memory pool
+
+        :returns: the NumPy array
+        """
+
+        self.base_view.exported = True
+        return self._data
+
+    @property
+    def parent_slice(self) -> List[Union[int, slice]]:
+        """
+        The slice of the parent view, created on first access
+
+        :returns: a list of integers and slices representing the full slice
+        """
+
+        if self._parent_slice is None:
+            self._parent_slice = self._create_slice(self.data_slice)
+
+        return self._parent_slice
 
     def _create_slice(self, data_slice: Union[slice, Tuple]) -> List[Union[int, slice]]:
         """
-        Transforms the slice into a list, removing all None values for start and stop
+        Transforms the slice into a list, replacing None values for
+        start, stop and step with the bounds of the parent view
 
         :returns: a list of integers and slices representing the full slice
         """
@@ -554,10 +756,9 @@ class Subview(ViewType):
 
         for i, s in enumerate(data_slice):
             if isinstance(s, slice):
-                start: int = 0 if s.start is None else s.start
-                stop: int = self.parent_view.extent(
-                    i) if s.stop is None else s.stop
-                parent_slice.append(slice(start, stop, None))
+                start, stop, step = s.indices(self.parent_view.extent(i))
+                # a negative step runs past index 0, which only None can express
+                parent_slice.append(slice(start, stop if stop >= 0 else None, step))
             elif isinstance(s, int):
                 parent_slice.append(s)
 
@@ -762,6 +963,36 @@ def from_array(array) -> ViewType:
 
     return from_numpy(np_array, memory_space, layout, array)
 
+# DLPack device types of memory NumPy can read
+DLPACK_CPU_DEVICES: Tuple[int, ...] = (1, 3) # kDLCPU, kDLCUDAHost
+
+def from_dlpack(x) -> ViewType:
+    """
+    Create a PyKokkos View sharing the memory of an object that
+    implements the DLPack protocol, e.g. a PyTorch tensor or a JAX,
+    NumPy or cupy array. The memory is kept alive by the View until it
+    is deleted.
+
+    :param x: the object exporting its data
+    :returns: a PyKokkos View wrapping the data
+    """
+
+    if isinstance(x, View):
+        # the new View shares the memory, which may outlive x
+        x.exported = True
+
+    device_type: int = x.__dlpack_device__()[0]
+    if device_type in DLPACK_CPU_DEVICES:
+        # the NumPy array owns the capsule and is kept as orig_array
+        return from_numpy(np.from_dlpack(x))
+
+    try:
+        import cupy as cp
+    except ImportError:
+        raise RuntimeError(f"ERROR: importing data on DLPack device type {device_type} requires cupy")
+
+    return from_array(cp.from_dlpack(x))
+
 def is_array(array) -> bool:
     """
     Check if an object conforms to enough numpy array standards to be treated as an array
@@ -800,6 +1031,19 @@ def array(array, space: Optional[MemorySpace] = None, layout: Optional[Layout] =
     # and run from_array to preprocess the array to numpy
     if is_array(array):
         return from_array(array)
+    # share the memory of tensors from other frameworks
+    if hasattr(array, "__dlpack__"):
+        view: ViewType = from_dlpack(array)
+        if (space is None or space is view.space) and (layout is None or layout is view.layout):
+            return view
+
+        # the shared memory cannot change space or layout, so copy it
+        # when it is on the host and give up otherwise
+        if view._on_device() or space not in {None, MemorySpace.HostSpace}:
+            raise ValueError(f"ERROR: cannot create a View in {space} with {layout} from DLPack data in {view.space} with {view.layout}")
+
+        order: str = "F" if layout is Layout.LayoutLeft else "C"
+        return from_numpy(np.array(view.data, order=order), space, layout)
     # try converting the input data to numpy and using that route to convert
     return from_numpy(np.asarray(array), space, layout)
 
@@ -825,6 +1069,70 @@ def asarray(obj, /, *, dtype=None, device=None, copy=None):
     return ret
 
 
+def memmap(
+    path: str,
+    dtype: Optional[DataTypeClass] = None,
+    mode: str = "r",
+    shape: Optional[Union[int, Tuple[int]]] = None,
+    offset: int = 0,
+    layout: Optional[Layout] = None,
+    advice: Optional[str] = "sequential"
+) -> ViewType:
+    """
+    Create a View backed by a memory-mapped file, so that only the pages
+    touched by kernels are read into memory. .npy files are opened with
+    their header, other files are read as raw binary. Changes made in
+    mode "r+" or "w+" reach the file when the view's orig_array is
+    flushed or garbage collected.
+
+    :param path: the path of the file
+    :param dtype: the data type, required unless the file is a .npy file
+    :param mode: "r" (the view can be written but changes are not saved), "r+" or "w+" (create or overwrite)
+    :param shape: the shape of the view, required for "w+"; a raw file is read as 1D by default
+    :param offset: the offset in bytes of the data in a raw file
+    :param layout: LayoutRight (C order, the default) or LayoutLeft (Fortran order)
+    :param advice: "normal", "sequential", "random", "willneed" or None, passed to madvise() for read-ahead
+    :returns: a PyKokkos View wrapping the mapping
+    """
+
+    if mode not in {"r", "r+", "w+"}:
+        raise ValueError(f"ERROR: unsupported memmap mode '{mode}'")
+
+    # a read-only mapping cannot be wrapped by a Kokkos view, so "r" is
+    # mapped copy-on-write instead
+    np_mode: str = "c" if mode == "r" else mode
+    np_dtype = None if dtype is None else dtype.np_equiv
+    fortran_order: bool = layout is Layout.LayoutLeft
+
+    array: np.memmap
+    if path.endswith(".npy"):
+        if mode == "w+":
+            array = np.lib.format.open_memmap(path, mode=np_mode, dtype=np_dtype, shape=shape, fortran_order=fortran_order)
+        else:
+            array = np.lib.format.open_memmap(path, mode=np_mode)
+    else:
+        if np_dtype is None:
+            raise ValueError("ERROR: memmap() needs a dtype for raw binary files")
+        array = np.memmap(path, dtype=np_dtype, mode=np_mode, offset=offset, shape=shape, order="F" if fortran_order else "C")
+
+    if advice is not None:
+        if advice not in {"normal", "sequential", "random", "willneed"}:
+            raise ValueError(f"ERROR: unsupported madvise() advice '{advice}'")
+        # np.memmap keeps the mmap object it was created from; madvise()
+        # is skipped on platforms that do not have it
+        flag: Optional[int] = getattr(mmap, f"MADV_{advice.upper()}", None)
+        mapping: Optional[mmap.mmap] = getattr(array, "_mmap", None)
+        if flag is not None and mapping is not None and hasattr(mapping, "madvise"):
+            mapping.madvise(flag)
+
+    if array.dtype == np.bool_:
+        # view the data as uint8 rather than converting it, which would
+        # read the whole file
+        array = array.view(np.uint8)
+
+    return from_numpy(array, layout=layout)
+
+
 def _get_largest_type(type_list: List[DataTypeClass], type_info: Callable) -> DataTypeClass:
     largest_type = type_list[0]
     for dtype in type_list[1:]:
@@ -1,4 +1,8 @@
+import atexit
+import importlib
 import os
+import sys
+import threading
 from types import ModuleType
 from typing import Any, Dict, List
 
@@ -13,6 +17,7 @@ CONSTANTS: Dict[str, Any] = {
     "AVAILABLE_EXECUTION_SPACES": {},
     "REAL_DTYPE": double,
     "IS_INITIALIZED": False,
+    "IS_FINALIZED": False,
     "ENABLE_UVM": False,
     "MULTI_GPU": False,
     "NUM_GPUS": 0,
@@ -23,6 +28,13 @@ CONSTANTS: Dict[str, Any] = {
     "GPU_BACKEND": None
 }
 
+# Guards the lazy call to Kokkos::initialize(). It is reentrant as
+# creating the execution space instances calls back into initialize()
+init_lock = threading.RLock()
+# Set once initialize() has finished, so that it can be checked
+# without taking the lock
+init_done: bool = False
+
 pk_kokkos_version: str = os.getenv("PK_KOKKOS_INTERFACE")
 if pk_kokkos_version is not None:
     try:
@@ -70,6 +82,8 @@ def get_execution_space_instance(space: ExecutionSpace) -> ExecutionSpaceInstanc
     :returns: the kokkos execution space object
     """
 
+    initialize()
+
     if space not in CONSTANTS["AVAILABLE_EXECUTION_SPACES"]:
         raise ValueError(f"Execution space {space} is not available")
 
@@ -82,6 +96,8 @@ def get_available_execution_spaces() -> List[str]:
     :returns: a list of the available spaces
     """
 
+    initialize()
+
     return list(CONSTANTS["AVAILABLE_EXECUTION_SPACES"].keys())
 
 def get_default_precision() -> ExecutionSpace:
@@ -131,21 +147,121 @@ def disable_uvm() -> None:
 
 def initialize() -> None:
     """
-    Call Kokkos::initialize() if not already called
+    Call Kokkos::initialize() if not already called. This is deferred
+    until Kokkos is first needed (allocating a View, creating an
+    execution policy or dispatching) so that importing pykokkos stays
+    fast.
     """
 
-    if CONSTANTS["IS_INITIALIZED"] == False:
+    global init_done
+
+    if init_done or CONSTANTS["IS_FINALIZED"]:
+        return
+
+    with init_lock:
+        # IS_INITIALIZED is already set when called again from the
+        # execution space setup below
+        if CONSTANTS["IS_INITIALIZED"] or CONSTANTS["IS_FINALIZED"]:
+            return
+
+        try:
+            # Save the active device ID before calling initialize(), which
+            # will overwrite it
+            import cupy as cp
+            active_device: int = cp.cuda.runtime.getDevice()
+        except ImportError:
+            pass
+
         kokkos.initialize()
         CONSTANTS["IS_INITIALIZED"] = True
 
+        initialize_execution_spaces()
+        initialize_gpu_modules()
+
+        try:
+            import cupy as cp
+            cp.cuda.runtime.setDevice(active_device)
+        except ImportError:
+            pass
+
+        init_done = True
+
 def finalize() -> None:
     """
     Call Kokkos::finalize() if initialize() has been called
     """
 
-    if CONSTANTS["IS_INITIALIZED"] == True:
-        kokkos.finalize()
-        CONSTANTS["IS_INITIALIZED"] = False
+    with init_lock:
+        if CONSTANTS["IS_INITIALIZED"] == True:
+            kokkos.finalize()
+            CONSTANTS["IS_INITIALIZED"] = False
+            CONSTANTS["IS_FINALIZED"] = True
+
+def initialize_execution_spaces() -> None:
+    """
+    For every available execution space, create a default execution
+    space instance
+    """
+
+    for space in ExecutionSpace:
+        if space in {ExecutionSpace.Debug, ExecutionSpace.Default}:
+            continue
+
+        if kokkos.get_device_available(space.value):
+            CONSTANTS["AVAILABLE_EXECUTION_SPACES"][space] = ExecutionSpaceInstance(space)
+
+            if space in {ExecutionSpace.Cuda, ExecutionSpace.HIP}:
+                CONSTANTS["GPU_BACKEND"] = space
+
+def initialize_gpu_modules() -> None:
+    """
+    Import multiple kokkos libs to support multiple devices per
+    process. This assumes that there are modules named f"gpu{id}"
+    that can be imported.
+    """
+
+    # NOTE: multiple GPU support is almost certainly
+    # broken, we can't just assume that there are modules
+    # named gpu0, gpu1, and so on...
+
+    try:
+        import cupy as cp
+        num_cuda_gpus: int = cp.cuda.runtime.getDeviceCount()
+        kokkos_libs: List[str] = [f"gpu{id}" for id in range(num_cuda_gpus)]
+    except ImportError:
+        num_cuda_gpus = 0
+        kokkos_libs = []
+
+    CONSTANTS["NUM_GPUS"] = num_cuda_gpus
+
+    kokkos_gpu_module_list: List = []
+    for id, lib in enumerate(kokkos_libs):
+        try:
+            module = importlib.import_module(lib)
+            kokkos_gpu_module_list.append(module)
+
+            # Can't pass device id directly to initialize(), so need to
+            # append argument to select device to sys.argv.
+            # (see https://github.com/kokkos/pykokkos-base/blob/d3946ed56483f3cbe2e660cc50fe73c50dad19ea/src/libpykokkos.cpp#L65)
+            sys.argv.append(f"--device-id={id}")
+            module.initialize()
+            atexit.register(module.finalize)
+            sys.argv.pop()
+        except ModuleNotFoundError:
+            pass
+
+    if len(kokkos_gpu_module_list) > 1:
+        CONSTANTS["MULTI_GPU"] = True
+        CONSTANTS["KOKKOS_GPU_MODULE_LIST"] = kokkos_gpu_module_list
+
+        # Create an execution space instance per device from each GPU lib
+        kokkos_gpu_instance_list: List = []
+        for lib in kokkos_gpu_module_list:
+            CONSTANTS["KOKKOS_GPU_MODULE"] = lib
+            kokkos_gpu_instance_list.append(ExecutionSpaceInstance(get_gpu_framework()))
+
+        CONSTANTS["KOKKOS_GPU_MODULE"] = kokkos_gpu_module_list[0]
+        CONSTANTS["KOKKOS_GPU_INSTANCE_LIST"] = kokkos_gpu_instance_list
 
 def get_kokkos_module(is_cpu: bool) -> ModuleType:
     """
@@ -155,6 +271,8 @@ def get_kokkos_module(is_cpu: bool) -> ModuleType:
     :returns: the kokkos module
     """
 
+    initialize()
+
     if is_cpu:
         return kokkos
 
@@ -167,6 +285,8 @@ def set_device_id(device_id: int) -> None:
     :param device_id: the ID of the device to enable
     """
 
+    initialize()
+
     if not isinstance(device_id, int):
         raise TypeError("'device_id' must be of type 'int'")
 
@@ -203,6 +323,8 @@ def is_multi_gpu_enabled() -> bool:
     :returns: True or False
     """
 
+    initialize()
+
     return CONSTANTS["MULTI_GPU"]
 
 def get_kokkos_gpu_modules() -> List:
@@ -212,6 +334,8 @@ def get_kokkos_gpu_modules() -> List:
     :returns: the list of modules
     """
 
+    initialize()
+
     return CONSTANTS["KOKKOS_GPU_MODULE_LIST"]
 
 def get_num_gpus() -> bool:
@@ -221,6 +345,8 @@ def get_num_gpus() -> bool:
     :returns: the number of gpus
     """
 
+    initialize()
+
     return CONSTANTS["NUM_GPUS"]
 
 def get_gpu_framework() -> ExecutionSpace:
@@ -230,82 +356,6 @@ def get_gpu_framework() -> ExecutionSpace:
     :returns: the framework as a string
     """
 
-    return CONSTANTS["GPU_BACKEND"]
-
-try:
-    # Save the active device ID before calling initialize(), which
-    # will overwrite it
-    import cupy as cp
-    active_device: int = cp.cuda.runtime.getDevice()
-except ImportError:
-    pass
-
-initialize()
-
-# For every available execution space, create a default execution
-# space instance
-for space in ExecutionSpace:
-    if space in {ExecutionSpace.Debug, ExecutionSpace.Default}:
-        continue
+    initialize()
 
-    if kokkos.get_device_available(space.value):
-        CONSTANTS["AVAILABLE_EXECUTION_SPACES"][space] = ExecutionSpaceInstance(space)
-
-        if space in {ExecutionSpace.Cuda, ExecutionSpace.HIP}:
-            CONSTANTS["GPU_BACKEND"] = space
-
-# NOTE: multiple GPU support is almost certainly
-# broken, we can't just assume that there are modules
-# named gpu0, gpu1, and so on...
-
-# Import multiple kokkos libs to support multiple devices per
-# process. This assumes that there are modules named f"gpu{id}"
-# that can be imported.
-import atexit
-import importlib
-import sys
-
-try:
-    import cupy as cp
-    NUM_CUDA_GPUS: int = cp.cuda.runtime.getDeviceCount()
-    KOKKOS_LIBS: List[str] = [f"gpu{id}" for id in range(NUM_CUDA_GPUS)]
-except ImportError:
-    NUM_CUDA_GPUS = 0
-    KOKKOS_LIBS = []
-
-CONSTANTS["NUM_GPUS"] = NUM_CUDA_GPUS
-
-KOKKOS_GPU_MODULE_LIST: List = []
-for id, lib in enumerate(KOKKOS_LIBS):
-    try:
-        module = importlib.import_module(lib)
-        KOKKOS_GPU_MODULE_LIST.append(module)
-
-        # Can't pass device id directly to initialize(), so need to
-        # append argument to select device to sys.argv.
-        # (see https://github.com/kokkos/pykokkos-base/blob/d3946ed56483f3cbe2e660cc50fe73c50dad19ea/src/libpykokkos.cpp#L65)
-        sys.argv.append(f"--device-id={id}")
-        module.initialize()
-        atexit.register(module.finalize)
-        sys.argv.pop()
-    except ModuleNotFoundError:
-        pass
-
-if len(KOKKOS_GPU_MODULE_LIST) > 1:
-    CONSTANTS["MULTI_GPU"] = True
-    CONSTANTS["KOKKOS_GPU_MODULE_LIST"] = KOKKOS_GPU_MODULE_LIST
-
-    # Create an execution space instance per device from each GPU lib
-    KOKKOS_GPU_INSTANCE_LIST: List = []
-    for lib in KOKKOS_GPU_MODULE_LIST:
-        CONSTANTS["KOKKOS_GPU_MODULE"] = lib
-        KOKKOS_GPU_INSTANCE_LIST.append(ExecutionSpaceInstance(get_gpu_framework()))
-
-    CONSTANTS["KOKKOS_GPU_MODULE"] = KOKKOS_GPU_MODULE_LIST[0]
-    CONSTANTS["KOKKOS_GPU_INSTANCE_LIST"] = KOKKOS_GPU_INSTANCE_LIST
-
-try:
-    import cupy as cp
-    cp.cuda.runtime.setDevice(active_device)
-except ImportError:
-    pass
\ No newline at end of file
+    return CONSTANTS["GPU_BACKEND"]
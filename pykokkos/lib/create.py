@@ -10,11 +10,27 @@ def zeros(shape, *, dtype=None, device=None):
         return pk.View([*shape], dtype=dtype)
 
 
+def empty(shape, *, dtype=None, device=None):
+    if dtype is None:
+        dtype = pk.float64
+
+    if isinstance(shape, int):
+        return pk.View([shape], dtype=dtype, initialize=False)
+    else:
+        return pk.View([*shape], dtype=dtype, initialize=False)
+
+
+def empty_like(x, /, *, dtype=None, device=None):
+    if dtype is None:
+        dtype = x.dtype
+    return pk.View([*x.shape], dtype=dtype, initialize=False)
+
+
 def ones(shape, *, dtype=None, device=None):
     if dtype is None:
         # NumPy also defaults to a double for ones()
         dtype = pk.float64
-    view: pk.View = pk.View([*shape], dtype=dtype)
+    view: pk.View = pk.View([*shape], dtype=dtype, initialize=False)
     view[:] = 1
     return view
 
@@ -22,7 +38,7 @@ def ones(shape, *, dtype=None, device=None):
 def ones_like(x, /, *, dtype=None, device=None):
     if dtype is None:
         dtype = x.dtype
-    view: pk.View = pk.View([*x.shape], dtype=dtype)
+    view: pk.View = pk.View([*x.shape], dtype=dtype, initialize=False)
     view[:] = 1
     return view
 
@@ -30,10 +46,8 @@ def ones_like(x, /, *, dtype=None, device=None):
 def zeros_like(x, /, *, dtype=None, device=None):
     if dtype is None:
         dtype = x.dtype
-    # NOTE: at the moment PyKokkos automatically
-    # zeros out allocated memory, but this may not
-    # always be the case if we want to support an
-    # efficient empty() implementation
+    # NOTE: pk.empty() skips zeroing, pk.View always
+    # zeroes the memory
     view: pk.View = pk.View([*x.shape], dtype=dtype)
     return view
 
@@ -42,9 +56,9 @@ def full(shape, fill_value, *, dtype=None, device=None):
     if dtype is None:
         dtype = fill_value.dtype
     try:
-        view: pk.View = pk.View([*shape], dtype=dtype)
+        view: pk.View = pk.View([*shape], dtype=dtype, initialize=False)
     except TypeError:
-        view: pk.View = pk.View([shape], dtype=dtype)
+        view: pk.View = pk.View([shape], dtype=dtype, initialize=False)
     view[:] = fill_value
     return view
 
@@ -53,6 +67,6 @@ def full_like(x, /, fill_value, *, dtype=None, device=None):
     if dtype is None:
         dtype = x.dtype
     shape = x.shape
-    view: pk.View = pk.View([*shape], dtype=dtype)
+    view: pk.View = pk.View([*shape], dtype=dtype, initialize=False)
     view[:] = fill_value
     return view
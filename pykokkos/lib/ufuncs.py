@@ -1,3 +1,4 @@
+import functools
 import re
 import math
 from inspect import getmembers, isfunction
@@ -101,7 +102,84 @@ def _typematch_views(view1, view2):
     return view1, view2, effective_dtype
 
 
-def reciprocal(view):
+def _get_out(out, shape, dtype):
+    """
+    Allocate the output view of a ufunc, or check that the view passed
+    as out can hold the result
+    """
+    if out is None:
+        # the kernels of the ufuncs write every element
+        return pk.empty([*shape], dtype=dtype)
+    if not isinstance(out, ViewType):
+        raise TypeError(f"out must be a pykokkos view, not {type(out).__name__}")
+    if tuple(out.shape) != tuple(shape):
+        raise ValueError(f"out has shape {tuple(out.shape)} but the result has shape {tuple(shape)}")
+    if out.dtype.value != dtype.value:
+        raise TypeError(f"out has dtype {out.dtype.__name__} but the result has dtype {dtype.__name__}")
+    return out
+
+
+@pk.workunit
+def where_impl_1d(tid, mask, view, out):
+    if mask[tid]:
+        out[tid] = view[tid]
+
+
+@pk.workunit
+def where_impl_2d(tid, mask, view, out):
+    for i in range(view.extent(1)):
+        if mask[tid][i]:
+            out[tid][i] = view[tid][i]
+
+
+def _where(result, where, out):
+    """
+    Copy the elements of a ufunc result selected by where into out
+    """
+    if not isinstance(result, ViewType):
+        raise TypeError("where is only supported when the result is a view")
+    if out is None:
+        # the elements that are not selected are zero
+        out = pk.View([*result.shape], dtype=result.dtype)
+    else:
+        out = _get_out(out, result.shape, result.dtype)
+    if where is False:
+        return out
+    if not isinstance(where, ViewType) or tuple(where.shape) != tuple(result.shape):
+        raise ValueError(f"where must be a bool or a view with the shape of the result {tuple(result.shape)}")
+
+    if len(result.shape) == 1:
+        pk.parallel_for(result.shape[0], where_impl_1d, mask=where, view=result, out=out)
+    elif len(result.shape) == 2:
+        pk.parallel_for(result.shape[0], where_impl_2d, mask=where, view=result, out=out)
+    else:
+        raise NotImplementedError("where is only supported for 1D and 2D views")
+    return out
+
+
+def _ufunc(ufunc):
+    """
+    Add the NumPy out and where keyword arguments to a ufunc. The
+    ufunc writes its result into out when possible; results that are
+    computed into a temporary (e.g. scalars) are copied into it.
+    """
+    @functools.wraps(ufunc)
+    def wrapper(*args, out=None, where=True, **kwargs):
+        if where is True:
+            result = ufunc(*args, out=out, **kwargs)
+            if out is None or result is out:
+                return result
+            if isinstance(result, ViewType):
+                _get_out(out, result.shape, result.dtype)
+            out[:] = result
+            return out
+
+        return _where(ufunc(*args, **kwargs), where, out)
+
+    return wrapper
+
+
+def reciprocal(view, *, out=None, where=True):
     """
     Return the reciprocal of the argument, element-wise.
 
@@ -109,6 +187,11 @@ def reciprocal(view):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+          The input view is modified in place when this is not given.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -121,6 +204,17 @@ def reciprocal(view):
         This function is not designed to work with integers.
 
     """
+    if where is not True:
+        result = pk.View(view.shape, view.dtype)
+        result[:] = view
+        return _where(reciprocal(result), where, out)
+
+    if out is not None:
+        _get_out(out, view.shape, view.dtype)
+        if out is not view:
+            out[:] = view
+        view = out
+
     _ufunc_kernel_dispatcher(tid=view.shape[0],
                              dtype=view.dtype.value,
                              ndims=len(view.shape),
@@ -155,7 +249,8 @@ def log_impl_2d_float(tid: int, view: pk.View2D[pk.float], out: pk.View2D[pk.flo
         out[tid][i] = log(view[tid][i]) # type: ignore
 
 
-def log(view):
+@_ufunc
+def log(view, *, out=None):
     """
     Natural logarithm, element-wise.
 
@@ -163,6 +258,10 @@ def log(view):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -176,7 +275,7 @@ def log(view):
     if len(view.shape) > 2:
         raise NotImplementedError("log() ufunc only supports up to 2D views")
 
-    out = pk.View(view.shape, view.dtype)
+    out = _get_out(out, view.shape, view.dtype)
     if "double" in view.dtype.__name__ or "float64" in view.dtype.__name__:
         if view.shape == ():
             # NOTE: is this really worth sending to a kernel?
@@ -218,7 +317,8 @@ def sqrt_impl_2d_float(tid: int, view: pk.View2D[pk.float], out: pk.View2D[pk.fl
         out[tid][i] = sqrt(view[tid][i]) # type: ignore
 
 
-def sqrt(view):
+@_ufunc
+def sqrt(view, *, out=None):
     """
     Return the non-negative square root of the argument, element-wise.
 
@@ -226,6 +326,10 @@ def sqrt(view):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -244,7 +348,7 @@ def sqrt(view):
     # are available in pykokkos?
     if len(view.shape) > 2:
         raise NotImplementedError("only up to 2D views currently supported for sqrt() ufunc.")
-    out = pk.View(view.shape, view.dtype)
+    out = _get_out(out, view.shape, view.dtype)
     if "double" in view.dtype.__name__ or "float64" in view.dtype.__name__:
         if view.shape == ():
             pk.parallel_for(1, sqrt_impl_1d_double, view=view, out=out)
@@ -284,7 +388,8 @@ def log2_impl_2d_float(tid: int, view: pk.View2D[pk.float], out: pk.View2D[pk.fl
         out[tid][i] = log2(view[tid][i]) # type: ignore
 
 
-def log2(view):
+@_ufunc
+def log2(view, *, out=None):
     """
     Base-2 logarithm, element-wise.
 
@@ -292,6 +397,10 @@ def log2(view):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -301,7 +410,7 @@ def log2(view):
     """
     if len(view.shape) > 2:
         raise NotImplementedError("log2() ufunc only supports up to 2D views")
-    out = pk.View(view.shape, view.dtype)
+    out = _get_out(out, view.shape, view.dtype)
     if "double" in view.dtype.__name__ or "float64" in view.dtype.__name__:
         if view.shape == ():
             # NOTE: is this really worth sending to a kernel?
@@ -343,7 +452,8 @@ def log10_impl_2d_float(tid: int, view: pk.View2D[pk.float], out: pk.View2D[pk.f
         out[tid][i] = log10(view[tid][i]) # type: ignore
 
 
-def log10(view):
+@_ufunc
+def log10(view, *, out=None):
     """
     Base-10 logarithm, element-wise.
 
@@ -351,6 +461,10 @@ def log10(view):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -360,7 +474,7 @@ def log10(view):
     """
     if view.size == 0:
         return view
-    out = pk.View(view.shape, view.dtype)
+    out = _get_out(out, view.shape, view.dtype)
     if "double" in view.dtype.__name__ or "float64" in view.dtype.__name__:
         if view.shape == ():
             # NOTE: is this really worth sending to a kernel?
@@ -402,7 +516,8 @@ def log1p_impl_2d_double(tid: int, view: pk.View2D[pk.double], out: pk.View2D[pk
         out[tid][i] = log1p(view[tid][i]) # type: ignore
 
 
-def log1p(view):
+@_ufunc
+def log1p(view, *, out=None):
     """
     Return the natural logarithm of one plus the input array, element-wise.
 
@@ -410,6 +525,10 @@ def log1p(view):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -419,7 +538,7 @@ def log1p(view):
     """
     if view.size == 0:
         return view
-    out = pk.View(view.shape, view.dtype)
+    out = _get_out(out, view.shape, view.dtype)
     if len(view.shape) > 2:
         raise NotImplementedError("log1p() ufunc only supports up to 2D views")
     if "double" in view.dtype.__name__ or "float64" in view.dtype.__name__:
@@ -705,8 +824,9 @@ def sign_impl_2d_double(tid: int, view: pk.View2D[pk.double], out: pk.View2D[pk.
             out[tid][i] = nan("")
 
 
-def sign(view):
-    out = pk.View(view.shape, view.dtype)
+@_ufunc
+def sign(view, *, out=None):
+    out = _get_out(out, view.shape, view.dtype)
     if len(view.shape) > 2:
         raise NotImplementedError("only up to 2D views currently supported for sign() ufunc.")
     if "double" in view.dtype.__name__ or "float64" in view.dtype.__name__:
@@ -853,7 +973,8 @@ def add_impl_2d_2d(tid, viewA, viewB, out):
     out[r_idx][c_idx] = viewA[r_idx][c_idx] + viewB[r_idx][c_idx]
 
 
-def add(viewA, viewB):
+@_ufunc
+def add(viewA, viewB, *, out=None):
     """
     Sums positionally corresponding elements
     of viewA with elements of viewB
@@ -864,6 +985,10 @@ def add(viewA, viewB):
             Input view.
     viewB : pykokkos view or scalar
             Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -884,7 +1009,7 @@ def add(viewA, viewB):
 
     if viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
         if viewA.rank() == 1 and viewB.rank() == 1:
-            out = pk.View([viewA.shape[0]], pk.double)
+            out = _get_out(out, [viewA.shape[0]], pk.double)
             pk.parallel_for(
                 viewA.shape[0],
                 add_impl_1d_double,
@@ -892,7 +1017,7 @@ def add(viewA, viewB):
                 viewB=viewB,
                 out=out)
         elif viewA.rank() == 2 and viewB.rank() == 2:
-            out = pk.View([viewA.shape[0], viewA.shape[1]], pk.double)
+            out = _get_out(out, [viewA.shape[0], viewA.shape[1]], pk.double)
             pk.parallel_for(
                 viewA.shape[0] * viewA.shape[1],
                 add_impl_2d_2d,
@@ -902,7 +1027,7 @@ def add(viewA, viewB):
         else:
             larger = viewA if len(viewA.shape) > len(viewB.shape) else viewB
             smaller = viewB if len(viewA.shape) == len(larger.shape) else viewA
-            out = pk.View([larger.shape[0], larger.shape[1]], pk.double)
+            out = _get_out(out, [larger.shape[0], larger.shape[1]], pk.double)
             pk.parallel_for(
                 larger.shape[0],
                 add_impl_2d_1d,
@@ -912,7 +1037,7 @@ def add(viewA, viewB):
 
     elif viewA.dtype.__name__ == "float32" and viewB.dtype.__name__ == "float32":
         if viewA.rank() == 1 and viewB.rank() == 1:
-            out = pk.View([viewA.shape[0]], pk.float)
+            out = _get_out(out, [viewA.shape[0]], pk.float)
             pk.parallel_for(
                 viewA.shape[0],
                 add_impl_1d_float,
@@ -920,7 +1045,7 @@ def add(viewA, viewB):
                 viewB=viewB,
                 out=out)
         elif viewB.rank() == 2 and viewB.rank() == 2:
-            out = pk.View([viewA.shape[0], viewA.shape[1]], pk.float)
+            out = _get_out(out, [viewA.shape[0], viewA.shape[1]], pk.float)
             pk.parallel_for(
                 viewA.shape[0] * viewA.shape[1],
                 add_impl_2d_2d,
@@ -930,7 +1055,7 @@ def add(viewA, viewB):
         else:
             larger = viewA if len(viewA.shape) > len(viewB.shape) else viewB
             smaller = viewB if len(viewA.shape) == len(larger.shape) else viewA
-            out = pk.View([larger.shape[0], larger.shape[1]], pk.float)
+            out = _get_out(out, [larger.shape[0], larger.shape[1]], pk.float)
             pk.parallel_for(
                 larger.shape[0],
                 add_impl_2d_1d,
@@ -964,7 +1089,8 @@ def multiply_impl_2d_with_2d(tid, viewA, viewB, out):
     c_idx : int = tid - r_idx * viewA.extent(1)
     out[r_idx][c_idx] = viewA[r_idx][c_idx] * viewB[r_idx][c_idx]
 
-def multiply(viewA, viewB):
+@_ufunc
+def multiply(viewA, viewB, *, out=None):
     """
     Multiplies positionally corresponding elements
     of viewA with elements of viewB
@@ -975,6 +1101,10 @@ def multiply(viewA, viewB):
             Input view.
     viewB : pykokkos view or scalar
             Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -996,7 +1126,7 @@ def multiply(viewA, viewB):
 
     if viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
         if len(viewA.shape) == 1 and len(viewB.shape) == 1:
-            out = pk.View([viewA.shape[0]], pk.double)
+            out = _get_out(out, [viewA.shape[0]], pk.double)
             pk.parallel_for(
                 viewA.shape[0],
                 multiply_impl_1d_double,
@@ -1004,7 +1134,7 @@ def multiply(viewA, viewB):
                 viewB=viewB,
                 out=out)
         elif len(viewA.shape) == 2 and len(viewB.shape) == 2:
-            out = pk.View([viewA.shape[0], viewA.shape[1]], pk.double)
+            out = _get_out(out, [viewA.shape[0], viewA.shape[1]], pk.double)
             pk.parallel_for(
                 viewA.shape[0] * viewA.shape[1],
                 multiply_impl_2d_with_2d,
@@ -1014,7 +1144,7 @@ def multiply(viewA, viewB):
         else:
             larger = viewA if len(viewA.shape) > len(viewB.shape) else viewB
             smaller = viewB if len(viewA.shape) == len(larger.shape) else viewA
-            out = pk.View([larger.shape[0], larger.shape[1]], pk.double)
+            out = _get_out(out, [larger.shape[0], larger.shape[1]], pk.double)
             pk.parallel_for(
                 larger.shape[0] * larger.shape[1],
                 multiply_impl_2d_with_1d,
@@ -1024,7 +1154,7 @@ def multiply(viewA, viewB):
 
     elif viewA.dtype.__name__ == "float32" and viewB.dtype.__name__ == "float32":
         if len(viewA.shape) == 1 and len(viewB.shape) == 1:
-            out = pk.View([viewA.shape[0]], pk.float)
+            out = _get_out(out, [viewA.shape[0]], pk.float)
             pk.parallel_for(
                 viewA.shape[0],
                 multiply_impl_1d_float,
@@ -1032,7 +1162,7 @@ def multiply(viewA, viewB):
                 viewB=viewB,
                 out=out)
         elif len(viewA.shape) == 2 and len(viewB.shape) == 2:
-            out = pk.View([viewA.shape[0], viewA.shape[1]], pk.float)
+            out = _get_out(out, [viewA.shape[0], viewA.shape[1]], pk.float)
             pk.parallel_for(
                 viewA.shape[0] * viewA.shape[1],
                 multiply_impl_2d_with_2d,
@@ -1042,7 +1172,7 @@ def multiply(viewA, viewB):
         else:
             larger = viewA if len(viewA.shape) > len(viewB.shape) else viewB
             smaller = viewB if len(viewA.shape) == len(larger.shape) else viewA
-            out = pk.View([larger.shape[0], larger.shape[1]], pk.float)
+            out = _get_out(out, [larger.shape[0], larger.shape[1]], pk.float)
             pk.parallel_for(
                 larger.shape[0] * larger.shape[1],
                 multiply_impl_2d_with_1d,
@@ -1198,7 +1328,8 @@ def subtract_impl_scalar_2d(tid, cols, viewA, scalar, viewOut):
         viewOut[tid][i] = viewA[tid][i] - scalar
     
 
-def subtract(viewA, valB):
+@_ufunc
+def subtract(viewA, valB, *, out=None):
     """
     Subtracts positionally corresponding elements
     of viewA with elements of viewB
@@ -1209,6 +1340,10 @@ def subtract(viewA, valB):
             Input view.
     valB : pykokkos view or scalar
             Input view or scalar value.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -1244,7 +1379,7 @@ def subtract(viewA, valB):
         if viewA.dtype.__name__ == "float64" and valB.dtype.__name__ == "float64":
 
             if len(viewA.shape) == 1:
-                out = pk.View(viewA.shape, pk.double)
+                out = _get_out(out, viewA.shape, pk.double)
                 pk.parallel_for(
                     viewA.shape[0],
                     subtract_impl_1d_double,
@@ -1253,7 +1388,7 @@ def subtract(viewA, valB):
                     out=out)
 
             if len(viewA.shape) == 2:
-                out = pk.View([viewA.shape[0], viewA.shape[1]], pk.double)
+                out = _get_out(out, [viewA.shape[0], viewA.shape[1]], pk.double)
                 pk.parallel_for(
                     viewA.shape[0],
                     subtract_impl_2d,
@@ -1265,7 +1400,7 @@ def subtract(viewA, valB):
         elif viewA.dtype.__name__ == "float32" and valB.dtype.__name__ == "float32":
 
             if len(viewA.shape) == 1:
-                out = pk.View(viewA.shape, pk.float)
+                out = _get_out(out, viewA.shape, pk.float)
                 pk.parallel_for(
                     viewA.shape[0],
                     subtract_impl_1d_float,
@@ -1274,7 +1409,7 @@ def subtract(viewA, valB):
                     out=out)
 
             if len(viewA.shape) == 2:
-                out = pk.View([viewA.shape[0], viewA.shape[1]], pk.float)
+                out = _get_out(out, [viewA.shape[0], viewA.shape[1]], pk.float)
                 pk.parallel_for(
                     viewA.shape[0],
                     subtract_impl_2d,
@@ -1290,13 +1425,12 @@ def subtract(viewA, valB):
 
     # is scalar subtract -----------------------
     if len(viewA.shape) == 1: # 1D
-        out = None
         if viewA.dtype.__name__ == "float64":
-            out = pk.View(viewA.shape, pk.double)
-        if viewA.dtype.__name__ == "float32":
-            out = pk.View(viewA.shape, pk.float)
-        
-        if out is None: raise RuntimeError("Incompatible Types")
+            out = _get_out(out, viewA.shape, pk.double)
+        elif viewA.dtype.__name__ == "float32":
+            out = _get_out(out, viewA.shape, pk.float)
+        else:
+            raise RuntimeError("Incompatible Types")
 
         pk.parallel_for(viewA.shape[0], 
                         subtract_impl_scalar_1d, 
@@ -1305,13 +1439,12 @@ def subtract(viewA, valB):
                         viewOut=out)
     
     if len(viewA.shape) == 2: # 2D
-        out = None
         if viewA.dtype.__name__ == "float64":
-            out = pk.View([viewA.shape[0], viewA.shape[1]], pk.double)
-        if viewA.dtype.__name__ == "float32":
-            out = pk.View([viewA.shape[0], viewA.shape[1]], pk.float)
-        
-        if out is None: raise RuntimeError("Incompatible Types")
+            out = _get_out(out, [viewA.shape[0], viewA.shape[1]], pk.double)
+        elif viewA.dtype.__name__ == "float32":
+            out = _get_out(out, [viewA.shape[0], viewA.shape[1]], pk.float)
+        else:
+            raise RuntimeError("Incompatible Types")
         pk.parallel_for(viewA.shape[0], 
                         subtract_impl_scalar_2d, 
                         cols=viewA.shape[1], 
@@ -1585,7 +1718,8 @@ def divide_impl_2d_1d_double(tid: int, viewA: pk.View2D[pk.double], viewB: pk.Vi
         out[tid][i] = viewA[tid][i] / viewB[i % viewB.extent(0)]
 
 
-def divide(viewA, viewB):
+@_ufunc
+def divide(viewA, viewB, *, out=None):
     """
     Divides positionally corresponding elements
     of viewA with elements of viewB
@@ -1596,6 +1730,10 @@ def divide(viewA, viewB):
             Input view.
     viewB : pykokkos view
             Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -1609,7 +1747,7 @@ def divide(viewA, viewB):
         viewB = view_temp
 
     if viewA.rank() == 2:
-        out = pk.View(viewA.shape, pk.double)
+        out = _get_out(out, viewA.shape, pk.double)
         pk.parallel_for(
             viewA.shape[0],
             divide_impl_2d_1d_double,
@@ -1618,7 +1756,7 @@ def divide(viewA, viewB):
             out=out)
 
     elif viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
-        out = pk.View([viewA.shape[0]], pk.double)
+        out = _get_out(out, [viewA.shape[0]], pk.double)
         pk.parallel_for(
             viewA.shape[0],
             divide_impl_1d_double,
@@ -1627,7 +1765,7 @@ def divide(viewA, viewB):
             out=out)
 
     elif viewA.dtype.__name__ == "float32" and viewB.dtype.__name__ == "float32":
-        out = pk.View([viewA.shape[0]], pk.float)
+        out = _get_out(out, [viewA.shape[0]], pk.float)
         pk.parallel_for(
             viewA.shape[0],
             divide_impl_1d_float,
@@ -1648,7 +1786,8 @@ def negative_impl_1d_double(tid: int, view: pk.View1D[pk.double], out: pk.View1D
 def negative_impl_1d_float(tid: int, view: pk.View1D[pk.float], out: pk.View1D[pk.float]):
     out[tid] = view[tid] * -1
 
-def negative(view):
+@_ufunc
+def negative(view, *, out=None):
     """
     Element-wise negative of the view
 
@@ -1656,6 +1795,10 @@ def negative(view):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -1666,17 +1809,18 @@ def negative(view):
     if len(view.shape) > 1:
         raise NotImplementedError("only 1D views currently supported for negative() ufunc.")
     if view.dtype.__name__ == "float64":
-        out = pk.View([view.shape[0]], pk.double)
+        out = _get_out(out, [view.shape[0]], pk.double)
         pk.parallel_for(view.shape[0], negative_impl_1d_double, view=view, out=out)
     elif view.dtype.__name__ == "float32":
-        out = pk.View([view.shape[0]], pk.float)
+        out = _get_out(out, [view.shape[0]], pk.float)
         pk.parallel_for(view.shape[0], negative_impl_1d_float, view=view, out=out)
     else:
         raise NotImplementedError
     return out
 
 
-def positive(view):
+@_ufunc
+def positive(view, *, out=None):
     """
     Element-wise positive of the view;
     Essentially returns a copy of the view
@@ -1685,6 +1829,10 @@ def positive(view):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -1693,9 +1841,9 @@ def positive(view):
 
     """
     if view.shape == ():
-        out = pk.View((), dtype=view.dtype)
+        out = _get_out(out, (), dtype=view.dtype)
     else:
-        out = pk.View([*view.shape], dtype=view.dtype)
+        out = _get_out(out, [*view.shape], dtype=view.dtype)
     out[...] = view
     return out
 
@@ -1720,7 +1868,8 @@ def power_impl_2d_double(tid: int, viewA: pk.View2D[pk.double], viewB: pk.View1D
         out[tid][i] = pow(viewA[tid][i], viewB[i % viewB.extent(0)])
 
 
-def power(viewA, viewB):
+@_ufunc
+def power(viewA, viewB, *, out=None):
     """
     Returns a view with each val in viewA raised
     to the positionally corresponding power in viewB
@@ -1731,6 +1880,10 @@ def power(viewA, viewB):
             Input view.
     viewB : pykokkos view
             Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -1748,7 +1901,7 @@ def power(viewA, viewB):
         view_temp[0] = viewA
         viewA = view_temp
 
-        out = pk.View([viewB.shape[0]], pk.double)
+        out = _get_out(out, [viewB.shape[0]], pk.double)
         pk.parallel_for(
             viewB.shape[0],
             power_impl_scalar_double,
@@ -1756,7 +1909,7 @@ def power(viewA, viewB):
             viewB=viewB,
             out=out)
     elif viewA.rank() == 2:
-        out = pk.View(viewA.shape, pk.double)
+        out = _get_out(out, viewA.shape, pk.double)
         pk.parallel_for(
             viewA.shape[0],
             power_impl_2d_double,
@@ -1764,7 +1917,7 @@ def power(viewA, viewB):
             viewB=viewB,
             out=out)
     elif viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
-        out = pk.View([viewA.shape[0]], pk.double)
+        out = _get_out(out, [viewA.shape[0]], pk.double)
         pk.parallel_for(
             viewA.shape[0],
             power_impl_1d_double,
@@ -1773,7 +1926,7 @@ def power(viewA, viewB):
             out=out)
 
     elif viewA.dtype.__name__ == "float32" and viewB.dtype.__name__ == "float32":
-        out = pk.View([viewA.shape[0]], pk.float)
+        out = _get_out(out, [viewA.shape[0]], pk.float)
         pk.parallel_for(
             viewA.shape[0],
             power_impl_1d_float,
@@ -1795,7 +1948,8 @@ def fmod_impl_1d_float(tid: int, viewA: pk.View1D[pk.float], viewB: pk.View1D[pk
     out[tid] = fmod(viewA[tid], viewB[tid])
 
 
-def fmod(viewA, viewB):
+@_ufunc
+def fmod(viewA, viewB, *, out=None):
     """
     Element-wise remainder of division when element of viewA is
     divided by positionally corresponding element of viewB
@@ -1806,6 +1960,10 @@ def fmod(viewA, viewB):
             Input view.
     viewB : pykokkos view
             Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -1817,7 +1975,7 @@ def fmod(viewA, viewB):
     if len(viewA.shape) > 1 or len(viewB.shape) > 1:
         raise NotImplementedError("fmod() ufunc only supports 1D views")
     if viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
-        out = pk.View([viewA.shape[0]], pk.double)
+        out = _get_out(out, [viewA.shape[0]], pk.double)
         pk.parallel_for(
             viewA.shape[0],
             fmod_impl_1d_double,
@@ -1826,7 +1984,7 @@ def fmod(viewA, viewB):
             out=out)
 
     elif viewA.dtype.__name__ == "float32" and viewB.dtype.__name__ == "float32":
-        out = pk.View([viewA.shape[0]], pk.float)
+        out = _get_out(out, [viewA.shape[0]], pk.float)
         pk.parallel_for(
             viewA.shape[0],
             fmod_impl_1d_float,
@@ -1947,7 +2105,8 @@ def square_impl_2d_int64(tid: int, view: pk.View2D[pk.int64], out: pk.View2D[pk.
     for i in range(view.extent(1)):
         out[tid][i] = view[tid][i] * view[tid][i]
 
-def square(view):
+@_ufunc
+def square(view, *, out=None):
     """
     Squares argument element-wise
 
@@ -1955,6 +2114,10 @@ def square(view):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -1964,7 +2127,7 @@ def square(view):
     """
     if len(view.shape) > 2:
         raise NotImplementedError("only up to 2D views currently supported for square() ufunc.")
-    out = pk.View(view.shape, view.dtype)
+    out = _get_out(out, view.shape, view.dtype)
     if "double" in view.dtype.__name__ or "float64" in view.dtype.__name__:
         if view.shape == ():
             pk.parallel_for(1, square_impl_1d_double, view=view, out=out)
@@ -2050,7 +2213,8 @@ def greater_impl_1d_float(tid: int, viewA: pk.View1D[pk.float], viewB: pk.View1D
     out[tid] = viewA[tid] > viewB[tid]
 
 
-def greater(viewA, viewB):
+@_ufunc
+def greater(viewA, viewB, *, out=None):
     """
     Return the truth value of viewA > viewB element-wise.
 
@@ -2060,6 +2224,10 @@ def greater(viewA, viewB):
             Input view.
     viewB : pykokkos view
             Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -2069,7 +2237,7 @@ def greater(viewA, viewB):
     """
     if len(viewA.shape) > 1 or len(viewB.shape) > 1:
         raise NotImplementedError("greater() ufunc only supports 1D views")
-    out = pk.View([viewA.shape[0]], pk.uint8)
+    out = _get_out(out, [viewA.shape[0]], pk.uint8)
     if viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
         pk.parallel_for(
             viewA.shape[0],
@@ -2100,7 +2268,8 @@ def logaddexp_impl_1d_float(tid: int, viewA: pk.View1D[pk.float], viewB: pk.View
     out[tid] = log(exp(viewA[tid]) + exp(viewB[tid]))
 
 
-def logaddexp(viewA, viewB):
+@_ufunc
+def logaddexp(viewA, viewB, *, out=None):
     """
     Return a view with log(exp(a) + exp(b)) calculate for
     positionally corresponding elements in viewA and viewB
@@ -2111,6 +2280,10 @@ def logaddexp(viewA, viewB):
             Input view.
     viewB : pykokkos view
             Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -2121,7 +2294,7 @@ def logaddexp(viewA, viewB):
     if len(viewA.shape) > 1 or len(viewB.shape) > 1:
         raise NotImplementedError("only 1D views currently supported for logaddexp() ufunc.")
     if viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
-        out = pk.View([viewA.shape[0]], pk.double)
+        out = _get_out(out, [viewA.shape[0]], pk.double)
         pk.parallel_for(
             viewA.shape[0],
             logaddexp_impl_1d_double,
@@ -2130,7 +2303,7 @@ def logaddexp(viewA, viewB):
             out=out)
 
     elif viewA.dtype.__name__ == "float32" and viewB.dtype.__name__ == "float32":
-        out = pk.View([viewA.shape[0]], pk.float)
+        out = _get_out(out, [viewA.shape[0]], pk.float)
         pk.parallel_for(
             viewA.shape[0],
             logaddexp_impl_1d_float,
@@ -2141,7 +2314,8 @@ def logaddexp(viewA, viewB):
         raise RuntimeError("Incompatible Types")
     return out
 
-def true_divide(viewA, viewB):
+@_ufunc
+def true_divide(viewA, viewB, *, out=None):
     """
     true_divide is an alias of divide
 
@@ -2151,6 +2325,10 @@ def true_divide(viewA, viewB):
             Input view.
     viewB : pykokkos view
             Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -2159,7 +2337,7 @@ def true_divide(viewA, viewB):
 
     """
 
-    return divide(viewA, viewB)
+    return divide(viewA, viewB, out=out)
 
 
 @pk.workunit
@@ -2172,7 +2350,8 @@ def logaddexp2_impl_1d_float(tid: int, viewA: pk.View1D[pk.float], viewB: pk.Vie
     out[tid] = log2(pow(2, viewA[tid]) + pow(2, viewB[tid]))
 
 
-def logaddexp2(viewA, viewB):
+@_ufunc
+def logaddexp2(viewA, viewB, *, out=None):
     """
     Return a view with log(pow(2, a) + pow(2, b)) calculated for
     positionally corresponding elements in viewA and viewB
@@ -2183,6 +2362,10 @@ def logaddexp2(viewA, viewB):
             Input view.
     viewB : pykokkos view
             Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -2193,7 +2376,7 @@ def logaddexp2(viewA, viewB):
     if len(viewA.shape) > 1 or len(viewB.shape) > 1:
         raise NotImplementedError("only 1D views currently supported for logaddexp2() ufunc.")
     if viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
-        out = pk.View([viewA.shape[0]], pk.double)
+        out = _get_out(out, [viewA.shape[0]], pk.double)
         pk.parallel_for(
             viewA.shape[0],
             logaddexp2_impl_1d_double,
@@ -2202,7 +2385,7 @@ def logaddexp2(viewA, viewB):
             out=out)
 
     elif viewA.dtype.__name__ == "float32" and viewB.dtype.__name__ == "float32":
-        out = pk.View([viewA.shape[0]], pk.float)
+        out = _get_out(out, [viewA.shape[0]], pk.float)
         pk.parallel_for(
             viewA.shape[0],
             logaddexp2_impl_1d_float,
@@ -2224,7 +2407,8 @@ def floor_divide_impl_1d_float(tid: int, viewA: pk.View1D[pk.float], viewB: pk.V
     out[tid] = viewA[tid] // viewB[tid]
 
 
-def floor_divide(viewA, viewB):
+@_ufunc
+def floor_divide(viewA, viewB, *, out=None):
     """
     Divides positionally corresponding elements
     of viewA with elements of viewB and floors the result
@@ -2235,6 +2419,10 @@ def floor_divide(viewA, viewB):
             Input view.
     viewB : pykokkos view
             Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -2245,7 +2433,7 @@ def floor_divide(viewA, viewB):
     if len(viewA.shape) > 1 or len(viewB.shape) > 1:
         raise NotImplementedError("only 1D views currently supported for floor_divide() ufunc.")
     if viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
-        out = pk.View([viewA.shape[0]], pk.double)
+        out = _get_out(out, [viewA.shape[0]], pk.double)
         pk.parallel_for(
             viewA.shape[0],
             floor_divide_impl_1d_double,
@@ -2254,7 +2442,7 @@ def floor_divide(viewA, viewB):
             out=out)
 
     elif viewA.dtype.__name__ == "float32" and viewB.dtype.__name__ == "float32":
-        out = pk.View([viewA.shape[0]], pk.float)
+        out = _get_out(out, [viewA.shape[0]], pk.float)
         pk.parallel_for(
             viewA.shape[0],
             floor_divide_impl_1d_float,
@@ -2266,7 +2454,8 @@ def floor_divide(viewA, viewB):
     return out
 
 
-def sin(view):
+@_ufunc
+def sin(view, *, out=None):
     """
     Element-wise trigonometric sine of the view
 
@@ -2274,6 +2463,10 @@ def sin(view):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -2285,7 +2478,7 @@ def sin(view):
     ndims = len(view.shape)
     if ndims > 2:
         raise NotImplementedError("sin() ufunc only supports up to 2D views")
-    out = pk.View([*view.shape], dtype=dtype)
+    out = _get_out(out, [*view.shape], dtype=dtype)
     if view.shape == ():
         tid = 1
     else:
@@ -2322,7 +2515,8 @@ def cos_impl_2d_float(tid: int, view: pk.View2D[pk.float], out: pk.View2D[pk.flo
         out[tid][i] = cos(view[tid][i])
 
 
-def cos(view):
+@_ufunc
+def cos(view, *, out=None):
     """
     Element-wise trigonometric cosine of the view
 
@@ -2330,6 +2524,10 @@ def cos(view):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -2340,13 +2538,13 @@ def cos(view):
     if len(view.shape) > 2:
         raise NotImplementedError("only up to 2D views currently supported for cos() ufunc.")
     if "double" in view.dtype.__name__ or "float64" in view.dtype.__name__:
-        out = pk.View([*view.shape], dtype=pk.float64)
+        out = _get_out(out, [*view.shape], dtype=pk.float64)
         if len(view.shape) == 1:
             pk.parallel_for(view.shape[0], cos_impl_1d_double, view=view, out=out)
         elif len(view.shape) == 2:
             pk.parallel_for(view.shape[0], cos_impl_2d_double, view=view, out=out)
     elif "float" in view.dtype.__name__:
-        out = pk.View([*view.shape], dtype=pk.float32)
+        out = _get_out(out, [*view.shape], dtype=pk.float32)
         if len(view.shape) == 1:
             pk.parallel_for(view.shape[0], cos_impl_1d_float, view=view, out=out)
         elif len(view.shape) == 2:
@@ -2356,7 +2554,8 @@ def cos(view):
     return out
 
 
-def tan(view):
+@_ufunc
+def tan(view, *, out=None):
     """
     Element-wise tangent of the view
 
@@ -2364,6 +2563,10 @@ def tan(view):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -2375,7 +2578,7 @@ def tan(view):
     ndims = len(view.shape)
     if ndims > 2:
         raise NotImplementedError("tan() ufunc only supports up to 2D views")
-    out = pk.View([*view.shape], dtype=dtype)
+    out = _get_out(out, [*view.shape], dtype=dtype)
     if view.shape == ():
         tid = 1
     else:
@@ -2400,7 +2603,8 @@ def logical_and_impl_1d_float(tid: int, viewA: pk.View1D[pk.float], viewB: pk.Vi
     out[tid] = viewA[tid] and viewB[tid]
 
 
-def logical_and(viewA, viewB):
+@_ufunc
+def logical_and(viewA, viewB, *, out=None):
     """
     Return the element-wise truth value of viewA AND viewB.
 
@@ -2410,6 +2614,10 @@ def logical_and(viewA, viewB):
             Input view.
     viewB : pykokkos view
             Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -2419,7 +2627,7 @@ def logical_and(viewA, viewB):
     """
     if len(viewA.shape) > 1 or len(viewB.shape) > 1:
         raise NotImplementedError("only 1D views currently supported for logical_and() ufunc.")
-    out = pk.View([viewA.shape[0]], pk.uint8)
+    out = _get_out(out, [viewA.shape[0]], pk.uint8)
     if viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
         pk.parallel_for(
             viewA.shape[0],
@@ -2450,7 +2658,8 @@ def logical_or_impl_1d_float(tid: int, viewA: pk.View1D[pk.float], viewB: pk.Vie
     out[tid] = viewA[tid] or viewB[tid]
 
 
-def logical_or(viewA, viewB):
+@_ufunc
+def logical_or(viewA, viewB, *, out=None):
     """
     Return the element-wise truth value of viewA OR viewB.
 
@@ -2460,6 +2669,10 @@ def logical_or(viewA, viewB):
             Input view.
     viewB : pykokkos view
             Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -2469,7 +2682,7 @@ def logical_or(viewA, viewB):
     """
     if len(viewA.shape) > 1 or len(viewB.shape) > 1:
         raise NotImplementedError("only 1D views currently supported for logical_or() ufunc.")
-    out = pk.View([viewA.shape[0]], pk.uint8)
+    out = _get_out(out, [viewA.shape[0]], pk.uint8)
     if viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
         pk.parallel_for(
             viewA.shape[0],
@@ -2500,7 +2713,8 @@ def logical_xor_impl_1d_float(tid: int, viewA: pk.View1D[pk.float], viewB: pk.Vi
     out[tid] = bool(viewA[tid]) ^ bool(viewB[tid])
 
 
-def logical_xor(viewA, viewB):
+@_ufunc
+def logical_xor(viewA, viewB, *, out=None):
     """
     Return the element-wise truth value of viewA XOR viewB.
 
@@ -2510,6 +2724,10 @@ def logical_xor(viewA, viewB):
             Input view.
     viewB : pykokkos view
             Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -2519,7 +2737,7 @@ def logical_xor(viewA, viewB):
     """
     if len(viewA.shape) > 1 or len(viewB.shape) > 1:
         raise NotImplementedError("only 1D views currently supported for logical_xor() ufunc.")
-    out = pk.View([viewA.shape[0]], pk.uint8)
+    out = _get_out(out, [viewA.shape[0]], pk.uint8)
     if viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
         pk.parallel_for(
             viewA.shape[0],
@@ -2550,7 +2768,8 @@ def logical_not_impl_1d_float(tid: int, view: pk.View1D[pk.float], out: pk.View1
     out[tid] = not view[tid]
 
 
-def logical_not(view):
+@_ufunc
+def logical_not(view, *, out=None):
     """
     Element-wise logical_not of the view.
 
@@ -2558,6 +2777,10 @@ def logical_not(view):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -2567,7 +2790,7 @@ def logical_not(view):
     """
     if len(view.shape) > 1:
         raise NotImplementedError("only 1D views currently supported for logical_not() ufunc.")
-    out = pk.View([view.shape[0]], pk.uint8)
+    out = _get_out(out, [view.shape[0]], pk.uint8)
     if view.dtype.__name__ == "float64":
         pk.parallel_for(view.shape[0], logical_not_impl_1d_double, view=view, out=out)
     elif view.dtype.__name__ == "float32":
@@ -2585,7 +2808,8 @@ def fmax_impl_1d_float(tid: int, viewA: pk.View1D[pk.float], viewB: pk.View1D[pk
     out[tid] = fmax(viewA[tid], viewB[tid])
 
 
-def fmax(viewA, viewB):
+@_ufunc
+def fmax(viewA, viewB, *, out=None):
     """
     Return the element-wise fmax.
 
@@ -2595,6 +2819,10 @@ def fmax(viewA, viewB):
             Input view.
     viewB : pykokkos view
             Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -2605,7 +2833,7 @@ def fmax(viewA, viewB):
     if len(viewA.shape) > 1 or len(viewB.shape) > 1:
         raise NotImplementedError("fmax() ufunc only supports 1D views")
     if viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
-        out = pk.View([viewA.shape[0]], pk.double)
+        out = _get_out(out, [viewA.shape[0]], pk.double)
         pk.parallel_for(
             viewA.shape[0],
             fmax_impl_1d_double,
@@ -2614,7 +2842,7 @@ def fmax(viewA, viewB):
             out=out)
 
     elif viewA.dtype.__name__ == "float32" and viewB.dtype.__name__ == "float32":
-        out = pk.View([viewA.shape[0]], pk.float)
+        out = _get_out(out, [viewA.shape[0]], pk.float)
         pk.parallel_for(
             viewA.shape[0],
             fmax_impl_1d_float,
@@ -2636,7 +2864,8 @@ def fmin_impl_1d_float(tid: int, viewA: pk.View1D[pk.float], viewB: pk.View1D[pk
     out[tid] = fmin(viewA[tid], viewB[tid])
 
 
-def fmin(viewA, viewB):
+@_ufunc
+def fmin(viewA, viewB, *, out=None):
     """
     Return the element-wise fmin.
 
@@ -2646,6 +2875,10 @@ def fmin(viewA, viewB):
             Input view.
     viewB : pykokkos view
             Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -2656,7 +2889,7 @@ def fmin(viewA, viewB):
     if len(viewA.shape) > 1 or len(viewB.shape) > 1:
         raise NotImplementedError("fmax() ufunc only supports 1D views")
     if viewA.dtype.__name__ == "float64" and viewB.dtype.__name__ == "float64":
-        out = pk.View([viewA.shape[0]], pk.double)
+        out = _get_out(out, [viewA.shape[0]], pk.double)
         pk.parallel_for(
             viewA.shape[0],
             fmin_impl_1d_double,
@@ -2665,7 +2898,7 @@ def fmin(viewA, viewB):
             out=out)
 
     elif viewA.dtype.__name__ == "float32" and viewB.dtype.__name__ == "float32":
-        out = pk.View([viewA.shape[0]], pk.float)
+        out = _get_out(out, [viewA.shape[0]], pk.float)
         pk.parallel_for(
             viewA.shape[0],
             fmin_impl_1d_float,
@@ -2677,7 +2910,8 @@ def fmin(viewA, viewB):
     return out
 
 
-def exp(view):
+@_ufunc
+def exp(view, *, out=None):
     """
     Element-wise exp of the view.
 
@@ -2685,6 +2919,10 @@ def exp(view):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -2698,7 +2936,7 @@ def exp(view):
         raise NotImplementedError("exp() ufunc only supports up to 2D views")
     if view.size == 0:
         return view
-    out = pk.View([*view.shape], dtype=dtype)
+    out = _get_out(out, [*view.shape], dtype=dtype)
     if view.shape == ():
         tid = 1
     else:
@@ -2723,7 +2961,8 @@ def exp2_impl_1d_float(tid: int, view: pk.View1D[pk.float], out: pk.View1D[pk.fl
     out[tid] = pow(2, view[tid])
 
 
-def exp2(view):
+@_ufunc
+def exp2(view, *, out=None):
     """
     Element-wise 2**x of the view.
 
@@ -2731,6 +2970,10 @@ def exp2(view):
     ----------
     view : pykokkos view
            Input view.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -2741,10 +2984,10 @@ def exp2(view):
     if len(view.shape) > 1:
         raise NotImplementedError("only 1D views currently supported for exp2() ufunc.")
     if view.dtype.__name__ == "float64":
-        out = pk.View([view.shape[0]], pk.double)
+        out = _get_out(out, [view.shape[0]], pk.double)
         pk.parallel_for(view.shape[0], exp2_impl_1d_double, view=view, out=out)
     elif view.dtype.__name__ == "float32":
-        out = pk.View([view.shape[0]], pk.float)
+        out = _get_out(out, [view.shape[0]], pk.float)
         pk.parallel_for(view.shape[0], exp2_impl_1d_float, view=view, out=out)
     else:
         raise NotImplementedError
@@ -2969,12 +3212,13 @@ def index(viewA, viewB):
     return out
 
 
-def isnan(view):
+@_ufunc
+def isnan(view, *, out=None):
     dtype = view.dtype
     ndims = len(view.shape)
     if ndims > 2:
         raise NotImplementedError("isnan() ufunc only supports up to 2D views")
-    out = pk.View([*view.shape], dtype=pk.bool)
+    out = _get_out(out, [*view.shape], dtype=pk.bool)
     if view.shape == ():
         tid = 1
     else:
@@ -2993,12 +3237,13 @@ def isnan(view):
     return out
 
 
-def isinf(view):
+@_ufunc
+def isinf(view, *, out=None):
     dtype = view.dtype
     ndims = len(view.shape)
     if ndims > 2:
         raise NotImplementedError("isinf() ufunc only supports up to 2D views")
-    out = pk.View([*view.shape], dtype=pk.bool)
+    out = _get_out(out, [*view.shape], dtype=pk.bool)
     if view.shape == ():
         tid = 1
     else:
@@ -3013,7 +3258,8 @@ def isinf(view):
     return out
 
 
-def equal(view1, view2):
+@_ufunc
+def equal(view1, view2, *, out=None):
     """
     Computes the truth value of ``view1_i`` == ``view2_i`` for each element
     ``x1_i`` of the input view ``view1`` with the respective element ``x2_i``
@@ -3027,6 +3273,10 @@ def equal(view1, view2):
     view2 : pykokkos view
             Input view. May have any data type, but must be shape-compatible
             with ``view1`` via broadcasting.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -3044,7 +3294,7 @@ def equal(view1, view2):
     ndims = len(view1.shape)
     if ndims > 5:
         raise NotImplementedError("equal() ufunc only supports up to 5D views")
-    out = pk.View([*view1.shape], dtype=pk.bool)
+    out = _get_out(out, [*view1.shape], dtype=pk.bool)
     if view1.shape == ():
         tid = 1
     else:
@@ -3068,15 +3318,16 @@ def equal(view1, view2):
     return out
 
 
-def isfinite(view):
+@_ufunc
+def isfinite(view, *, out=None):
     dtype = view.dtype
     ndims = len(view.shape)
     if ndims > 2:
         raise NotImplementedError("isfinite() ufunc only supports up to 2D views")
     if view.size == 0:
-        out = pk.View(view.shape, dtype=pk.bool)
+        out = _get_out(out, view.shape, dtype=pk.bool)
         return out
-    out = pk.View([*view.shape], dtype=pk.bool)
+    out = _get_out(out, [*view.shape], dtype=pk.bool)
     if view.shape == ():
         new_view = pk.View([1], dtype=dtype)
         new_view[:] = view
@@ -3094,7 +3345,8 @@ def isfinite(view):
     return out
 
 
-def round(view):
+@_ufunc
+def round(view, *, out=None):
     """
     Rounds each element of the input view to the nearest integer-valued number.
 
@@ -3102,6 +3354,10 @@ def round(view):
     ----------
     view : pykokkos view
            Should have a numeric data type.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -3121,7 +3377,7 @@ def round(view):
     if "int" in dtype_str:
         # special case defined in API std
         return view
-    out = pk.View(view.shape, dtype=dtype)
+    out = _get_out(out, view.shape, dtype=dtype)
     if ndims > 3:
         raise NotImplementedError("only up to 3D views currently supported for round() ufunc.")
         
@@ -3141,7 +3397,8 @@ def round(view):
     return out
 
 
-def trunc(view):
+@_ufunc
+def trunc(view, *, out=None):
     """
     Rounds each element ``i`` of the input view to the integer-valued number
     that is closest to but no greater than ``i``.
@@ -3150,6 +3407,10 @@ def trunc(view):
     ----------
     view : pykokkos view
            Should have a numeric data type.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -3169,7 +3430,7 @@ def trunc(view):
     if "int" in dtype_str:
         # special case defined in API std
         return view
-    out = pk.View(view.shape, dtype=dtype)
+    out = _get_out(out, view.shape, dtype=dtype)
     if ndims > 3:
         raise NotImplementedError("only up to 3D views currently supported for trunc() ufunc.")
 
@@ -3189,7 +3450,8 @@ def trunc(view):
     return out
 
 
-def ceil(view):
+@_ufunc
+def ceil(view, *, out=None):
     """
     Rounds each element of the input view to the smallest (i.e., closest to -infinity)
     integer-valued number that is not less than a given element.
@@ -3198,6 +3460,10 @@ def ceil(view):
     ----------
     view : pykokkos view
            Should have a numeric data type.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -3217,7 +3483,7 @@ def ceil(view):
     if "int" in dtype_str:
         # special case defined in API std
         return view
-    out = pk.View(view.shape, dtype=dtype)
+    out = _get_out(out, view.shape, dtype=dtype)
     if ndims > 3:
         raise NotImplementedError("only up to 3D views currently supported for ceil() ufunc.")
 
@@ -3237,7 +3503,8 @@ def ceil(view):
     return out
 
 
-def floor(view):
+@_ufunc
+def floor(view, *, out=None):
     """
     Rounds each element of the input view to the greatest (i.e., closest to +infinity)
     integer-valued number that is not greater than a given element.
@@ -3246,6 +3513,10 @@ def floor(view):
     ----------
     view : pykokkos view
            Should have a numeric data type.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -3265,7 +3536,7 @@ def floor(view):
     if "int" in dtype_str:
         # special case defined in API std
         return view
-    out = pk.View(view.shape, dtype=dtype)
+    out = _get_out(out, view.shape, dtype=dtype)
     if ndims > 3:
         raise NotImplementedError("only up to 3D views currently supported for floor() ufunc.")
 
@@ -3285,7 +3556,8 @@ def floor(view):
     return out
 
 
-def tanh(view):
+@_ufunc
+def tanh(view, *, out=None):
     """
     Calculates an approximation to the hyperbolic tangent for each element x_i of the input view.
 
@@ -3293,6 +3565,10 @@ def tanh(view):
     ----------
     view : pykokkos view
             Input view whose elements each represent a hyperbolic angle. Should have a floating-point data type.
+    out : pykokkos view, optional
+          View with the shape and dtype of the result to store it in.
+    where : pykokkos view or bool, optional
+            Only the elements where this is true are set in out.
 
     Returns
     -------
@@ -3304,7 +3580,7 @@ def tanh(view):
     ndims = len(view.shape)
     if ndims > 2:
         raise NotImplementedError("tanh() ufunc only supports up to 2D views")
-    out = pk.View([*view.shape], dtype=dtype)
+    out = _get_out(out, [*view.shape], dtype=dtype)
     if view.shape == ():
         tid = 1
     else:
@@ -1,14 +1,43 @@
+import threading
 from typing import Optional, TYPE_CHECKING
 if TYPE_CHECKING:
     from pykokkos.core import Runtime
 
 # This module holds a reference to a singleton runtime object
-# accessible from anywhere. The runtime object will be initialized
-# elsewhere.
+# accessible from anywhere. The runtime object is created on first
+# access, as importing pykokkos.core is costly.
+
+# Guards the creation of the runtime when several threads dispatch
+# for the first time at once
+runtime_lock = threading.Lock()
 
 class RuntimeSingleton:
     def __init__(self):
-        self.runtime: Optional[Runtime] = None
+        self._runtime: Optional[Runtime] = None
+        self._deleted: bool = False
+
+    @property
+    def runtime(self) -> "Runtime":
+        if self._deleted:
+            raise AttributeError("The runtime has been deleted")
+
+        if self._runtime is None:
+            with runtime_lock:
+                if self._runtime is None:
+                    from pykokkos.core import Runtime
+                    self._runtime = Runtime()
+
+        return self._runtime
+
+    @runtime.setter
+    def runtime(self, runtime: "Runtime") -> None:
+        self._runtime = runtime
+        self._deleted = False
+
+    @runtime.deleter
+    def runtime(self) -> None:
+        self._runtime = None
+        self._deleted = True
 
 
 runtime_singleton = RuntimeSingleton()
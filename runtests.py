@@ -10,6 +10,10 @@ import pytest
 cwd = os.getcwd()
 shutil.rmtree(os.path.join(cwd, "pk_cpp"),
               ignore_errors=True)
+# keep the kernel cache under pk_cpp so that
+# it is purged along with it
+os.environ.setdefault("PK_CACHE_DIR",
+                      os.path.join(cwd, "pk_cpp", "cache"))
 
 from tests import _logging_probe
 
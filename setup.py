@@ -5,5 +5,4 @@ setup(
     version="0.1",
     packages=find_packages(include=["pykokkos", "pykokkos.*"]),
     include_package_data=True,
-    package_data={"": ["*.sh"]}
 )
@@ -0,0 +1,88 @@
+import concurrent.futures
+import os
+import unittest
+
+import pykokkos as pk
+
+
+@pk.workunit
+def async_init(i: int, view: pk.View1D[pk.double], init: float):
+    view[i] = init
+
+
+@pk.workunit
+def async_sum(i: int, acc: pk.Acc[pk.double], view: pk.View1D[pk.double]):
+    acc += view[i]
+
+
+@pk.workunit
+def async_scale(i: int, view: pk.View1D[pk.double], factor: float):
+    view[i] *= factor
+
+
+class TestAsync(unittest.TestCase):
+    def setUp(self):
+        self.threads: int = 10
+        self.view: pk.View1D[pk.double] = pk.View([self.threads], pk.double)
+        self.runtime = pk.runtime_singleton.runtime
+        if self.runtime.is_debug(pk.ExecutionSpace.Default):
+            self.skipTest("dispatches to the Debug space always run synchronously")
+
+        self.previous_executor = self.runtime.async_executor
+        self.runtime.async_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="pk_async")
+        os.environ["PK_ASYNC"] = "1"
+
+    def tearDown(self):
+        self.runtime.fence()
+        self.runtime.async_executor.shutdown(wait=True)
+        self.runtime.async_executor = self.previous_executor
+        os.environ.pop("PK_ASYNC", None)
+
+    def test_handles(self):
+        handle = pk.parallel_for(self.threads, async_init, view=self.view, init=2.0)
+        result = pk.parallel_reduce(self.threads, async_sum, view=self.view)
+
+        self.assertIsNone(handle.wait())
+        self.assertEqual(result.wait(), 2.0 * self.threads)
+        self.assertEqual(result, 2.0 * self.threads)
+
+    def test_view_access(self):
+        pk.parallel_for(self.threads, async_init, view=self.view, init=1.0)
+        pk.parallel_for(self.threads, async_scale, view=self.view, factor=3.0)
+
+        # reading the view waits for the kernels using it
+        for i in range(self.threads):
+            self.assertEqual(self.view[i], 3.0)
+
+    def test_future_argument(self):
+        pk.parallel_for(self.threads, async_init, view=self.view, init=1.0)
+        total = pk.parallel_reduce(self.threads, async_sum, view=self.view)
+        pk.parallel_for(self.threads, async_scale, view=self.view, factor=total)
+        pk.fence()
+
+        self.assertEqual(self.runtime.pending, [])
+        for i in range(self.threads):
+            self.assertEqual(self.view[i], float(self.threads))
+
+    def test_subview_write(self):
+        subview = self.view[2:8]
+        pk.parallel_for(6, async_init, view=subview, init=4.0)
+        self.assertIs(self.runtime.pending_views[id(self.view)][0], self.view)
+
+        # reading the parent waits for the kernel writing the subview
+        for i in range(2, 8):
+            self.assertEqual(self.view[i], 4.0)
+        self.assertNotIn(id(self.view), self.runtime.pending_views)
+
+    def test_shared_memory(self):
+        alias = pk.array(self.view.data)
+        pk.parallel_for(self.threads, async_init, view=alias, init=5.0)
+
+        # self.view is not an argument, but shares memory with one
+        self.assertTrue(self.runtime.shares_pending_memory(self.view))
+        for i in range(self.threads):
+            self.assertEqual(self.view[i], 5.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
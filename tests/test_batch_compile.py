@@ -0,0 +1,76 @@
+import unittest
+
+import pykokkos as pk
+from pykokkos.core.translators import PyKokkosMembers, StaticTranslator, TranslatedEntity
+
+
+@pk.workunit
+def batch_init(i: int, view: pk.View1D[pk.int32], init: int):
+    view[i] = init
+
+
+@pk.workunit
+def batch_sum(i: int, acc: pk.Acc[pk.double], view: pk.View1D[pk.double]):
+    acc += view[i]
+
+
+@pk.workunit
+def batch_inferred(i, view, init):
+    view[i] = init
+
+
+class TestBatchCompile(unittest.TestCase):
+    def setUp(self):
+        self.threads: int = 10
+        self.int_view: pk.View1D[pk.int32] = pk.View([self.threads], pk.int32)
+        self.double_view: pk.View1D[pk.double] = pk.View([self.threads], pk.double)
+
+    def test_batch_then_dispatch(self):
+        compiled = pk.batch_compile([batch_init, batch_sum, batch_inferred])
+        if pk.ExecutionSpace.Default is not pk.ExecutionSpace.Debug:
+            self.assertEqual(sorted(compiled), ["batch_init", "batch_sum"])
+
+            modules = {m[1] for m in pk.runtime_singleton.runtime.batch_modules.values()}
+            self.assertEqual(len(modules), 1)
+
+        pk.parallel_for(self.threads, batch_init, view=self.int_view, init=4)
+        for i in range(self.threads):
+            self.assertEqual(self.int_view[i], 4)
+
+        self.double_view.fill(2.0)
+        result = pk.parallel_reduce(self.threads, batch_sum, view=self.double_view)
+        self.assertEqual(result, 2.0 * self.threads)
+
+        # not batch compiled, so compiled on its own
+        pk.parallel_for(self.threads, batch_inferred, view=self.int_view, init=7)
+        for i in range(self.threads):
+            self.assertEqual(self.int_view[i], 7)
+
+    def test_assemble(self):
+        translator = StaticTranslator("module", "functor.hpp", "functor_cast.hpp", PyKokkosMembers())
+        translations = [
+            TranslatedEntity(["struct A;", "struct A {};"], "struct pk_functor_f {};", ["cast_f"], ["run_f", "wrapper_f"], ["wrapper_f"]),
+            TranslatedEntity(["struct A;", "struct A {};"], "struct pk_functor_g {};", ["cast_g"], ["run_g", "wrapper_g"], ["wrapper_g"]),
+        ]
+
+        functor, bindings, cast = translator.assemble("pk_batch", translations)
+
+        # the shared classtypes are only emitted once
+        self.assertEqual(functor.count("struct A {};"), 1)
+        self.assertIn("struct pk_functor_f {};", functor)
+        self.assertIn("struct pk_functor_g {};", functor)
+        self.assertIn("cast_f", cast)
+        self.assertIn("cast_g", cast)
+
+        modules = [b for b in bindings if b.startswith("PYBIND11_MODULE")]
+        self.assertEqual(len(modules), 1)
+        self.assertIn("&wrapper_f", modules[0])
+        self.assertIn("&wrapper_g", modules[0])
+
+    def test_invalid_source(self):
+        with self.assertRaises(TypeError):
+            pk.batch_compile(1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+import os
+from pathlib import Path
+import tempfile
+import unittest
+from unittest import mock
+
+from pykokkos.core.build_driver import BuildDriver, CompilationError, get_cxx_standard
+from pykokkos.core.cpp_setup import CppSetup, get_header_hash, get_pgo_mode
+from pykokkos.interface import ExecutionSpace
+
+
+class TestBuildDriver(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+        with open(self.path / "KokkosCore_config.h", "w") as f:
+            f.write("#define KOKKOS_VERSION 40100\n#define KOKKOS_ENABLE_CXX17\n")
+
+        self.args = {
+            "compiler": "g++",
+            "module": "kernel.so",
+            "space": "OpenMP",
+            "view_space": "Kokkos::HostSpace",
+            "view_layout": "Kokkos::LayoutRight",
+            "precision": "double",
+            "lib_path": str(self.path / "lib"),
+            "include_path": str(self.path),
+            "compute_capability": "",
+            "lib_suffix": "",
+            "compiler_path": "g++",
+            "pch_dir": str(self.path / "pch"),
+        }
+
+    def tearDown(self):
+        self.directory.cleanup()
+        os.environ.pop("PK_PGO", None)
+        os.environ.pop("PK_PGO_KERNELS", None)
+
+    def test_cxx_standard(self):
+        self.assertEqual(get_cxx_standard(str(self.path)), "17")
+
+        # other macros starting with KOKKOS_ENABLE_CXX are not the standard
+        other: Path = self.path / "other"
+        os.makedirs(other)
+        with open(other / "KokkosCore_config.h", "w") as f:
+            f.write("#define KOKKOS_ENABLE_CXX11_DISPATCH_LAMBDA\n#define KOKKOS_ENABLE_CXX20\n")
+        self.assertEqual(get_cxx_standard(str(other)), "20")
+
+    def test_flags(self):
+        driver = BuildDriver(self.args, "pk_pch.hpp")
+
+        compile_flags = driver.get_compile_flags()
+        self.assertIn("-std=c++17", compile_flags)
+        self.assertIn("-Dpk_exec_space=Kokkos::OpenMP", compile_flags)
+        self.assertIn(f"-I{self.args['pch_dir']}", compile_flags)
+
+        link_flags = driver.get_link_flags("bindings.cpp.o")
+        self.assertIn(f"-Wl,-rpath,{self.args['lib_path']}", link_flags)
+        self.assertIn(f"{self.args['lib_path']}/libkokkoscore.so", link_flags)
+
+    def test_pgo_flags(self):
+        driver = BuildDriver({**self.args, "pgo": "generate"}, "pk_pch.hpp")
+        self.assertIn("-fprofile-generate", driver.get_compile_flags())
+        self.assertIn("-fprofile-generate", driver.get_link_flags("bindings.cpp.o"))
+
+        driver = BuildDriver({**self.args, "pgo": "generate", "profile_output_dir": "/cache/OpenMP"}, "pk_pch.hpp")
+        self.assertIn("-fprofile-generate=/cache/OpenMP", driver.get_compile_flags())
+
+        driver = BuildDriver({**self.args, "pgo": "use"}, "pk_pch.hpp")
+        self.assertIn("-fprofile-use", driver.get_compile_flags())
+        self.assertNotIn("-fprofile-generate", driver.get_link_flags("bindings.cpp.o"))
+
+        driver = BuildDriver(self.args, "pk_pch.hpp")
+        self.assertFalse(any(f.startswith("-fprofile") for f in driver.get_compile_flags()))
+
+    def test_copy_profiles(self):
+        profile_dir: Path = self.path / "generate"
+        output_dir: Path = self.path / "use"
+        os.makedirs(profile_dir)
+        os.makedirs(output_dir)
+        with open(profile_dir / "bindings.cpp.gcda", "wb") as f:
+            f.write(b"profile")
+
+        BuildDriver(self.args, "pk_pch.hpp").copy_profiles(profile_dir, output_dir)
+        with open(output_dir / "bindings.cpp.gcda", "rb") as f:
+            self.assertEqual(f.read(), b"profile")
+
+        # written by a module that was built in another directory
+        os.remove(profile_dir / "bindings.cpp.gcda")
+        with open(profile_dir / "#tmp#.OpenMP.1.2#bindings.cpp.gcda", "wb") as f:
+            f.write(b"moved")
+
+        BuildDriver(self.args, "pk_pch.hpp").copy_profiles(profile_dir, output_dir)
+        with open(output_dir / "bindings.cpp.gcda", "rb") as f:
+            self.assertEqual(f.read(), b"moved")
+
+    def test_publish_directory(self):
+        build_dir: Path = self.path / ".OpenMP.1.2"
+        output_dir: Path = self.path / "OpenMP"
+        os.makedirs(build_dir)
+        os.makedirs(output_dir)
+        (build_dir / "kernel.so").write_bytes(b"new")
+        (output_dir / "bindings.cpp.o").write_bytes(b"partial")
+        (output_dir / "bindings.cpp.gcda").write_bytes(b"profile")
+
+        CppSetup("kernel.so", []).publish_directory(build_dir, output_dir)
+
+        self.assertFalse(build_dir.exists())
+        self.assertEqual((output_dir / "kernel.so").read_bytes(), b"new")
+        self.assertEqual((output_dir / "bindings.cpp.gcda").read_bytes(), b"profile")
+        self.assertFalse((output_dir / "bindings.cpp.o").exists())
+
+    def test_failed_build_is_removed(self):
+        output_dir: Path = self.path / "abc" / "OpenMP"
+        os.makedirs(output_dir.parent)
+        cpp_setup = CppSetup("kernel.so", [])
+        error = CompilationError(output_dir, ["g++"], 1, "error")
+
+        with mock.patch.object(cpp_setup, "invoke_compiler", side_effect=error):
+            with self.assertRaises(CompilationError):
+                cpp_setup.compile(output_dir, [], "functor.hpp", [], "functor_cast.hpp", [], "bindings.cpp",
+                                  ExecutionSpace.OpenMP, False, "g++")
+
+        # only the shared functor headers are left
+        self.assertEqual([p for p in output_dir.parent.iterdir() if p.is_dir()], [])
+
+    def test_pch_hash(self):
+        cpp_setup = CppSetup("kernel.so", [])
+        (self.path / "Kokkos_Core.hpp").write_text("// Kokkos 4.1\n")
+        pch_hash: str = cpp_setup.get_pch_hash(self.path)
+        self.assertEqual(pch_hash, cpp_setup.get_pch_hash(self.path))
+
+        # editing one of the headers, which is hashed once per process
+        (self.path / "Kokkos_Core.hpp").write_text("// Kokkos 4.2\n")
+        self.assertEqual(pch_hash, cpp_setup.get_pch_hash(self.path))
+        get_header_hash.cache_clear()
+        edited_hash: str = cpp_setup.get_pch_hash(self.path)
+        self.assertNotEqual(pch_hash, edited_hash)
+
+        # changing the set of headers
+        cpp_setup.pch_headers.append("vector")
+        self.assertNotEqual(edited_hash, cpp_setup.get_pch_hash(self.path))
+
+    def test_pgo_mode(self):
+        self.assertIsNone(get_pgo_mode(["kernel"]))
+
+        os.environ["PK_PGO"] = "generate"
+        self.assertEqual(get_pgo_mode(["kernel"]), "generate")
+
+        os.environ["PK_PGO_KERNELS"] = "force, neighbor"
+        self.assertEqual(get_pgo_mode(["neighbor"]), "generate")
+        self.assertIsNone(get_pgo_mode(["kernel"]))
+
+        os.environ["PK_PGO"] = "sometimes"
+        with self.assertRaises(ValueError):
+            get_pgo_mode(["neighbor"])
+
+    def test_compilation_error(self):
+        with open(self.path / "bindings.cpp", "w") as f:
+            f.write("this is not C++\n")
+
+        driver = BuildDriver(self.args, "pk_pch.hpp")
+        with self.assertRaises(CompilationError) as context:
+            driver.build(self.path)
+
+        error = context.exception
+        self.assertEqual(error.output_dir, self.path)
+        self.assertNotEqual(error.returncode, 0)
+        self.assertTrue(len(error.diagnostics) > 0)
+        self.assertFalse(os.path.exists(self.path / "kernel.so"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+
+import pykokkos as pk
+from pykokkos.interface.memory_pool import memory_pool
+
+
+@pk.workunit
+def capture_add(i: int, view: pk.View1D[pk.double], value: float):
+    view[i] += value
+
+
+@pk.workunit
+def capture_scale(i: int, view: pk.View1D[pk.double], factor: float):
+    view[i] *= factor
+
+
+@pk.workunit
+def capture_sum(i: int, acc: pk.Acc[pk.double], view: pk.View1D[pk.double]):
+    acc += view[i]
+
+
+class TestCapture(unittest.TestCase):
+    def setUp(self):
+        self.threads: int = 10
+        self.view: pk.View1D[pk.double] = pk.View([self.threads], pk.double)
+
+    def check(self, expected: float) -> None:
+        for i in range(self.threads):
+            self.assertEqual(self.view[i], expected)
+
+    def test_replay(self):
+        with pk.capture() as g:
+            pk.parallel_for(self.threads, capture_add, view=self.view, value=1.0)
+            pk.parallel_for(self.threads, capture_scale, view=self.view, factor=2.0)
+            pk.parallel_reduce(self.threads, capture_sum, view=self.view)
+
+        self.assertEqual(len(g), 3)
+        # the kernels run while being captured
+        self.check(2.0)
+
+        results = g.replay()
+        self.check(6.0)
+        self.assertEqual(results, [None, None, 6.0 * self.threads])
+
+    def test_scalar_update(self):
+        with pk.capture() as g:
+            pk.parallel_for(self.threads, capture_add, view=self.view, value=1.0)
+            pk.parallel_for(self.threads, capture_scale, view=self.view, factor=2.0)
+
+        g.replay(value=0.5, factor=3.0)
+        self.check(7.5)
+
+        # the updated values are kept for later replays
+        g.replay()
+        self.check(24.0)
+
+        with self.assertRaises(ValueError):
+            g.replay(view=1.0)
+
+    def test_deleted_view(self):
+        previous_limit: int = memory_pool.max_bytes
+        memory_pool.set_limit(0)
+        memory_pool.set_limit(1 << 20)
+        try:
+            view: pk.View1D[pk.double] = pk.View([self.threads], pk.double)
+            with pk.capture() as g:
+                pk.parallel_for(self.threads, capture_add, view=view, value=1.0)
+
+            releases: int = pk.memory_pool_stats()["releases"]
+            del view
+            # the graph still uses the memory, so it is not pooled
+            self.assertEqual(pk.memory_pool_stats()["releases"], releases)
+
+            other: pk.View1D[pk.double] = pk.View([self.threads], pk.double)
+            g.replay()
+            for i in range(self.threads):
+                self.assertEqual(other[i], 0.0)
+        finally:
+            memory_pool.set_limit(previous_limit)
+
+    def test_nested(self):
+        with pk.capture():
+            with self.assertRaises(RuntimeError):
+                with pk.capture():
+                    pass
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+from unittest import mock
+
+import pykokkos as pk
+
+
+@pk.workunit
+def dispatch_cache_init(i, view, init):
+    view[i] = init
+
+
+@pk.workunit
+def dispatch_cache_sum(i: int, acc: pk.Acc[pk.double], view: pk.View1D[pk.double]):
+    acc += view[i]
+
+
+class TestDispatchCache(unittest.TestCase):
+    def setUp(self):
+        self.threads: int = 10
+        self.runtime = pk.runtime_singleton.runtime
+        self.int_view: pk.View1D[pk.int32] = pk.View([self.threads], pk.int32)
+        self.double_view: pk.View1D[pk.double] = pk.View([self.threads], pk.double)
+
+    def get_plans(self, workunit) -> list:
+        return [p for k, p in self.runtime.dispatch_cache.items() if k[0] is workunit]
+
+    def test_repeat_dispatch(self):
+        if self.runtime.get_dispatch_key(pk.RangePolicy(pk.ExecutionSpace.Default, 0, 1), dispatch_cache_init, "for", {}) is None:
+            self.skipTest("dispatches are not cached in this configuration")
+
+        for init in range(3):
+            pk.parallel_for(self.threads, dispatch_cache_init, view=self.int_view, init=init)
+            for i in range(self.threads):
+                self.assertEqual(self.int_view[i], init)
+        self.assertEqual(len(self.get_plans(dispatch_cache_init)), 1)
+
+        # a different dtype is a different plan
+        pk.parallel_for(self.threads, dispatch_cache_init, view=self.double_view, init=2.5)
+        for i in range(self.threads):
+            self.assertEqual(self.double_view[i], 2.5)
+        self.assertEqual(len(self.get_plans(dispatch_cache_init)), 2)
+
+        for _ in range(2):
+            result = pk.parallel_reduce(self.threads, dispatch_cache_sum, view=self.double_view)
+            self.assertEqual(result, 2.5 * self.threads)
+        self.assertEqual(len(self.get_plans(dispatch_cache_sum)), 1)
+
+    def test_key(self):
+        policy = pk.RangePolicy(pk.ExecutionSpace.Default, 0, self.threads)
+        key = self.runtime.get_dispatch_key(policy, dispatch_cache_init, "for", {"view": self.int_view, "init": 1})
+        if key is None:
+            self.skipTest("dispatches are not cached in this configuration")
+
+        self.assertEqual(key, self.runtime.get_dispatch_key(policy, dispatch_cache_init, "for", {"view": self.int_view, "init": 2}))
+        self.assertNotEqual(key, self.runtime.get_dispatch_key(policy, dispatch_cache_init, "for", {"view": self.int_view, "init": 2**40}))
+        self.assertNotEqual(key, self.runtime.get_dispatch_key(policy, dispatch_cache_init, "reduce", {"view": self.int_view, "init": 1}))
+        self.assertIsNone(self.runtime.get_dispatch_key(policy, [dispatch_cache_init, dispatch_cache_sum], "for", {}))
+
+    def test_hit_does_not_stat(self):
+        pk.parallel_for(self.threads, dispatch_cache_init, view=self.int_view, init=1)
+        if len(self.get_plans(dispatch_cache_init)) == 0:
+            self.skipTest("dispatches are not cached in this configuration")
+
+        with mock.patch("os.stat", side_effect=AssertionError("os.stat called on a dispatch cache hit")):
+            pk.parallel_for(self.threads, dispatch_cache_init, view=self.int_view, init=3)
+        for i in range(self.threads):
+            self.assertEqual(self.int_view[i], 3)
+
+    def test_invalidated_source(self):
+        pk.parallel_for(self.threads, dispatch_cache_init, view=self.int_view, init=1)
+        plans = self.get_plans(dispatch_cache_init)
+        if len(plans) == 0:
+            self.skipTest("dispatches are not cached in this configuration")
+
+        # as if the file was edited after the plan was made
+        self.runtime.invalidate_source(plans[0].path)
+        self.assertEqual(self.get_plans(dispatch_cache_init), [])
+
+        pk.parallel_for(self.threads, dispatch_cache_init, view=self.int_view, init=5)
+        for i in range(self.threads):
+            self.assertEqual(self.int_view[i], 5)
+        self.assertEqual(len(self.get_plans(dispatch_cache_init)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+
+import pykokkos as pk
+
+
+@pk.workunit
+def dynamic_select(i: int, values: pk.View1D[pk.double], out: pk.View1D[pk.double], count: pk.View1D[pk.int64]):
+    if values[i] > 0:
+        idx: int = pk.atomic_fetch_add(count, [0], 1)
+        if idx < out.extent(0):
+            out[idx] = values[i]
+
+
+class TestDynamicView(unittest.TestCase):
+    def setUp(self):
+        self.threads: int = 100
+        self.values: pk.View1D[pk.double] = pk.View([self.threads], pk.double)
+        for i in range(self.threads):
+            self.values[i] = i % 2
+
+    def test_append(self):
+        dynamic = pk.DynamicView(0, pk.double)
+        capacities = set()
+        for i in range(self.threads):
+            dynamic.append(float(i))
+            capacities.add(dynamic.capacity)
+
+        self.assertEqual(len(dynamic), self.threads)
+        self.assertEqual(dynamic.shape, (self.threads,))
+        # the capacity doubles, so the storage was only reallocated a few times
+        self.assertLessEqual(len(capacities), 8)
+        for i in range(self.threads):
+            self.assertEqual(dynamic[i], float(i))
+
+    def test_resize(self):
+        dynamic = pk.DynamicView([4, 3], pk.int32, capacity=8)
+        dynamic.extend([[1, 2, 3]])
+        self.assertEqual(dynamic.shape, (5, 3))
+        self.assertEqual(dynamic.capacity, 8)
+
+        dynamic.resize(2)
+        dynamic.resize(6)
+        # the elements past the old size are zero again
+        self.assertEqual(dynamic.shape, (6, 3))
+        self.assertEqual(int(dynamic.data[4:].sum()), 0)
+
+    def test_kernel_append(self):
+        dynamic = pk.DynamicView(0, pk.double, capacity=10)
+
+        runs: int = 0
+        start: int = len(dynamic)
+        while True:
+            runs += 1
+            pk.parallel_for(self.threads, dynamic_select, values=self.values, out=dynamic.storage, count=dynamic.counter)
+            if dynamic.commit(start):
+                break
+
+        self.assertEqual(runs, 2)
+        self.assertEqual(len(dynamic), self.threads // 2)
+        self.assertEqual(float(dynamic.data.sum()), self.threads / 2)
+        self.assertEqual(dynamic.view().shape, (self.threads // 2,))
+
+
+if __name__ == "__main__":
+    unittest.main()
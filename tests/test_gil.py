@@ -0,0 +1,71 @@
+import threading
+import time
+from typing import List
+import unittest
+
+import pykokkos as pk
+
+
+@pk.workunit
+def gil_busy(i: int, view: pk.View1D[pk.double], iterations: int):
+    for j in range(iterations):
+        view[i] = view[i] * 0.5 + 1.0
+
+
+class TestGIL(unittest.TestCase):
+    def setUp(self):
+        self.threads: int = 4
+        self.view: pk.View1D[pk.double] = pk.View([self.threads], pk.double)
+
+        if pk.runtime_singleton.runtime.is_debug(pk.ExecutionSpace.Default):
+            self.skipTest("workunits run in Python in the Debug space")
+
+    def get_iterations(self, target: float) -> int:
+        """
+        Find the number of iterations of gil_busy that runs for about
+        the target duration on this machine
+
+        :param target: the duration in seconds
+        :returns: the number of iterations
+        """
+
+        iterations: int = 1_000_000
+        while True:
+            start: float = time.perf_counter()
+            pk.parallel_for(self.threads, gil_busy, view=self.view, iterations=iterations)
+            elapsed: float = time.perf_counter() - start
+            if elapsed >= target / 10:
+                return max(iterations, int(iterations * target / elapsed))
+
+            iterations *= 10
+
+    def test_overlap(self):
+        # compile before timing
+        pk.parallel_for(self.threads, gil_busy, view=self.view, iterations=1)
+        iterations: int = self.get_iterations(0.5)
+
+        duration: List[float] = []
+
+        def run_kernel():
+            start: float = time.perf_counter()
+            pk.parallel_for(self.threads, gil_busy, view=self.view, iterations=iterations)
+            duration.append(time.perf_counter() - start)
+
+        thread = threading.Thread(target=run_kernel)
+        last: float = time.perf_counter()
+        longest_gap: float = 0.0
+        thread.start()
+        while thread.is_alive():
+            now: float = time.perf_counter()
+            longest_gap = max(longest_gap, now - last)
+            last = now
+        thread.join()
+
+        # This thread keeps running while the kernel does, so it never
+        # goes as long as the kernel without getting a tick in
+        self.assertGreater(duration[0], 0.1)
+        self.assertLess(longest_gap, duration[0] / 2)
+        self.assertEqual(self.view[0], 2.0)
+
+if __name__ == "__main__":
+    unittest.main()
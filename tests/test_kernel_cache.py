@@ -0,0 +1,211 @@
+import copy
+import importlib.util
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pykokkos as pk
+from pykokkos.core.compiler import Compiler
+from pykokkos.core.kernel_cache import KernelCache
+from pykokkos.core.module_setup import ModuleSetup
+
+
+@pk.workunit
+def kernel_cache_init(i: int, view: pk.View1D[pk.int32]):
+    view[i] = i
+
+
+class TestKernelCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = KernelCache()
+        self.sources = [["struct functor {};"], ["#include <functor.hpp>"], [f"PYBIND11_MODULE({self.cache.module_placeholder}, k) {{}}"]]
+        self.config = {"compiler": "g++", "space": "OpenMP"}
+
+    def test_key_is_deterministic(self):
+        self.assertEqual(self.cache.get_key(self.sources, self.config),
+                         self.cache.get_key(self.sources, dict(reversed(list(self.config.items())))))
+
+    def test_key_depends_on_source_and_config(self):
+        key: str = self.cache.get_key(self.sources, self.config)
+        self.assertNotEqual(key, self.cache.get_key(self.sources[:2] + [["other"]], self.config))
+        self.assertNotEqual(key, self.cache.get_key(self.sources, {**self.config, "compiler": "nvcc"}))
+
+    def test_pch_dir_depends_on_config(self):
+        pch_dir: Path = self.cache.get_pch_dir(self.config)
+        self.assertEqual(pch_dir.parent, self.cache.get_root() / "pch")
+        self.assertEqual(pch_dir, self.cache.get_pch_dir(dict(self.config)))
+        self.assertNotEqual(pch_dir, self.cache.get_pch_dir({**self.config, "compiler": "nvcc"}))
+
+    def test_root_from_environment(self):
+        previous = os.environ.get(self.cache.cache_dir_env)
+        with tempfile.TemporaryDirectory() as root:
+            os.environ[self.cache.cache_dir_env] = root
+            try:
+                self.assertEqual(self.cache.get_root(), Path(root))
+                self.assertEqual(self.cache.get_output_dir("abc", pk.ExecutionSpace.OpenMP), Path(root) / "abc" / "OpenMP")
+                self.assertFalse(self.cache.contains("abc", pk.ExecutionSpace.OpenMP, "kernel.so"))
+            finally:
+                if previous is None:
+                    del os.environ[self.cache.cache_dir_env]
+                else:
+                    os.environ[self.cache.cache_dir_env] = previous
+
+    def test_lock(self):
+        try:
+            import fcntl
+        except ImportError:
+            self.skipTest("file locks require fcntl")
+
+        previous = os.environ.get(self.cache.cache_dir_env)
+        with tempfile.TemporaryDirectory() as root:
+            os.environ[self.cache.cache_dir_env] = root
+            try:
+                lock_file: Path = Path(root) / "abc" / ".OpenMP.lock"
+                with self.cache.lock("abc", pk.ExecutionSpace.OpenMP):
+                    # held against any other open file, as in another process
+                    with open(lock_file, "a") as f:
+                        with self.assertRaises(BlockingIOError):
+                            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+                with open(lock_file, "a") as f:
+                    fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            finally:
+                if previous is None:
+                    del os.environ[self.cache.cache_dir_env]
+                else:
+                    os.environ[self.cache.cache_dir_env] = previous
+
+    def test_stale_builds_are_removed(self):
+        if not hasattr(os, "kill") or sys.platform == "win32":
+            self.skipTest("checking for live processes requires POSIX")
+
+        dead = subprocess.Popen([sys.executable, "-c", "pass"])
+        dead.wait()
+
+        with tempfile.TemporaryDirectory() as root:
+            output_dir: Path = Path(root) / "abc" / "OpenMP"
+            stale: Path = output_dir.parent / f".OpenMP.{dead.pid}.1"
+            live: Path = output_dir.parent / f".OpenMP.{os.getppid()}.1"
+            own: Path = output_dir.parent / f".OpenMP.{os.getpid()}.1"
+            for build_dir in (stale, live, own):
+                os.makedirs(build_dir)
+
+            self.cache.remove_stale_builds(output_dir)
+            self.assertFalse(stale.exists())
+            self.assertTrue(live.exists())
+            self.assertTrue(own.exists())
+
+    def test_dispatch_uses_cache(self):
+        view: pk.View1D[pk.int32] = pk.View([10], pk.int32)
+        pk.parallel_for(10, kernel_cache_init, view=view)
+        for i in range(10):
+            self.assertEqual(view[i], i)
+
+        if pk.ExecutionSpace.Default is not pk.ExecutionSpace.Debug:
+            module_setups = pk.runtime_singleton.runtime.module_setups.values()
+            paths = [Path(m.path) for m in module_setups if m.metadata[0].name == "kernel_cache_init"]
+            self.assertTrue(len(paths) > 0)
+            for path in paths:
+                self.assertTrue(path.is_relative_to(self.cache.get_root()))
+                self.assertTrue(path.is_file())
+
+    def test_members_are_reused(self):
+        view: pk.View1D[pk.int32] = pk.View([10], pk.int32)
+        pk.parallel_for(10, kernel_cache_init, view=view)
+        if pk.ExecutionSpace.Default is pk.ExecutionSpace.Debug:
+            self.skipTest("nothing is compiled for the Debug space")
+
+        runtime = pk.runtime_singleton.runtime
+        runtime.compiler.wait_for_all_builds()
+        module_setups = [m for m in runtime.module_setups.values() if m.metadata[0].name == "kernel_cache_init"]
+        self.assertTrue(len(module_setups) > 0)
+
+        for module_setup in module_setups:
+            # a new compiler behaves like a new process
+            fresh = copy.copy(module_setup)
+            fresh.linked = False
+            compiler = Compiler()
+            members = compiler.compile_object(fresh, fresh.space, False, None, None, fresh.types_signature, set())
+
+            self.assertEqual(compiler.parser_cache, {})
+            self.assertTrue(fresh.linked)
+            self.assertEqual(fresh.path, module_setup.path)
+            self.assertEqual(set(members.views), set(runtime.compiler.members[compiler.members_hash(
+                fresh.metadata[0].path, fresh.metadata[0].name, fresh.types_signature)].views))
+
+    def test_warm_dispatch_skips_parsing(self):
+        if pk.ExecutionSpace.Default is pk.ExecutionSpace.Debug:
+            self.skipTest("nothing is compiled for the Debug space")
+
+        view: pk.View1D[pk.int32] = pk.View([10], pk.int32)
+        pk.parallel_for(10, kernel_cache_init, view=view)
+        runtime = pk.runtime_singleton.runtime
+        runtime.compiler.wait_for_all_builds()
+
+        # a new compiler and no dispatch state behave like a new process
+        previous = (runtime.compiler, runtime.module_setups, runtime.dispatch_cache)
+        runtime.compiler, runtime.module_setups, runtime.dispatch_cache = Compiler(), {}, {}
+        try:
+            view.fill(0)
+            with mock.patch("ast.parse", side_effect=AssertionError("ast.parse called on a warm dispatch")):
+                pk.parallel_for(10, kernel_cache_init, view=view)
+        finally:
+            runtime.compiler, runtime.module_setups, runtime.dispatch_cache = previous
+
+        for i in range(10):
+            self.assertEqual(view[i], i)
+
+
+class TestStaleness(unittest.TestCase):
+    source: str = textwrap.dedent("""
+        import pykokkos as pk
+
+        @pk.function
+        def helper(x: int) -> int:
+            return x + {helper}
+
+        @pk.workunit
+        def first(i: int, view: pk.View1D[pk.int32]):
+            view[i] = {first}
+
+        @pk.workunit
+        def second(i: int, view: pk.View1D[pk.int32]):
+            view[i] = {second}
+    """)
+
+    def fingerprints(self, **values) -> dict:
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "staleness_kernels.py")
+            with open(path, "w") as f:
+                f.write(self.source.format(**values))
+
+            spec = importlib.util.spec_from_file_location("staleness_kernels", path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+
+            compiler = Compiler()
+            return {name: compiler.get_fingerprint(ModuleSetup(getattr(module, name), pk.ExecutionSpace.Default, "sig"))
+                    for name in ("first", "second")}
+
+    def test_only_edited_workunit_is_stale(self):
+        original = self.fingerprints(helper=1, first=1, second=2)
+        self.assertEqual(original, self.fingerprints(helper=1, first=1, second=2))
+
+        edited = self.fingerprints(helper=1, first=3, second=2)
+        self.assertNotEqual(original["first"], edited["first"])
+        self.assertEqual(original["second"], edited["second"])
+
+    def test_edited_function_is_stale(self):
+        original = self.fingerprints(helper=1, first=1, second=2)
+        edited = self.fingerprints(helper=5, first=1, second=2)
+        self.assertNotEqual(original["first"], edited["first"])
+        self.assertNotEqual(original["second"], edited["second"])
+
+
+if __name__ == "__main__":
+    unittest.main()
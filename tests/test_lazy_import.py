@@ -0,0 +1,45 @@
+import subprocess
+import sys
+import unittest
+
+
+class TestLazyImport(unittest.TestCase):
+    def run_python(self, code: str) -> str:
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        return result.stdout.strip()
+
+    def test_import_is_lazy(self):
+        output = self.run_python(
+            "import sys\n"
+            "import pykokkos\n"
+            "import pykokkos.kokkos_manager as km\n"
+            "print('pykokkos.lib.ufuncs' in sys.modules, 'pykokkos.core' in sys.modules, km.CONSTANTS['IS_INITIALIZED'])\n"
+        )
+        self.assertEqual(output, "False False False")
+
+    def test_attributes_load_on_access(self):
+        output = self.run_python(
+            "import sys\n"
+            "import pykokkos as pk\n"
+            "from pykokkos import zeros\n"
+            "print(callable(pk.exp), callable(zeros), 'pykokkos.lib.ufuncs' in sys.modules, 'exp' in dir(pk))\n"
+        )
+        self.assertEqual(output, "True True True True")
+
+    def test_unknown_attribute(self):
+        import pykokkos as pk
+        with self.assertRaises(AttributeError):
+            pk.not_a_pykokkos_attribute
+
+    def test_kokkos_initialized_on_first_view(self):
+        output = self.run_python(
+            "import pykokkos as pk\n"
+            "import pykokkos.kokkos_manager as km\n"
+            "v = pk.View([10], pk.int32)\n"
+            "print(km.CONSTANTS['IS_INITIALIZED'])\n"
+        )
+        self.assertEqual(output, "True")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+
+import numpy as np
+
+import pykokkos as pk
+from pykokkos.interface.memory_pool import memory_pool
+
+
+class TestMemoryPool(unittest.TestCase):
+    def setUp(self):
+        self.threads: int = 10
+        self.previous_limit: int = memory_pool.max_bytes
+        # start from an empty pool
+        memory_pool.set_limit(0)
+        memory_pool.set_limit(1 << 20)
+
+    def tearDown(self):
+        memory_pool.set_limit(self.previous_limit)
+
+    def test_reuse(self):
+        view: pk.View1D[pk.double] = pk.View([self.threads], pk.double)
+        view.fill(1.0)
+        del view
+
+        before = pk.memory_pool_stats()
+        self.assertEqual(before["arrays"], 1)
+
+        view = pk.View([self.threads], pk.double)
+        after = pk.memory_pool_stats()
+        self.assertEqual(after["hits"], before["hits"] + 1)
+        self.assertEqual(after["arrays"], 0)
+        # a reused view is zeroed like a new one
+        for i in range(self.threads):
+            self.assertEqual(view[i], 0.0)
+
+        # a different dtype does not share the bin
+        other: pk.View1D[pk.int32] = pk.View([self.threads], pk.int32)
+        self.assertEqual(pk.memory_pool_stats()["misses"], after["misses"] + 1)
+
+    def test_empty(self):
+        view: pk.View1D[pk.double] = pk.View([self.threads], pk.double)
+        view.fill(1.0)
+        del view
+
+        hits: int = pk.memory_pool_stats()["hits"]
+        view = pk.empty(self.threads, dtype=pk.double)
+        self.assertEqual(pk.memory_pool_stats()["hits"], hits + 1)
+        # the reused array is not zeroed
+        for i in range(self.threads):
+            self.assertEqual(view[i], 1.0)
+
+        like = pk.empty_like(view)
+        self.assertEqual(like.shape, (self.threads,))
+        self.assertEqual(like.dtype, view.dtype)
+
+    def test_referenced_data(self):
+        view: pk.View1D[pk.double] = pk.View([self.threads], pk.double)
+        data = view.data[2:]
+        releases: int = pk.memory_pool_stats()["releases"]
+        del view
+
+        # the memory is still reachable through data, so it is not pooled
+        self.assertEqual(pk.memory_pool_stats()["releases"], releases)
+        data[:] = 1.0
+        self.assertEqual(data.sum(), self.threads - 2.0)
+
+    def test_exported_data(self):
+        exporters = {
+            "data": lambda view: view.data,
+            "array_interface": lambda view: np.asarray(view),
+            "dlpack": lambda view: np.from_dlpack(view),
+            "from_dlpack": lambda view: pk.from_dlpack(view),
+        }
+
+        for name, export in exporters.items():
+            with self.subTest(name):
+                view: pk.View1D[pk.double] = pk.View([self.threads], pk.double)
+                exported = export(view)
+                releases: int = pk.memory_pool_stats()["releases"]
+                del view
+
+                # the exported object outlives the view, so its memory
+                # must not be handed to the next view
+                self.assertEqual(pk.memory_pool_stats()["releases"], releases)
+                other: pk.View1D[pk.double] = pk.View([self.threads], pk.double)
+                other.fill(2.0)
+                for i in range(self.threads):
+                    self.assertEqual(exported[i], 0.0)
+
+    def test_limit(self):
+        memory_pool.set_limit(self.threads * 8)
+        evictions: int = pk.memory_pool_stats()["evictions"]
+
+        first: pk.View1D[pk.double] = pk.View([self.threads], pk.double)
+        second: pk.View1D[pk.double] = pk.View([self.threads], pk.double)
+        del first
+        del second
+
+        # the least recently freed array is deallocated
+        stats = pk.memory_pool_stats()
+        self.assertEqual(stats["arrays"], 1)
+        self.assertEqual(stats["bytes"], self.threads * 8)
+        self.assertEqual(stats["evictions"], evictions + 1)
+
+        memory_pool.set_limit(0)
+        self.assertEqual(pk.memory_pool_stats()["arrays"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
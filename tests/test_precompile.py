@@ -0,0 +1,84 @@
+from concurrent.futures import Future
+from pathlib import Path
+import unittest
+
+import pykokkos as pk
+
+
+@pk.workunit
+def precompile_init(i: int, view: pk.View1D[pk.int32], init: int):
+    view[i] = init
+
+
+@pk.workunit
+def precompile_scale(i: int, view: pk.View1D[pk.double], factor: float):
+    view[i] = view[i] * factor
+
+
+@pk.workunit
+def precompile_sum(i: int, acc: pk.Acc[pk.double], view: pk.View1D[pk.double]):
+    acc += view[i]
+
+
+@pk.workunit
+def precompile_inferred(i, view, init):
+    view[i] = init
+
+
+class TestPrecompile(unittest.TestCase):
+    def setUp(self):
+        self.threads: int = 10
+        self.int_view: pk.View1D[pk.int32] = pk.View([self.threads], pk.int32)
+        self.double_view: pk.View1D[pk.double] = pk.View([self.threads], pk.double)
+
+    def test_precompile_then_dispatch(self):
+        pk.precompile([
+            (precompile_init, self.threads, {"view": self.int_view, "init": 3}),
+            (precompile_scale, self.threads, {"view": self.double_view, "factor": 2.0}),
+            (precompile_sum, self.threads, {"view": self.double_view}, "reduce"),
+        ])
+
+        pk.parallel_for(self.threads, precompile_init, view=self.int_view, init=3)
+        for i in range(self.threads):
+            self.assertEqual(self.int_view[i], 3)
+
+        self.double_view.fill(1.0)
+        pk.parallel_for(self.threads, precompile_scale, view=self.double_view, factor=2.0)
+        result = pk.parallel_reduce(self.threads, precompile_sum, view=self.double_view)
+        self.assertEqual(result, 2.0 * self.threads)
+
+    def test_dispatch_waits_for_background_build(self):
+        policy = pk.RangePolicy(pk.ExecutionSpace.Default, 0, self.threads)
+        pk.precompile([(precompile_inferred, policy, {"view": self.int_view, "init": 5})], wait=False)
+
+        pk.parallel_for(policy, precompile_inferred, view=self.int_view, init=5)
+        for i in range(self.threads):
+            self.assertEqual(self.int_view[i], 5)
+
+    def test_failed_build_is_retried(self):
+        compiler = pk.runtime_singleton.runtime.compiler
+        output_dir = Path("precompile_failed_build")
+        build = Future()
+        build.set_exception(RuntimeError("compilation failed"))
+        compiler.pending_builds[output_dir] = build
+        compiler.is_compiled_cache[output_dir] = True
+
+        with self.assertRaises(RuntimeError):
+            compiler.wait_for_build(output_dir)
+
+        # the next dispatch builds the module again instead of raising
+        # the same error
+        self.assertNotIn(output_dir, compiler.pending_builds)
+        self.assertNotIn(output_dir, compiler.is_compiled_cache)
+        compiler.wait_for_build(output_dir)
+
+    def test_invalid_entry(self):
+        with self.assertRaises(ValueError):
+            pk.precompile([(precompile_init, self.threads)])
+
+        with self.assertRaises(ValueError):
+            pk.precompile([(precompile_init, self.threads, {}, "while")])
+
+
+if __name__ == "__main__":
+    unittest.main()
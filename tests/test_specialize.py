@@ -0,0 +1,100 @@
+import ast
+import os
+import unittest
+
+import pykokkos as pk
+from pykokkos.core.optimizations import get_specialized_values, specialize_workunit
+
+
+@pk.workunit(specialize=["cols"])
+def specialize_fill(i: int, view: pk.View2D[pk.int32], cols: int, offset: int):
+    for j in range(cols):
+        view[i][j] = i * cols + j + offset
+
+
+class TestSpecialize(unittest.TestCase):
+    def setUp(self):
+        self.threads: int = 4
+        self.cols: int = 3
+        self.view: pk.View2D[pk.int32] = pk.View([self.threads, self.cols], pk.int32)
+        self.runtime = pk.runtime_singleton.runtime
+
+    def tearDown(self):
+        os.environ.pop("PK_MAX_SPECIALIZATIONS", None)
+
+    def check(self, cols: int, offset: int) -> None:
+        for i in range(self.threads):
+            for j in range(cols):
+                self.assertEqual(self.view[i][j], i * cols + j + offset)
+
+    def test_values(self):
+        values, signature = get_specialized_values(["cols"], {"cols": 3, "offset": 1})
+        self.assertEqual(values, {"cols": 3})
+        self.assertEqual(signature, get_specialized_values(["cols"], {"cols": 3, "offset": 2})[1])
+        self.assertNotEqual(signature, get_specialized_values(["cols"], {"cols": 4})[1])
+
+        with self.assertRaises(ValueError):
+            get_specialized_values(["cols"], {"offset": 1})
+        with self.assertRaises(TypeError):
+            get_specialized_values(["cols"], {"cols": self.view})
+
+    def test_transform(self):
+        tree = ast.parse("def f(i, view, cols, offset):\n    view[i] = cols + offset\n").body[0]
+        specialized = specialize_workunit(tree, {"cols": 3})
+
+        self.assertEqual([a.arg for a in specialized.args.args], ["i", "view", "offset"])
+        self.assertEqual(ast.unparse(specialized.body[0]), "view[i] = 3 + offset")
+        # the original is left unchanged
+        self.assertEqual(len(tree.args.args), 4)
+
+        tree = ast.parse("def f(i, cols):\n    cols = cols + 1\n").body[0]
+        with self.assertRaises(ValueError):
+            specialize_workunit(tree, {"cols": 3})
+
+    def test_dispatch(self):
+        pk.parallel_for(self.threads, specialize_fill, view=self.view, cols=self.cols, offset=1)
+        self.check(self.cols, 1)
+
+        pk.parallel_for(self.threads, specialize_fill, view=self.view, cols=2, offset=5)
+        self.check(2, 5)
+
+    def test_max_specializations(self):
+        os.environ["PK_MAX_SPECIALIZATIONS"] = "1"
+        self.runtime.specializations.pop(specialize_fill, None)
+
+        values, _ = self.runtime.get_specialization(specialize_fill, {"cols": 3, "offset": 0})
+        self.assertEqual(values, {"cols": 3})
+
+        # over the cap, so the generic module is used
+        values, signature = self.runtime.get_specialization(specialize_fill, {"cols": 2, "offset": 0})
+        self.assertIsNone(values)
+        self.assertIsNone(signature)
+
+        pk.parallel_for(self.threads, specialize_fill, view=self.view, cols=2, offset=7)
+        self.check(2, 7)
+
+    def test_dispatch_cache_is_bounded(self):
+        os.environ["PK_MAX_SPECIALIZATIONS"] = "1"
+        self.runtime.specializations.pop(specialize_fill, None)
+        for key in [k for k in self.runtime.dispatch_cache if k[0] is specialize_fill]:
+            del self.runtime.dispatch_cache[key]
+
+        view: pk.View2D[pk.int32] = pk.View([self.threads, 8], pk.int32)
+        sizes = []
+        for cols in range(1, 8):
+            pk.parallel_for(self.threads, specialize_fill, view=view, cols=cols, offset=0)
+            sizes.append(len(self.runtime.dispatch_cache))
+
+        if sizes[0] == 0:
+            self.skipTest("dispatches are not cached in this configuration")
+
+        # one plan for the specialized value and one for the generic module
+        self.assertEqual(len(set(sizes[1:])), 1)
+        self.assertEqual(len([k for k in self.runtime.dispatch_cache if k[0] is specialize_fill]), 2)
+        for i in range(self.threads):
+            for j in range(7):
+                self.assertEqual(view[i][j], i * 7 + j)
+
+
+if __name__ == "__main__":
+    unittest.main()
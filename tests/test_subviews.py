@@ -0,0 +1,49 @@
+import unittest
+
+import pykokkos as pk
+
+
+@pk.workunit
+def subviews_fill(i: int, view: pk.View1D[pk.double], value: float):
+    view[i] = value
+
+
+class TestSubviews(unittest.TestCase):
+    def setUp(self):
+        self.threads: int = 10
+        self.view: pk.View1D[pk.double] = pk.View([self.threads], pk.double)
+
+    def test_lazy_array(self):
+        subview = self.view[2:6]
+        # nothing is created for Kokkos until the subview reaches a kernel
+        self.assertIsNone(subview._array)
+        self.assertFalse(hasattr(subview, "__dict__"))
+
+        pk.parallel_for(4, subviews_fill, view=subview, value=1.0)
+        self.assertIsNotNone(subview._array)
+        for i in range(self.threads):
+            self.assertEqual(self.view[i], 1.0 if 2 <= i < 6 else 0.0)
+
+    def test_strided(self):
+        subview = self.view[1:8:2]
+        self.assertEqual(subview.shape, (4,))
+        self.assertEqual(subview.parent_slice, [slice(1, 8, 2)])
+
+        # the subview shares the memory of the view
+        subview[0] = 3.0
+        self.assertEqual(self.view[1], 3.0)
+
+        reverse = self.view[::-1]
+        self.assertEqual(reverse.parent_slice, [slice(self.threads - 1, None, -1)])
+        self.assertEqual(reverse[self.threads - 2], 3.0)
+
+    def test_2d(self):
+        view: pk.View2D[pk.double] = pk.View([self.threads, self.threads], pk.double)
+        subview = view[3, 2:]
+        self.assertEqual(subview.shape, (self.threads - 2,))
+        self.assertEqual(subview.parent_slice, [3, slice(2, self.threads, 1)])
+        self.assertIs(subview[1:].base_view, view)
+
+
+if __name__ == "__main__":
+    unittest.main()
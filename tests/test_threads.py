@@ -0,0 +1,91 @@
+import concurrent.futures
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+
+import pykokkos as pk
+
+
+@pk.workunit
+def threads_init(i: int, view: pk.View1D[pk.int32], init: int):
+    view[i] = init
+
+
+@pk.workunit
+def threads_sum(i: int, acc: pk.Acc[pk.double], view: pk.View1D[pk.int32]):
+    acc += view[i]
+
+
+class TestThreads(unittest.TestCase):
+    def setUp(self):
+        self.threads: int = 10
+        self.workers: int = 8
+        self.runtime = pk.runtime_singleton.runtime
+
+    def dispatch(self, init: int) -> float:
+        view: pk.View1D[pk.int32] = pk.View([self.threads], pk.int32)
+        pk.parallel_for(self.threads, threads_init, view=view, init=init)
+
+        return pk.parallel_reduce(self.threads, threads_sum, view=view)
+
+    def test_compile_once(self):
+        compile_entity = self.runtime.compiler.compile_entity
+        compiled = []
+        count_lock = threading.Lock()
+
+        def counting_compile_entity(main, module_setup, *args, **kwargs):
+            with count_lock:
+                compiled.append(module_setup.output_dir)
+            return compile_entity(main, module_setup, *args, **kwargs)
+
+        self.runtime.compiler.compile_entity = counting_compile_entity
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers) as pool:
+                results = list(pool.map(self.dispatch, range(self.workers)))
+        finally:
+            del self.runtime.compiler.compile_entity
+
+        self.assertEqual(results, [float(i * self.threads) for i in range(self.workers)])
+        # each module is built by at most one thread
+        self.assertEqual(len(compiled), len(set(compiled)))
+
+    def test_concurrent_first_dispatch(self):
+        # Needs a fresh process, as this one has already created the
+        # runtime and initialized Kokkos
+        script: str = (
+            "import concurrent.futures\n"
+            "import threading\n"
+            "import pykokkos as pk\n"
+            "import pykokkos.kokkos_manager as km\n"
+            "\n"
+            "@pk.workunit\n"
+            "def first_init(i: int, view: pk.View1D[pk.int32], init: int):\n"
+            "    view[i] = init\n"
+            "\n"
+            f"barrier = threading.Barrier({self.workers})\n"
+            "\n"
+            "def dispatch(init: int):\n"
+            "    barrier.wait()\n"
+            "    runtime = pk.runtime_singleton.runtime\n"
+            "    view = pk.View([10], pk.int32)\n"
+            "    pk.parallel_for(10, first_init, view=view, init=init)\n"
+            "    return id(runtime), int(view[9])\n"
+            "\n"
+            f"with concurrent.futures.ThreadPoolExecutor(max_workers={self.workers}) as pool:\n"
+            f"    results = list(pool.map(dispatch, range({self.workers})))\n"
+            "print(len({r[0] for r in results}), [r[1] for r in results], km.CONSTANTS['IS_INITIALIZED'])\n"
+        )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "first_dispatch.py"
+            path.write_text(script)
+            result = subprocess.run([sys.executable, str(path)], capture_output=True, text=True, check=True, cwd=tmp)
+
+        self.assertEqual(result.stdout.strip().splitlines()[-1], f"1 {list(range(self.workers))} True")
+
+
+if __name__ == "__main__":
+    unittest.main()
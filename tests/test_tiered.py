@@ -0,0 +1,79 @@
+import os
+import unittest
+
+import pykokkos as pk
+
+
+@pk.workunit
+def tiered_init(i: int, view: pk.View1D[pk.int32], init: int):
+    view[i] = init
+
+
+@pk.workunit
+def tiered_sum(i: int, acc: pk.Acc[pk.double], view: pk.View1D[pk.double]):
+    acc += view[i]
+
+
+class TestTiered(unittest.TestCase):
+    def setUp(self):
+        self.threads: int = 10
+        self.runtime = pk.runtime_singleton.runtime
+        self.previous_policy = self.runtime.tiered_policy
+        self.int_view: pk.View1D[pk.int32] = pk.View([self.threads], pk.int32)
+        self.double_view: pk.View1D[pk.double] = pk.View([self.threads], pk.double)
+
+    def tearDown(self):
+        self.runtime.tiered_policy = self.previous_policy
+        os.environ.pop("PK_TIERED", None)
+
+    def run_both(self, init: int) -> float:
+        pk.parallel_for(self.threads, tiered_init, view=self.int_view, init=init)
+        self.double_view.fill(float(init))
+        return pk.parallel_reduce(self.threads, tiered_sum, view=self.double_view)
+
+    def test_fallback_then_native(self):
+        if self.runtime.is_debug(pk.ExecutionSpace.Default):
+            self.skipTest("tiered execution does not apply to the Debug space")
+
+        self.runtime.tiered_policy = "fallback"
+
+        before = pk.tier_counts()
+        result = self.run_both(3)
+        for i in range(self.threads):
+            self.assertEqual(self.int_view[i], 3)
+        self.assertEqual(result, 3.0 * self.threads)
+
+        after = pk.tier_counts()
+        self.assertEqual(sum(after.values()) - sum(before.values()), 2)
+
+        self.runtime.compiler.wait_for_all_builds()
+        result = self.run_both(4)
+        self.assertEqual(result, 4.0 * self.threads)
+        self.assertEqual(pk.tier_counts()["native"] - after["native"], 2)
+
+    def test_threshold(self):
+        policy = pk.RangePolicy(pk.ExecutionSpace.OpenMP, 0, self.threads)
+
+        self.runtime.tiered_policy = self.threads + 1
+        self.assertTrue(self.runtime.use_fallback(policy, tiered_init))
+
+        self.runtime.tiered_policy = self.threads
+        self.assertFalse(self.runtime.use_fallback(policy, tiered_init))
+
+        self.runtime.tiered_policy = "wait"
+        self.assertFalse(self.runtime.use_fallback(policy, tiered_init))
+
+    def test_policy_from_environment(self):
+        os.environ["PK_TIERED"] = "100"
+        self.assertEqual(self.runtime.get_tiered_policy(), 100)
+
+        os.environ["PK_TIERED"] = "fallback"
+        self.assertEqual(self.runtime.get_tiered_policy(), "fallback")
+
+        os.environ["PK_TIERED"] = "sometimes"
+        with self.assertRaises(ValueError):
+            self.runtime.get_tiered_policy()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -768,3 +768,62 @@ def test_rounding_dtype_preservation(input_dtype, pk_ufunc, shape):
     view = pk.View(shape, input_dtype)
     actual_dtype = pk_ufunc(view).dtype
     assert actual_dtype.value == input_dtype.value
+
+
+@pytest.mark.parametrize("pk_ufunc, numpy_ufunc", [
+        (pk.add, np.add),
+        (pk.multiply, np.multiply),
+        (pk.subtract, np.subtract),
+])
+@pytest.mark.parametrize("pk_dtype, numpy_dtype", [
+        (pk.double, np.float64),
+        (pk.float, np.float32),
+])
+def test_binary_ufuncs_out(pk_ufunc, numpy_ufunc, pk_dtype, numpy_dtype):
+    rng = default_rng(123)
+    np1 = rng.random(10).astype(numpy_dtype)
+    np2 = rng.random(10).astype(numpy_dtype)
+    expected = numpy_ufunc(np1, np2)
+
+    view1 = pk.array(np1)
+    view2 = pk.array(np2)
+    out = pk.View([10], pk_dtype)
+    actual = pk_ufunc(view1, view2, out=out)
+    assert actual is out
+    assert_allclose(out, expected, rtol=1e-6)
+
+    # in place
+    pk_ufunc(view1, view2, out=view1)
+    assert_allclose(view1, expected, rtol=1e-6)
+
+
+@pytest.mark.parametrize("pk_ufunc, numpy_ufunc", [
+        (pk.exp, np.exp),
+        (pk.log, np.log),
+        (pk.sqrt, np.sqrt),
+        (pk.reciprocal, np.reciprocal),
+])
+def test_unary_ufuncs_out_where(pk_ufunc, numpy_ufunc):
+    arr = np.arange(1, 11, dtype=np.float64)
+    mask = arr > 5
+    view = pk.array(arr)
+    out = pk.View([10], pk.double)
+    out[:] = -1.0
+
+    actual = pk_ufunc(view, out=out, where=pk.array(mask))
+    assert actual is out
+    assert_allclose(out, np.where(mask, numpy_ufunc(arr), -1.0))
+    # the input is left untouched
+    assert_allclose(view, arr)
+
+
+def test_ufunc_out_validation():
+    view = pk.View([10], pk.double)
+    with pytest.raises(ValueError):
+        pk.exp(view, out=pk.View([5], pk.double))
+    with pytest.raises(TypeError):
+        pk.exp(view, out=pk.View([10], pk.float))
+    with pytest.raises(TypeError):
+        pk.exp(view, out=np.zeros(10))
+    with pytest.raises(ValueError):
+        pk.exp(view, where=pk.View([5], pk.bool))
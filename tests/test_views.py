@@ -412,5 +412,115 @@ def test_result_type_unsupported(pk_dtype, pk_dtype2):
         pk.result_type(pk_dtype, pk_dtype2)
 
 
+@pk.workunit
+def memmap_scale(tid: int, view: pk.View1D[pk.double], factor: float) -> None:
+    view[tid] *= factor
+
+
+@pytest.mark.parametrize("suffix", [".npy", ".bin"])
+def test_memmap(tmp_path, suffix):
+    expected = np.arange(10, dtype=np.float64)
+    path = str(tmp_path / f"data{suffix}")
+    if suffix == ".npy":
+        np.save(path, expected)
+    else:
+        expected.tofile(path)
+
+    view = pk.memmap(path, dtype=pk.double, mode="r+")
+    assert view.shape == (10,)
+    assert_allclose(view, expected)
+
+    pk.parallel_for(10, memmap_scale, view=view, factor=2.0)
+    view.orig_array.flush()
+    del view
+
+    if suffix == ".npy":
+        saved = np.load(path)
+    else:
+        saved = np.fromfile(path, dtype=np.float64)
+    assert_allclose(saved, expected * 2.0)
+
+    # changes made in "r" mode are not saved
+    view = pk.memmap(path, dtype=pk.double)
+    pk.parallel_for(10, memmap_scale, view=view, factor=2.0)
+    assert_allclose(view, expected * 4.0)
+    del view
+    view = pk.memmap(path, dtype=pk.double)
+    assert_allclose(view, expected * 2.0)
+
+
+def test_dlpack_export():
+    view = pk.View([10], pk.double)
+    assert view.__dlpack_device__() == (1, 0)
+
+    # both protocols share the memory of the view
+    from_dlpack = np.from_dlpack(view)
+    from_interface = np.asarray(view)
+    from_dlpack[0] = 1.0
+    from_interface[1] = 2.0
+    assert view[0] == 1.0
+    assert view[1] == 2.0
+
+    # the capsule keeps the memory alive
+    del view
+    assert_equal(from_dlpack[:2], [1.0, 2.0])
+
+
+def test_dlpack_import():
+    arr = np.arange(10, dtype=np.float64)
+    view = pk.from_dlpack(arr)
+    assert view.shape == (10,)
+    arr[0] = 5.0
+    assert view[0] == 5.0
+
+    del arr
+    assert view[0] == 5.0
+    assert_equal(view, [5.0, *range(1, 10)])
+
+
+def test_dlpack_arguments():
+    view = pk.View([10], pk.double)
+    assert view.__dlpack__(max_version=(1, 0), dl_device=(1, 0), copy=False) is not None
+
+    with pytest.raises(BufferError):
+        view.__dlpack__(copy=True)
+    with pytest.raises(BufferError):
+        view.__dlpack__(dl_device=(2, 0))
+
+
+class DLPackOnly:
+    """
+    Exports an array through DLPack and nothing else, like a tensor
+    from another framework
+    """
+
+    def __init__(self, array):
+        self.array = array
+
+    def __dlpack__(self, **kwargs):
+        return self.array.__dlpack__(**kwargs)
+
+    def __dlpack_device__(self):
+        return self.array.__dlpack_device__()
+
+
+def test_dlpack_array_layout():
+    arr = np.arange(6, dtype=np.float64).reshape(2, 3)
+
+    shared = pk.array(DLPackOnly(arr))
+    arr[0, 0] = 7.0
+    assert shared[0, 0] == 7.0
+
+    # a different layout takes a copy
+    view = pk.array(DLPackOnly(arr), layout=pk.LayoutLeft)
+    assert view.layout is pk.LayoutLeft
+    assert_equal(view, arr)
+    arr[0, 1] = 8.0
+    assert view[0, 1] == 1.0
+
+    with pytest.raises(ValueError):
+        pk.array(DLPackOnly(arr), space=pk.CudaSpace)
+
+
 if __name__ == '__main__':
     unittest.main()